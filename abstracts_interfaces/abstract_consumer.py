@@ -1,13 +1,34 @@
 import queue
 import threading
+import time
 
 from abstracts_interfaces.process import Process
 from abstracts_interfaces.runnable import Runnable
+from bounded_channel import BoundedChannel
+
+# overflow policies, applied when an object is given while the buffer is full:
+# wait for space
+OVERFLOW_BLOCK = "block"
+# discard the object given
+OVERFLOW_DROP_NEWEST = "drop_newest"
+# discard the oldest object in the buffer
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+# discard every object in the buffer, even if it is not full
+OVERFLOW_KEEP_LATEST = "keep_latest"
+
+OVERFLOW_POLICIES = (OVERFLOW_BLOCK, OVERFLOW_DROP_NEWEST, OVERFLOW_DROP_OLDEST, OVERFLOW_KEEP_LATEST)
 
 
 class AbstractConsumer(Runnable):
     """
     Interface for a consumer
+
+    By default, giving an object blocks while the buffer is full. Another overflow policy may be set
+    to discard objects instead, so that producers never wait. A maximum age may also be set, so that
+    objects that waited in the buffer for too long are discarded before being processed.
+
+    Consumers may also process objects in batches: a batch is formed of up to batch_size objects,
+    waiting up to batch_wait for the buffer to fill it once the first object is available.
     """
 
     def __init__(self, buffer_size, process: Process) -> None:
@@ -18,17 +39,141 @@ class AbstractConsumer(Runnable):
         :param process: The process by which the objects are consumed
         """
         Runnable.__init__(self, process)
-        self._buffer = queue.Queue()
-        self._producer_semaphore = threading.Semaphore()
-        self._consumer_semaphore = threading.Semaphore(buffer_size)
+        self._buffer = BoundedChannel(buffer_size)
+        self._overflow_policy = OVERFLOW_BLOCK
+        self._max_age = None
+        self._counter_lock = threading.Lock()
+        self._dropped_count = 0
+        self._expired_count = 0
+        self._batch_size = 1
+        self._batch_wait = 0
 
     def give(self, obj):
         """
         Give an object for processing to this consumer.
 
-        May block if the buffer is full
+        May block if the buffer is full and the overflow policy is OVERFLOW_BLOCK
         :param obj: any
         """
-        self._consumer_semaphore.acquire()
-        self._buffer.put(obj)
-        self._producer_semaphore.release()
+        if self._metrics is not None:
+            self._metrics.record_in()
+        entry = (time.monotonic(), obj)
+        if self._overflow_policy == OVERFLOW_BLOCK:
+            self._buffer.put(entry)
+            return
+        if self._overflow_policy == OVERFLOW_DROP_NEWEST:
+            dropped = 0 if self._buffer.try_put(entry) else 1
+        elif self._overflow_policy == OVERFLOW_DROP_OLDEST:
+            dropped = self._buffer.force_put(entry)
+        else:
+            dropped = self._buffer.replace(entry)
+        if dropped != 0:
+            with self._counter_lock:
+                self._dropped_count += dropped
+
+    def set_overflow_policy(self, overflow_policy):
+        """
+        Set what happens when an object is given while the buffer is full.
+
+        :param overflow_policy: One of OVERFLOW_POLICIES
+        """
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow_policy}")
+        self._overflow_policy = overflow_policy
+
+    def set_max_age(self, max_age_ms):
+        """
+        Set the maximum time an object may wait in the buffer before being discarded unprocessed.
+
+        :param max_age_ms: In milliseconds. None to never discard objects
+        """
+        self._max_age = None if max_age_ms is None else max_age_ms / 1000
+
+    def set_batching(self, batch_size, batch_wait_ms=0):
+        """
+        Set how many objects are processed together, through Process.run_batch.
+
+        :param batch_size: The maximum number of objects in a batch. 1 to process objects one by one with Process.run
+        :param batch_wait_ms: The maximum time to wait for a batch to fill after its first object, in milliseconds
+        """
+        if self._running:
+            raise RuntimeError("Cannot change batching while running")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self._batch_size = batch_size
+        self._batch_wait = batch_wait_ms / 1000
+
+    def get_dropped_count(self):
+        """
+        Get the number of objects discarded by the overflow policy.
+
+        :return: an int
+        """
+        return self._dropped_count
+
+    def get_expired_count(self):
+        """
+        Get the number of objects discarded for exceeding the maximum age.
+
+        :return: an int
+        """
+        return self._expired_count
+
+    def _take(self):
+        """
+        Take the next object to process from the buffer, discarding the expired ones.
+
+        Blocks until an object is available.
+        :return: any
+        """
+        while True:
+            given_at, obj = self._get_entries(1)[0]
+            if self._is_fresh(given_at):
+                return obj
+            with self._counter_lock:
+                self._expired_count += 1
+
+    def _take_batch(self):
+        """
+        Take the next batch of objects to process from the buffer, discarding the expired ones.
+
+        Blocks until an object is available, then waits up to batch_wait for up to batch_size objects.
+        :return: A list of any, never empty
+        """
+        batch = []
+        deadline = None
+        while len(batch) < self._batch_size:
+            if len(batch) == 0:
+                entries = self._get_entries(self._batch_size)
+            else:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    entries = self._buffer.get_many(self._batch_size - len(batch), remaining)
+                except queue.Empty:
+                    break
+            if deadline is None:
+                deadline = time.monotonic() + self._batch_wait
+            fresh_objs = [obj for given_at, obj in entries if self._is_fresh(given_at)]
+            if len(fresh_objs) != len(entries):
+                with self._counter_lock:
+                    self._expired_count += len(entries) - len(fresh_objs)
+            batch.extend(fresh_objs)
+        return batch
+
+    def _get_entries(self, max_entries):
+        """
+        Get up to max_entries from the buffer, waiting for at least one.
+
+        Records the time waited and the depth left if metrics are enabled.
+        """
+        if self._metrics is None:
+            return self._buffer.get_many(max_entries)
+        start = time.perf_counter()
+        entries = self._buffer.get_many(max_entries)
+        self._metrics.record_starved(time.perf_counter() - start, len(self._buffer))
+        return entries
+
+    def _is_fresh(self, given_at):
+        return self._max_age is None or time.monotonic() - given_at <= self._max_age
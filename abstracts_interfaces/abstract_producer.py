@@ -1,3 +1,5 @@
+import time
+
 from abstracts_interfaces.abstract_consumer import AbstractConsumer
 from abstracts_interfaces.process import Process
 from abstracts_interfaces.runnable import Runnable
@@ -20,3 +22,14 @@ class AbstractProducer(Runnable):
             raise RuntimeError("Cannot change consumer while producing")
         self._consumer = consumer
 
+    def _give_to_consumer(self, obj):
+        """
+        Give an object to the consumer, recording the time blocked if metrics are enabled.
+        """
+        if self._metrics is None:
+            self._consumer.give(obj)
+            return
+        start = time.perf_counter()
+        self._consumer.give(obj)
+        self._metrics.record_blocked(time.perf_counter() - start)
+
@@ -13,3 +13,25 @@ class Process:
         :return: Any obj, including None
         """
         pass
+
+    def run_batch(self, items) -> list:
+        """
+        Run the process on each of the given objs.
+
+        Override to process the items together, e.g. vectorized.
+
+        :param items: A list of any
+        :return: A list with the result of each item, in order
+        """
+        return [self.run(item) for item in items]
+
+    def is_concurrent(self) -> bool:
+        """
+        Whether the process may run on several items at once, e.g. by several worker threads.
+
+        Override to return False if the process keeps state across consecutive items, since concurrent
+        runs would interleave the items.
+
+        :return: A bool
+        """
+        return True
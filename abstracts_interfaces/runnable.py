@@ -1,4 +1,7 @@
+import time
+
 from abstracts_interfaces.process import Process
+from stage_metrics import StageMetrics
 
 
 class Runnable:
@@ -6,6 +9,7 @@ class Runnable:
     def __init__(self, process: Process) -> None:
         self._process = process
         self._running = False
+        self._metrics = None
 
     def start(self):
         pass
@@ -20,3 +24,42 @@ class Runnable:
         if self._running:
             raise RuntimeError("Cannot change process while running")
         self._process = process
+
+    def enable_metrics(self, name=None):
+        """
+        Start recording the metrics of this stage.
+
+        :param name: The name of the stage in reports. Defaults to the class name of the process
+        :return: The StageMetrics
+        """
+        if self._metrics is None:
+            self._metrics = StageMetrics(name if name is not None else type(self._process).__name__)
+        return self._metrics
+
+    def get_metrics(self):
+        """
+        :return: The StageMetrics of this stage. None if metrics are not enabled
+        """
+        return self._metrics
+
+    def _run_process(self, item=None):
+        """
+        Run the process on an item, recording its duration if metrics are enabled.
+        """
+        if self._metrics is None:
+            return self._process.run(item)
+        start = time.perf_counter()
+        obj = self._process.run(item)
+        self._metrics.record_run(time.perf_counter() - start)
+        return obj
+
+    def _run_process_batch(self, items):
+        """
+        Run the process on a batch of items, recording its duration if metrics are enabled.
+        """
+        if self._metrics is None:
+            return self._process.run_batch(items)
+        start = time.perf_counter()
+        objs = self._process.run_batch(items)
+        self._metrics.record_run(time.perf_counter() - start, len(items))
+        return objs
@@ -0,0 +1,64 @@
+"""
+Compare the cost per item of handing items between two threads through a BoundedChannel and through
+the Queue and two Semaphores that AbstractConsumer used before.
+
+Usage: python -m benchmarks.bench_channel [item_count]
+"""
+import queue
+import sys
+import threading
+import time
+
+from bounded_channel import BoundedChannel
+
+DEFAULT_ITEM_COUNT = 200000
+BUFFER_SIZE = 10
+
+
+class SemaphoreQueue:
+    """
+    The hand-off of AbstractConsumer before BoundedChannel.
+    """
+
+    def __init__(self, buffer_size) -> None:
+        self.buffer = queue.Queue()
+        self.producer_semaphore = threading.Semaphore()
+        self.consumer_semaphore = threading.Semaphore(buffer_size)
+
+    def put(self, item):
+        self.consumer_semaphore.acquire()
+        self.buffer.put(item)
+        self.producer_semaphore.release()
+
+    def get(self):
+        self.producer_semaphore.acquire()
+        item = self.buffer.get()
+        self.consumer_semaphore.release()
+        return item
+
+
+def bench_hand_off(channel, item_count):
+    def consume():
+        for _ in range(item_count):
+            channel.get()
+
+    consumer = threading.Thread(target=consume)
+    start = time.perf_counter()
+    consumer.start()
+    for item in range(item_count):
+        channel.put(item)
+    consumer.join()
+    return (time.perf_counter() - start) / item_count
+
+
+def main():
+    item_count = int(sys.argv[1]) if 1 < len(sys.argv) else DEFAULT_ITEM_COUNT
+    semaphore_queue = bench_hand_off(SemaphoreQueue(BUFFER_SIZE), item_count)
+    bounded_channel = bench_hand_off(BoundedChannel(BUFFER_SIZE), item_count)
+    print(f"items: {item_count}")
+    print(f"Queue + Semaphores: {semaphore_queue * 1e9:.0f} ns/item")
+    print(f"BoundedChannel:     {bounded_channel * 1e9:.0f} ns/item")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+Compare the per-frame and the batched frequency extraction paths.
+
+Usage: python -m benchmarks.bench_frequency_extraction [frame_count]
+"""
+import sys
+import time
+
+import numpy as np
+
+from processes.frequency_extraction_process import FrequencyExtractionProcess
+from sound_sample import SoundSample
+
+SAMPLE_RATE = 5000
+DEFAULT_FRAME_COUNT = 1000
+
+
+def get_sound_samples(frame_count):
+    rng = np.random.default_rng(0)
+    time_space = np.arange(SAMPLE_RATE // 2) / SAMPLE_RATE
+    frequencies = rng.uniform(60, 1500, size=frame_count)
+    return [SoundSample(SAMPLE_RATE, 0.5, (2 ** 20 * np.sin(frequency * 2 * np.pi * time_space)).astype('int32'))
+            for frequency in frequencies]
+
+
+def bench_per_frame(extractor, sound_samples):
+    start = time.perf_counter()
+    for sound_sample in sound_samples:
+        extractor.run(sound_sample)
+    return time.perf_counter() - start
+
+
+def bench_batch(extractor, sound_samples):
+    start = time.perf_counter()
+    extractor.run_batch(sound_samples)
+    return time.perf_counter() - start
+
+
+def main():
+    frame_count = int(sys.argv[1]) if 1 < len(sys.argv) else DEFAULT_FRAME_COUNT
+    sound_samples = get_sound_samples(frame_count)
+    extractor = FrequencyExtractionProcess()
+    per_frame = bench_per_frame(extractor, sound_samples)
+    batch = bench_batch(extractor, sound_samples)
+    print(f"frames: {frame_count}")
+    print(f"per-frame: {per_frame * 1e6 / frame_count:.1f} us/frame")
+    print(f"batch:     {batch * 1e6 / frame_count:.1f} us/frame")
+    print(f"speed-up:  {per_frame / batch:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
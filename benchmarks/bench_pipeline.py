@@ -0,0 +1,83 @@
+"""
+End-to-end benchmark of the pipeline, fed by a synthetic signal faster than real-time.
+
+Runs recorder stand-in -> frequency extraction -> note identification -> latency reporter, and
+measures the frames displayed per second, the CPU used and the capture-to-display latency.
+
+Usage: python -m benchmarks.bench_pipeline [realtime_factor] [duration]
+"""
+import sys
+import time
+
+import numpy as np
+
+from benchmarks.results import make_result, format_results
+from concrete_threading.threaded_consumer import ThreadedConsumer
+from concrete_threading.threaded_consumer_producer import ThreadedConsumerProducer
+from concrete_threading.threaded_producer import ThreadedProducer
+from processes.frequency_extraction_process import FrequencyExtractionProcess
+from processes.latency_reporter_process import LatencyReporterProcess
+from processes.note_identifier import NoteIdentifierProcess
+from processes.synthetic_signal_process import SyntheticSignalProcess
+from processes.tracing_process import TracingProcess
+
+DEFAULT_REALTIME_FACTOR = 20
+DEFAULT_DURATION = 5
+SAMPLE_DURATION = 0.5
+BUFFER_SIZE = 10
+CHORD_COUNT = 50
+HARMONICS = 3
+SNR_DB = 20
+
+
+def bench_pipeline(realtime_factor=DEFAULT_REALTIME_FACTOR, duration=DEFAULT_DURATION):
+    """
+    Run the pipeline for a duration.
+
+    :param realtime_factor: How many times faster than real-time the synthetic signal is produced
+    :param duration: In seconds
+    :return: Results, as described in benchmarks.results
+    """
+    rng = np.random.default_rng(0)
+    chords = [(frequency,) for frequency in rng.uniform(60, 1500, size=CHORD_COUNT)]
+    source = SyntheticSignalProcess(chords, sample_duration=SAMPLE_DURATION, harmonics=HARMONICS, snr_db=SNR_DB,
+                                    realtime_factor=realtime_factor)
+    reporter = LatencyReporterProcess()
+    sink = ThreadedConsumer(BUFFER_SIZE, reporter)
+    note_identifier = ThreadedConsumerProducer(BUFFER_SIZE, sink,
+                                               TracingProcess(NoteIdentifierProcess(), "note_identifier"))
+    freq_extractor = ThreadedConsumerProducer(BUFFER_SIZE, note_identifier,
+                                              TracingProcess(FrequencyExtractionProcess(), "freq_extractor"))
+    producer = ThreadedProducer(freq_extractor, source)
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    producer.start()
+    time.sleep(duration)
+    summary = reporter.get_latency_summary()
+    cpu_time = time.process_time() - cpu_start
+    wall_time = time.perf_counter() - wall_start
+    for runnable in (producer, freq_extractor, note_identifier, sink):
+        runnable.stop()
+
+    frames_per_second = summary["count"] / wall_time
+    return {
+        f"pipeline_{realtime_factor}x": {
+            "frames_per_second": make_result(frames_per_second, "frames/s", higher_is_better=True),
+            "realtime_ratio": make_result(frames_per_second * SAMPLE_DURATION, "x", higher_is_better=True),
+            "cpu_percent": make_result(cpu_time / wall_time * 100, "%"),
+            "latency_p50": make_result(summary["total"][50] * 1e3, "ms"),
+            "latency_p95": make_result(summary["total"][95] * 1e3, "ms"),
+            "latency_p99": make_result(summary["total"][99] * 1e3, "ms"),
+        }
+    }
+
+
+def main():
+    realtime_factor = float(sys.argv[1]) if 1 < len(sys.argv) else DEFAULT_REALTIME_FACTOR
+    duration = float(sys.argv[2]) if 2 < len(sys.argv) else DEFAULT_DURATION
+    print(format_results(bench_pipeline(realtime_factor, duration)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+"""
+Measure how the throughput of the offline pitch timeline scales with the number of worker processes.
+
+Usage: python -m benchmarks.bench_pitch_timeline [recording_minutes]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+from pitch_timeline import get_pitch_timeline
+
+SAMPLE_RATE = 5000
+DEFAULT_RECORDING_MINUTES = 10
+
+
+def get_recording(minutes):
+    rng = np.random.default_rng(0)
+    frequencies = np.repeat(rng.uniform(60, 1500, size=minutes * 60), SAMPLE_RATE)
+    phases = np.cumsum(2 * np.pi * frequencies / SAMPLE_RATE)
+    return (2 ** 20 * np.sin(phases)).astype('int32')
+
+
+def main():
+    minutes = int(sys.argv[1]) if 1 < len(sys.argv) else DEFAULT_RECORDING_MINUTES
+    recording = get_recording(minutes)
+    print(f"recording: {minutes} min")
+    single = None
+    workers = 1
+    while workers <= os.cpu_count():
+        start = time.perf_counter()
+        get_pitch_timeline(recording, SAMPLE_RATE, workers=workers)
+        duration = time.perf_counter() - start
+        single = single if single is not None else duration
+        print(f"workers {workers}: {minutes * 60 / duration:.0f}x real-time, speed-up {single / duration:.2f}x")
+        workers *= 2
+
+
+if __name__ == '__main__':
+    main()
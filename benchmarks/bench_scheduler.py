@@ -0,0 +1,101 @@
+"""
+Compare the threads and context switches of N pipelines run with a thread per stage and with a
+StageScheduler.
+
+Each pipeline is producer -> consumer/producer -> consumer, fed a fixed number of items.
+
+Usage: python -m benchmarks.bench_scheduler [pipeline_count] [item_count]
+"""
+import resource
+import sys
+import threading
+import time
+
+from abstracts_interfaces.process import Process
+from concrete_scheduled.scheduled_consumer import ScheduledConsumer
+from concrete_scheduled.scheduled_consumer_producer import ScheduledConsumerProducer
+from concrete_scheduled.scheduled_producer import ScheduledProducer
+from concrete_scheduled.stage_scheduler import StageScheduler
+from concrete_threading.threaded_consumer import ThreadedConsumer
+from concrete_threading.threaded_consumer_producer import ThreadedConsumerProducer
+from concrete_threading.threaded_producer import ThreadedProducer
+
+DEFAULT_PIPELINE_COUNT = 100
+DEFAULT_ITEM_COUNT = 1000
+BUFFER_SIZE = 10
+SCHEDULER_WORKERS = 4
+
+
+class CounterProcess(Process):
+    def __init__(self, item_count):
+        self.next_item = 0
+        self.item_count = item_count
+
+    def run(self, item=None):
+        if self.next_item == self.item_count:
+            return None
+        self.next_item += 1
+        return self.next_item
+
+
+class IdentityProcess(Process):
+    def run(self, item=None):
+        return item
+
+
+class CountdownProcess(Process):
+    def __init__(self, item_count, done):
+        self.remaining = item_count
+        self.done = done
+
+    def run(self, item=None):
+        self.remaining -= 1
+        if self.remaining == 0:
+            self.done.release()
+
+
+def get_context_switches():
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_nvcsw + usage.ru_nivcsw
+
+
+def bench(start_pipeline, pipeline_count, item_count):
+    done = threading.Semaphore(0)
+    threads_before = threading.active_count()
+    switches_before = get_context_switches()
+    start = time.perf_counter()
+    for _ in range(pipeline_count):
+        start_pipeline(CounterProcess(item_count), CountdownProcess(item_count, done))
+    max_threads = threading.active_count() - threads_before
+    for _ in range(pipeline_count):
+        done.acquire()
+    duration = time.perf_counter() - start
+    return max_threads, get_context_switches() - switches_before, duration
+
+
+def start_threaded_pipeline(source, sink):
+    consumer = ThreadedConsumer(BUFFER_SIZE, sink)
+    ThreadedProducer(ThreadedConsumerProducer(BUFFER_SIZE, consumer, IdentityProcess()), source).start()
+
+
+def main():
+    pipeline_count = int(sys.argv[1]) if 1 < len(sys.argv) else DEFAULT_PIPELINE_COUNT
+    item_count = int(sys.argv[2]) if 2 < len(sys.argv) else DEFAULT_ITEM_COUNT
+    scheduler = StageScheduler(SCHEDULER_WORKERS)
+    scheduler.start()
+
+    def start_scheduled_pipeline(source, sink):
+        consumer = ScheduledConsumer(BUFFER_SIZE, sink, scheduler)
+        ScheduledProducer(ScheduledConsumerProducer(BUFFER_SIZE, consumer, IdentityProcess(), scheduler), source,
+                          scheduler).start()
+
+    print(f"pipelines: {pipeline_count}, items each: {item_count}")
+    for name, start_pipeline in (("threaded", start_threaded_pipeline), ("scheduled", start_scheduled_pipeline)):
+        threads, switches, duration = bench(start_pipeline, pipeline_count, item_count)
+        print(f"{name:9}: {threads} new threads, {switches} context switches, "
+              f"{duration * 1e6 / (pipeline_count * item_count):.1f} us/item")
+    scheduler.stop()
+
+
+if __name__ == '__main__':
+    main()
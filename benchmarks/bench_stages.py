@@ -0,0 +1,123 @@
+"""
+Microbenchmarks of each stage of the pipeline, on synthetic signals.
+
+Measures FrequencyExtractionProcess.run, on sound and on silence behind a SignalGate, get_note, get_notes and the hand-off of items to a ThreadedConsumer.
+
+Usage: python -m benchmarks.bench_stages [item_count]
+"""
+import sys
+import threading
+import time
+
+import numpy as np
+
+from abstracts_interfaces.process import Process
+from benchmarks.results import make_result, format_results
+from concrete_threading.threaded_consumer import ThreadedConsumer
+from processes.frequency_extraction_process import FrequencyExtractionProcess
+from processes.note_identifier import get_note, get_notes, DEFAULT_A4_FREQ
+from processes.signal_gate import SignalGate
+from processes.synthetic_signal_process import SyntheticSignalProcess, DEFAULT_SAMPLE_RATE
+from sound_sample import SoundSample
+
+DEFAULT_ITEM_COUNT = 2000
+CHORD_COUNT = 50
+HARMONICS = 3
+SNR_DB = 20
+BUFFER_SIZE = 10
+# the background noise of an idle tuner
+NOISE_RMS = 2 ** 8
+
+
+class CountdownProcess(Process):
+    """
+    Signals once it has run a given number of times.
+    """
+
+    def __init__(self, item_count) -> None:
+        self.remaining = item_count
+        self.done = threading.Event()
+
+    def run(self, item=None):
+        self.remaining -= 1
+        if self.remaining == 0:
+            self.done.set()
+
+
+def get_sound_samples(item_count):
+    rng = np.random.default_rng(0)
+    chords = [(frequency,) for frequency in rng.uniform(60, 1500, size=CHORD_COUNT)]
+    source = SyntheticSignalProcess(chords, harmonics=HARMONICS, snr_db=SNR_DB)
+    return [source.run() for _ in range(item_count)]
+
+
+def bench_frequency_extraction(item_count):
+    sound_samples = get_sound_samples(min(item_count, CHORD_COUNT))
+    extractor = FrequencyExtractionProcess()
+    start = time.perf_counter()
+    for i in range(item_count):
+        extractor.run(sound_samples[i % len(sound_samples)])
+    return (time.perf_counter() - start) / item_count
+
+
+def bench_gated_silence(item_count):
+    rng = np.random.default_rng(0)
+    sound_samples = [SoundSample(DEFAULT_SAMPLE_RATE, 0.5,
+                                 rng.normal(scale=NOISE_RMS, size=DEFAULT_SAMPLE_RATE // 2).astype('int32'))
+                     for _ in range(min(item_count, CHORD_COUNT))]
+    extractor = FrequencyExtractionProcess(gate=SignalGate())
+    start = time.perf_counter()
+    for i in range(item_count):
+        extractor.run(sound_samples[i % len(sound_samples)])
+    return (time.perf_counter() - start) / item_count
+
+
+def bench_get_note(item_count):
+    frequencies = np.random.default_rng(0).uniform(30, 4000, size=item_count).tolist()
+    start = time.perf_counter()
+    for frequency in frequencies:
+        get_note(frequency, DEFAULT_A4_FREQ)
+    return (time.perf_counter() - start) / item_count
+
+
+def bench_get_notes(item_count):
+    frequencies = np.random.default_rng(0).uniform(30, 4000, size=item_count)
+    start = time.perf_counter()
+    get_notes(frequencies, DEFAULT_A4_FREQ)
+    return (time.perf_counter() - start) / item_count
+
+
+def bench_hand_off(item_count):
+    process = CountdownProcess(item_count)
+    consumer = ThreadedConsumer(BUFFER_SIZE, process)
+    start = time.perf_counter()
+    consumer.start()
+    for item in range(item_count):
+        consumer.give(item)
+    process.done.wait()
+    duration = time.perf_counter() - start
+    consumer.stop()
+    return duration / item_count
+
+
+def run_stage_benchmarks(item_count=DEFAULT_ITEM_COUNT):
+    """
+    :param item_count: The number of items per benchmark
+    :return: Results, as described in benchmarks.results
+    """
+    return {
+        "frequency_extraction": {"run": make_result(bench_frequency_extraction(item_count) * 1e6, "us/frame"),
+                                 "run_gated_silence": make_result(bench_gated_silence(item_count) * 1e6, "us/frame")},
+        "note_identification": {"get_note": make_result(bench_get_note(item_count * 10) * 1e9, "ns/call"),
+                                "get_notes": make_result(bench_get_notes(item_count * 100) * 1e9, "ns/frequency")},
+        "hand_off": {"give": make_result(bench_hand_off(item_count * 10) * 1e9, "ns/item")},
+    }
+
+
+def main():
+    item_count = int(sys.argv[1]) if 1 < len(sys.argv) else DEFAULT_ITEM_COUNT
+    print(format_results(run_stage_benchmarks(item_count)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+Load test of the TuningService with K synthetic streams, each fed faster than real-time.
+
+Reports the aggregate frames identified per second for increasing K, and how close to linear
+the scaling is relative to a single stream.
+
+Usage: python -m benchmarks.bench_tuning_service [max_streams] [realtime_factor] [duration]
+"""
+import sys
+import threading
+import time
+
+import numpy as np
+
+from abstracts_interfaces.process import Process
+from processes.synthetic_signal_process import SyntheticSignalProcess
+from tuning_service import TuningService
+
+DEFAULT_MAX_STREAMS = 32
+DEFAULT_REALTIME_FACTOR = 20
+DEFAULT_DURATION = 3
+SAMPLE_DURATION = 0.5
+
+
+class CountingSinkProcess(Process):
+    def __init__(self):
+        self.count = 0
+
+    def run(self, item=None):
+        self.count += 1
+
+
+def bench_streams(stream_count, realtime_factor, duration):
+    """
+    :return: A tuple: (aggregate frames/s, CPU%, frames dropped)
+    """
+    rng = np.random.default_rng(stream_count)
+    sources = [SyntheticSignalProcess(((frequency,),), sample_duration=SAMPLE_DURATION, snr_db=20,
+                                      realtime_factor=realtime_factor, seed=stream)
+               for stream, frequency in enumerate(rng.uniform(60, 1500, size=stream_count))]
+    sinks = [CountingSinkProcess() for _ in range(stream_count)]
+    service = TuningService(sources, sinks)
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    service.start()
+    threading.Event().wait(duration)
+    frame_count = sum(sink.count for sink in sinks)
+    cpu_time = time.process_time() - cpu_start
+    wall_time = time.perf_counter() - wall_start
+    service.stop()
+    dropped = service.get_dropped_count()
+    return frame_count / wall_time, cpu_time / wall_time * 100, dropped
+
+
+def main():
+    max_streams = int(sys.argv[1]) if 1 < len(sys.argv) else DEFAULT_MAX_STREAMS
+    realtime_factor = float(sys.argv[2]) if 2 < len(sys.argv) else DEFAULT_REALTIME_FACTOR
+    duration = float(sys.argv[3]) if 3 < len(sys.argv) else DEFAULT_DURATION
+    offered_per_stream = realtime_factor / SAMPLE_DURATION
+    print(f"each stream offers {offered_per_stream:.0f} frames/s")
+    single_stream = None
+    stream_count = 1
+    while stream_count <= max_streams:
+        frames_per_second, cpu_percent, dropped = bench_streams(stream_count, realtime_factor, duration)
+        single_stream = single_stream if single_stream is not None else frames_per_second
+        print(f"K={stream_count:3}: {frames_per_second:8.1f} frames/s, "
+              f"scaling {frames_per_second / (stream_count * single_stream):.0%} of linear, "
+              f"CPU {cpu_percent:.0f}%, dropped {dropped}")
+        stream_count *= 2
+
+
+if __name__ == '__main__':
+    main()
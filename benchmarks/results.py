@@ -0,0 +1,82 @@
+"""
+Saving benchmark results as JSON and comparing them against a stored baseline.
+
+Results are a dict of benchmark name to a dict of metric name to a result. A result is a dict:
+{"value": float, "unit": str, "higher_is_better": bool}.
+"""
+import json
+import os
+import platform
+import time
+
+DEFAULT_TOLERANCE = 0.1
+
+
+def make_result(value, unit, higher_is_better=False):
+    return {"value": float(value), "unit": unit, "higher_is_better": higher_is_better}
+
+
+def save_results(results, path):
+    """
+    Save results, with the machine they were measured on, as JSON.
+
+    :param results: The results
+    :param path: The path of the JSON file. Missing directories are created
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    document = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    with open(path, "w") as file:
+        json.dump(document, file, indent=2)
+
+
+def load_results(path):
+    """
+    :param path: The path of a JSON file written by save_results
+    :return: The results
+    """
+    with open(path) as file:
+        return json.load(file)["results"]
+
+
+def compare_results(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """
+    Find the metrics that got worse than the baseline by more than the tolerance.
+
+    Metrics missing from either side are not compared.
+    :param results: The results
+    :param baseline: The baseline results
+    :param tolerance: The relative change allowed, e.g. 0.1 for 10%
+    :return: A list of tuples: (benchmark name, metric name, baseline value, value, relative change)
+    """
+    regressions = []
+    for benchmark, metrics in results.items():
+        for metric, result in metrics.items():
+            baseline_result = baseline.get(benchmark, {}).get(metric)
+            if baseline_result is None or baseline_result["value"] == 0:
+                continue
+            change = (result["value"] - baseline_result["value"]) / abs(baseline_result["value"])
+            worsening = -change if result["higher_is_better"] else change
+            if tolerance < worsening:
+                regressions.append((benchmark, metric, baseline_result["value"], result["value"], change))
+    return regressions
+
+
+def format_results(results):
+    lines = []
+    for benchmark, metrics in results.items():
+        lines.append(f"{benchmark}:")
+        for metric, result in metrics.items():
+            lines.append(f"    {metric}: {result['value']:.4g} {result['unit']}")
+    return "\n".join(lines)
+
+
+def format_regressions(regressions):
+    return "\n".join(f"REGRESSION {benchmark}.{metric}: {baseline_value:.4g} -> {value:.4g} ({change:+.1%})"
+                     for benchmark, metric, baseline_value, value, change in regressions)
@@ -0,0 +1,53 @@
+"""
+Run the stage and pipeline benchmarks, save the results as JSON and optionally compare them
+against a baseline. Needs no audio device.
+
+Results are saved under benchmarks/results/, which is not tracked, unless --output says otherwise.
+
+Usage: python -m benchmarks.run_benchmarks [--output results.json] [--baseline baseline.json]
+                                            [--tolerance 0.1] [--realtime-factor 20] [--duration 5]
+
+Exits with status 1 if any metric regressed beyond the tolerance.
+"""
+import argparse
+import os
+import sys
+
+from benchmarks.bench_pipeline import bench_pipeline, DEFAULT_REALTIME_FACTOR, DEFAULT_DURATION
+from benchmarks.bench_stages import run_stage_benchmarks, DEFAULT_ITEM_COUNT
+from benchmarks.results import (save_results, load_results, compare_results, format_results, format_regressions,
+                                DEFAULT_TOLERANCE)
+
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(__file__), "results", "benchmark_results.json")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the benchmarks of the pipeline")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="Where to save the results")
+    parser.add_argument("--baseline", help="Results to compare against")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="The relative worsening allowed before flagging a regression")
+    parser.add_argument("--items", type=int, default=DEFAULT_ITEM_COUNT, help="Items per stage benchmark")
+    parser.add_argument("--realtime-factor", type=float, default=DEFAULT_REALTIME_FACTOR,
+                        help="How many times faster than real-time to feed the pipeline")
+    parser.add_argument("--duration", type=float, default=DEFAULT_DURATION,
+                        help="How long to run the pipeline, in seconds")
+    args = parser.parse_args()
+
+    results = run_stage_benchmarks(args.items)
+    results.update(bench_pipeline(args.realtime_factor, args.duration))
+    save_results(results, args.output)
+    print(format_results(results))
+
+    if args.baseline is None:
+        return
+    regressions = compare_results(results, load_results(args.baseline), args.tolerance)
+    if len(regressions) == 0:
+        print(f"No regressions against {args.baseline}")
+        return
+    print(format_regressions(regressions))
+    sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
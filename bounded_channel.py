@@ -0,0 +1,144 @@
+import collections
+import queue
+import threading
+
+
+class BoundedChannel:
+    """
+    Models a bounded FIFO channel between threads.
+
+    Every hand-off takes a single lock. Two conditions on that lock wake up the getters when an item
+    arrives and the putters when space is freed.
+
+    Like queue.Queue, a timed out put raises queue.Full and a timed out get raises queue.Empty.
+    """
+
+    def __init__(self, capacity) -> None:
+        """
+        Construct an instance of BoundedChannel.
+
+        :param capacity: The maximum number of items held
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be greater than 0")
+        self.__capacity = capacity
+        self.__items = collections.deque()
+        self.__lock = threading.Lock()
+        self.__not_empty = threading.Condition(self.__lock)
+        self.__not_full = threading.Condition(self.__lock)
+
+    def __len__(self):
+        return len(self.__items)
+
+    def get_capacity(self):
+        return self.__capacity
+
+    def put(self, item, timeout=None):
+        """
+        Put an item, waiting for space if the channel is full.
+
+        :param item: any
+        :param timeout: The maximum time to wait in seconds. None to wait indefinitely
+        """
+        with self.__lock:
+            if len(self.__items) == self.__capacity:
+                self.__wait(self.__not_full, lambda: len(self.__items) < self.__capacity, timeout, queue.Full)
+            self.__items.append(item)
+            self.__not_empty.notify()
+
+    def try_put(self, item):
+        """
+        Put an item if there is space. Never blocks.
+
+        :param item: any
+        :return: True if the item was put, False if the channel is full
+        """
+        with self.__lock:
+            if len(self.__items) == self.__capacity:
+                return False
+            self.__items.append(item)
+            self.__not_empty.notify()
+            return True
+
+    def force_put(self, item):
+        """
+        Put an item, discarding the oldest item if the channel is full. Never blocks.
+
+        :param item: any
+        :return: The number of items discarded
+        """
+        with self.__lock:
+            discarded = 0
+            if len(self.__items) == self.__capacity:
+                self.__items.popleft()
+                discarded = 1
+            self.__items.append(item)
+            self.__not_empty.notify()
+            return discarded
+
+    def replace(self, item):
+        """
+        Discard every item held and put the given one. Never blocks.
+
+        :param item: any
+        :return: The number of items discarded
+        """
+        with self.__lock:
+            discarded = len(self.__items)
+            self.__items.clear()
+            self.__items.append(item)
+            self.__not_empty.notify()
+            if discarded != 0:
+                self.__not_full.notify(discarded - 1)
+            return discarded
+
+    def put_many(self, items):
+        """
+        Put all the items in order, waiting for space as needed.
+
+        :param items: An iterable of items
+        """
+        items = list(items)
+        put_count = 0
+        with self.__lock:
+            while put_count < len(items):
+                if len(self.__items) == self.__capacity:
+                    self.__wait(self.__not_full, lambda: len(self.__items) < self.__capacity, None, queue.Full)
+                free_space = self.__capacity - len(self.__items)
+                self.__items.extend(items[put_count:put_count + free_space])
+                self.__not_empty.notify(min(free_space, len(items) - put_count))
+                put_count += free_space
+
+    def get(self, timeout=None):
+        """
+        Get the oldest item, waiting for one if the channel is empty.
+
+        :param timeout: The maximum time to wait in seconds. None to wait indefinitely
+        :return: The item
+        """
+        with self.__lock:
+            if len(self.__items) == 0:
+                self.__wait(self.__not_empty, lambda: len(self.__items) != 0, timeout, queue.Empty)
+            item = self.__items.popleft()
+            self.__not_full.notify()
+            return item
+
+    def get_many(self, max_items, timeout=None):
+        """
+        Get up to max_items of the oldest items, waiting for at least one if the channel is empty.
+
+        :param max_items: The maximum number of items to get
+        :param timeout: The maximum time to wait for the first item in seconds. None to wait indefinitely
+        :return: A list of items in order
+        """
+        with self.__lock:
+            if len(self.__items) == 0:
+                self.__wait(self.__not_empty, lambda: len(self.__items) != 0, timeout, queue.Empty)
+            items = [self.__items.popleft() for _ in range(min(max_items, len(self.__items)))]
+            self.__not_full.notify(len(items))
+            return items
+
+    @staticmethod
+    def __wait(condition, predicate, timeout, timeout_exception):
+        if not condition.wait_for(predicate, timeout):
+            raise timeout_exception
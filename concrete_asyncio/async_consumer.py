@@ -0,0 +1,239 @@
+import asyncio
+import concurrent.futures
+import time
+
+from abstracts_interfaces.abstract_consumer import AbstractConsumer, OVERFLOW_BLOCK, OVERFLOW_DROP_NEWEST, \
+    OVERFLOW_DROP_OLDEST
+from abstracts_interfaces.process import Process
+
+
+class AsyncConsumer(AbstractConsumer):
+    """
+    Models a consumer that runs as a coroutine on an event loop.
+
+    Many async stages share the thread of their event loop, instead of a thread each. The process runs
+    on the event loop itself, hence must be cheap, unless an executor is given to offload it to.
+
+    Runs on the event loop given, or else on the loop running when it is started. Objects are given with
+    give_async from the event loop, or with give from any other thread, which blocks the thread as a
+    ThreadedConsumer would. Hence threaded producers may feed async consumers, and the other way around.
+    Overflow policies, maximum age and batching apply as for any AbstractConsumer.
+    """
+
+    def __init__(self, buffer_size, process: Process, executor=None, loop=None) -> None:
+        """
+        Initializes the consumer.
+
+        :param buffer_size: The consumption buffer size
+        :param process: A Process
+        :param executor: Optional. The concurrent.futures.Executor to run the process in, for costly processes
+        :param loop: Optional. The event loop to run on. Required if started from outside the loop
+        """
+        super().__init__(buffer_size, process)
+        self._buffer = asyncio.Queue(buffer_size)
+        self._executor = executor
+        self._loop = loop
+        self._task = None
+
+    def give(self, obj):
+        """
+        Give an object for processing to this consumer, from a thread other than the event loop's.
+
+        May block if the buffer is full and the overflow policy is OVERFLOW_BLOCK
+        :param obj: any
+        """
+        if self._loop is None:
+            raise RuntimeError("Cannot give to an async consumer before it starts")
+        if is_loop_thread(self._loop):
+            raise RuntimeError("Use give_async from the event loop")
+        asyncio.run_coroutine_threadsafe(self.give_async(obj), self._loop).result()
+
+    async def give_async(self, obj):
+        """
+        Give an object for processing to this consumer, from the event loop.
+
+        Waits for space if the buffer is full and the overflow policy is OVERFLOW_BLOCK
+        :param obj: any
+        """
+        if self._metrics is not None:
+            self._metrics.record_in()
+        entry = (time.monotonic(), obj)
+        if self._overflow_policy == OVERFLOW_BLOCK:
+            await self._buffer.put(entry)
+            return
+        dropped = 0
+        if self._overflow_policy == OVERFLOW_DROP_NEWEST:
+            if self._buffer.full():
+                dropped = 1
+            else:
+                self._buffer.put_nowait(entry)
+        else:
+            while self._buffer.full() or (self._overflow_policy != OVERFLOW_DROP_OLDEST and not self._buffer.empty()):
+                self._buffer.get_nowait()
+                dropped += 1
+            self._buffer.put_nowait(entry)
+        if dropped != 0:
+            self._dropped_count += dropped
+
+    def start(self):
+        # several producers may share this consumer, and each starts it
+        if self._running:
+            return
+        self._running = True
+        self._loop, self._task = schedule(self._consume(), self._loop)
+
+    def stop(self):
+        """
+        Stop consuming.
+
+        :return: From the event loop, an awaitable that finishes once the consuming task has.
+                 From any other thread, waits for the task to finish and returns None
+        """
+        self._running = False
+        if self._task is None:
+            return None
+        task, self._task = self._task, None
+        return cancel(task, self._loop)
+
+    async def _consume(self):
+        while self._running:
+            if self._batch_size == 1:
+                objs = [await self._run_process_async(await self._take_async())]
+            else:
+                objs = await self._run_process_batch_async(await self._take_batch_async())
+            await self._deliver(objs)
+            # let the other coroutines of the loop run between items
+            await asyncio.sleep(0)
+
+    async def _deliver(self, objs):
+        """
+        Handle the results of the process, in the order the items were given.
+
+        :param objs: A list with the results of the process
+        """
+        pass
+
+    async def _take_async(self):
+        """
+        Take the next object to process from the buffer, discarding the expired ones.
+
+        Waits until an object is available.
+        :return: any
+        """
+        while True:
+            given_at, obj = await self._get_entry()
+            if self._is_fresh(given_at):
+                return obj
+            self._expired_count += 1
+
+    async def _take_batch_async(self):
+        """
+        Take the next batch of objects to process from the buffer, discarding the expired ones.
+
+        Waits until an object is available, then up to batch_wait for up to batch_size objects.
+        :return: A list of any, never empty
+        """
+        batch = [await self._take_async()]
+        deadline = time.monotonic() + self._batch_wait
+        while len(batch) < self._batch_size:
+            if self._buffer.empty():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    given_at, obj = await asyncio.wait_for(self._buffer.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+            else:
+                given_at, obj = self._buffer.get_nowait()
+            if self._is_fresh(given_at):
+                batch.append(obj)
+            else:
+                self._expired_count += 1
+        return batch
+
+    async def _get_entry(self):
+        """
+        Get the next entry from the buffer, recording the time waited and the depth left if metrics are enabled.
+        """
+        if self._metrics is None:
+            return await self._buffer.get()
+        start = time.perf_counter()
+        entry = await self._buffer.get()
+        self._metrics.record_starved(time.perf_counter() - start, self._buffer.qsize())
+        return entry
+
+    async def _run_process_async(self, item):
+        """
+        Run the process on an item, in the executor if there is one.
+        """
+        if self._executor is None:
+            return self._run_process(item)
+        start = time.perf_counter()
+        obj = await self._loop.run_in_executor(self._executor, self._process.run, item)
+        if self._metrics is not None:
+            self._metrics.record_run(time.perf_counter() - start)
+        return obj
+
+    async def _run_process_batch_async(self, items):
+        """
+        Run the process on a batch of items, in the executor if there is one.
+        """
+        if self._executor is None:
+            return self._run_process_batch(items)
+        start = time.perf_counter()
+        objs = await self._loop.run_in_executor(self._executor, self._process.run_batch, items)
+        if self._metrics is not None:
+            self._metrics.record_run(time.perf_counter() - start, len(items))
+        return objs
+
+
+def is_loop_thread(loop):
+    """
+    :return: Whether the calling thread is running the given event loop
+    """
+    try:
+        return asyncio.get_running_loop() is loop
+    except RuntimeError:
+        return False
+
+
+def schedule(coroutine, loop=None):
+    """
+    Run a coroutine as a task of an event loop, from the loop or from any other thread.
+
+    :param coroutine: A coroutine
+    :param loop: The event loop. Defaults to the running loop
+    :return: A tuple: (the loop, the task). From another thread, a concurrent.futures.Future of the task instead
+    """
+    if loop is None:
+        loop = asyncio.get_running_loop()
+    if is_loop_thread(loop):
+        return loop, loop.create_task(coroutine)
+    return loop, asyncio.run_coroutine_threadsafe(_create_task(coroutine), loop)
+
+
+def cancel(task, loop):
+    """
+    Cancel a task given by schedule, from the loop or from any other thread.
+
+    :param task: The task, or future of the task, given by schedule
+    :param loop: The event loop of the task
+    :return: From the event loop, an awaitable that finishes once the task has.
+             From any other thread, waits for the task to finish and returns None
+    """
+    if is_loop_thread(loop):
+        return loop.create_task(_cancel(task))
+    asyncio.run_coroutine_threadsafe(_cancel(task), loop).result()
+    return None
+
+
+async def _create_task(coroutine):
+    return asyncio.get_running_loop().create_task(coroutine)
+
+
+async def _cancel(task):
+    if isinstance(task, concurrent.futures.Future):
+        task = await asyncio.wrap_future(task)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
@@ -0,0 +1,40 @@
+from abstracts_interfaces.abstract_consumer import AbstractConsumer
+from abstracts_interfaces.abstract_producer import AbstractProducer
+from abstracts_interfaces.process import Process
+from concrete_asyncio.async_consumer import AsyncConsumer
+from concrete_asyncio.async_producer import AsyncProducerMixin
+
+
+class AsyncConsumerProducer(AsyncConsumer, AsyncProducerMixin, AbstractProducer):
+    """
+    Models a consumer/producer that runs as a coroutine on an event loop.
+
+    Can be chained with any other consumer, in place of a ThreadedConsumerProducer.
+    Results are given to the consumer in the order the items were given to this stage.
+    """
+
+    def __init__(self, buffer_size, consumer: AbstractConsumer, process: Process, executor=None, loop=None) -> None:
+        """
+        Initializes the consumer/producer.
+
+        :param buffer_size: The consumption buffer size
+        :param consumer: The consumer of the items produced
+        :param process: A Process
+        :param executor: Optional. The concurrent.futures.Executor to run the process in, for costly processes
+        :param loop: Optional. The event loop to run on. Required if started from outside the loop
+        """
+        AsyncConsumer.__init__(self, buffer_size, process, executor, loop)
+        AbstractProducer.__init__(self, consumer, process)
+
+    async def _deliver(self, objs):
+        for obj in objs:
+            await self._give_to_consumer_async(obj)
+
+    def start(self):
+        if self._running:
+            return
+        self._consumer.start()
+        super().start()
+
+    def set_consumer(self, consumer):
+        super().set_consumer(consumer)
@@ -0,0 +1,93 @@
+import asyncio
+import time
+
+from abstracts_interfaces.abstract_consumer import AbstractConsumer
+from abstracts_interfaces.abstract_producer import AbstractProducer
+from abstracts_interfaces.process import Process
+from concrete_asyncio.async_consumer import schedule, cancel
+
+
+class AsyncProducerMixin:
+    """
+    Gives objects to the consumer of an AbstractProducer from an event loop.
+
+    Async consumers are awaited. Other consumers may block while their buffer is full, hence are given
+    objects from the default executor of the loop.
+    """
+
+    async def _give_to_consumer_async(self, obj):
+        """
+        Give an object to the consumer, recording the time blocked if metrics are enabled.
+        """
+        start = time.perf_counter()
+        give_async = getattr(self._consumer, "give_async", None)
+        if give_async is not None:
+            await give_async(obj)
+        else:
+            await asyncio.get_running_loop().run_in_executor(None, self._consumer.give, obj)
+        if self._metrics is not None:
+            self._metrics.record_blocked(time.perf_counter() - start)
+
+
+class AsyncProducer(AsyncProducerMixin, AbstractProducer):
+    """
+    Models a producer that runs as a coroutine on an event loop.
+
+    The process runs on the event loop itself, hence must not block, unless an executor is given to
+    offload it to, e.g. for a RecorderProcess. Stops producing once the process produces None.
+
+    Runs on the event loop given, or else on the loop running when it is started.
+    """
+
+    def __init__(self, consumer: AbstractConsumer, process: Process, executor=None, loop=None) -> None:
+        """
+        Initializes a producer.
+
+        :param consumer: A consumer for the items produced
+        :param process: A Process that produces one item at a time
+        :param executor: Optional. The concurrent.futures.Executor to run the process in, for blocking processes
+        :param loop: Optional. The event loop to run on. Required if started from outside the loop
+        """
+        super().__init__(consumer, process)
+        self._executor = executor
+        self._loop = loop
+        self._task = None
+
+    def start(self):
+        """
+        Start producing, and start the consumer. Does nothing if already producing.
+        """
+        if self._running:
+            return
+        self._running = True
+        self._loop, self._task = schedule(self._produce(), self._loop)
+        self._consumer.start()
+
+    def stop(self):
+        """
+        Stop producing.
+
+        :return: From the event loop, an awaitable that finishes once the producing task has.
+                 From any other thread, waits for the task to finish and returns None
+        """
+        self._running = False
+        if self._task is None:
+            return None
+        task, self._task = self._task, None
+        return cancel(task, self._loop)
+
+    async def _produce(self):
+        while self._running:
+            if self._executor is None:
+                obj = self._run_process()
+            else:
+                start = time.perf_counter()
+                obj = await self._loop.run_in_executor(self._executor, self._process.run, None)
+                if self._metrics is not None:
+                    self._metrics.record_run(time.perf_counter() - start)
+            if obj is None:
+                self._running = False
+                return
+            await self._give_to_consumer_async(obj)
+            # let the other coroutines of the loop run between items
+            await asyncio.sleep(0)
@@ -0,0 +1,160 @@
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+
+from abstracts_interfaces.abstract_consumer import AbstractConsumer
+from abstracts_interfaces.process import Process
+from concrete_multiprocessing.shared_sample_pool import SharedSamplePool, SharedSampleHandle
+from concrete_multiprocessing.worker import initialize_worker, run_in_worker, run_batch_in_worker
+from sound_sample import SoundSample
+
+IN_FLIGHT_PER_WORKER = 2
+
+_logger = logging.getLogger(__name__)
+# given to the dispatching thread by stop, so that it stops waiting for items
+_STOP = object()
+
+
+class ProcessConsumer(AbstractConsumer):
+    """
+    Models a consumer that runs its process in a pool of worker processes.
+
+    Items are given and buffered in this process, as with a ThreadedConsumer. A dispatching thread hands
+    them to the workers, and a collecting thread receives the results in the order the items were given.
+    The process is copied to each worker when the worker starts, hence it must be picklable, and so must
+    be the items and the results.
+
+    If a SharedSamplePool is given, SoundSamples are copied into it and only their handles are sent to
+    the workers. The slot is released once the result of the item is received, or once the item fails.
+
+    With batching, each batch is run in a worker with Process.run_batch, and its results are delivered one by one.
+    A SharedSamplePool must then have at least batch_size slots.
+
+    An item on which the process raises is logged, counted in get_failed_count and skipped. So are all the
+    items of a batch on which the process raises.
+    """
+
+    def __init__(self, buffer_size, process: Process, workers=None, sample_pool: SharedSamplePool = None) -> None:
+        """
+        Initializes the consumer.
+
+        :param buffer_size: The consumption buffer size
+        :param process: A picklable Process
+        :param workers: The number of worker processes. Defaults to the number of CPUs, or to 1 if the process is
+                        not concurrent. Only 1 if the process is not concurrent, since each worker would hold a
+                        copy of its state
+        :param sample_pool: Optional. The SharedSamplePool to transport SoundSamples through. Owned by the caller
+        """
+        super().__init__(buffer_size, process)
+        if workers is None:
+            workers = os.cpu_count() if process.is_concurrent() else 1
+        elif 1 < workers and not process.is_concurrent():
+            raise ValueError("A process that is not concurrent cannot be run by several workers")
+        self._workers = workers
+        self._sample_pool = sample_pool
+        self._executor = None
+        self._in_flight = queue.Queue(self._workers * IN_FLIGHT_PER_WORKER)
+        self._failed_count = 0
+        self._dispatcher = threading.Thread(target=self._consume, daemon=True)
+        self._collector = threading.Thread(target=self._collect, daemon=True)
+
+    def get_failed_count(self):
+        """
+        Get the number of items on which the process raised.
+
+        :return: an int
+        """
+        return self._failed_count
+
+    def _consume(self):
+        while self._running:
+            items = [self._take()] if self._batch_size == 1 else self._take_batch()
+            stop_index = next((index for index, item in enumerate(items) if item is _STOP), None)
+            if stop_index is not None:
+                items = items[:stop_index]
+            if len(items) != 0 and not self._dispatch(items):
+                break
+            if stop_index is not None:
+                break
+        # the collecting thread stops once it has collected every item dispatched
+        self._in_flight.put(None)
+
+    def _dispatch(self, items):
+        """
+        Submit an item, or a batch of items, to the workers.
+
+        :param items: A list of items. A single item unless batching
+        :return: False if the executor was shut down by stop, True otherwise
+        """
+        if self._sample_pool is not None:
+            items = [self._sample_pool.put(item) if isinstance(item, SoundSample) else item for item in items]
+        try:
+            if self._batch_size == 1:
+                future = self._executor.submit(run_in_worker, items[0])
+            else:
+                future = self._executor.submit(run_batch_in_worker, items)
+        except RuntimeError:
+            for item in items:
+                self._release(item)
+            return False
+        self._in_flight.put((future, items))
+        return True
+
+    def _collect(self):
+        while True:
+            entry = self._in_flight.get()
+            if entry is None:
+                return
+            future, items = entry
+            try:
+                result = future.result()
+            except CancelledError:
+                # cancelled by stop
+                continue
+            except Exception:
+                self._failed_count += len(items)
+                _logger.exception("%s failed on %d item(s)", type(self._process).__name__, len(items))
+                continue
+            finally:
+                for item in items:
+                    self._release(item)
+            for obj in ([result] if self._batch_size == 1 else result):
+                if not self._running:
+                    break
+                self._deliver(obj)
+
+    def _release(self, item):
+        if isinstance(item, SharedSampleHandle):
+            self._sample_pool.release(item)
+
+    def _deliver(self, result):
+        """
+        Handle the result of the process for one item, in the order the items were given.
+
+        :param result: any
+        """
+        pass
+
+    def start(self):
+        self._running = True
+        self._executor = ProcessPoolExecutor(self._workers, initializer=initialize_worker,
+                                             initargs=(self._process,))
+        self._collector.start()
+        self._dispatcher.start()
+
+    def stop(self):
+        """
+        Stop consuming. Items not dispatched yet are discarded, and so are the results still expected.
+
+        Once stopped, no more SoundSamples are put in the sample pool, so that the caller may close it.
+        """
+        self._running = False
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        # wakes the dispatching thread if it waits for an item
+        self._buffer.force_put((time.monotonic(), _STOP))
+        if self._dispatcher.is_alive() and self._dispatcher is not threading.current_thread():
+            self._dispatcher.join()
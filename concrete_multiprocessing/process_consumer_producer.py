@@ -0,0 +1,29 @@
+from abstracts_interfaces.abstract_consumer import AbstractConsumer
+from abstracts_interfaces.abstract_producer import AbstractProducer
+from abstracts_interfaces.process import Process
+from concrete_multiprocessing.process_consumer import ProcessConsumer
+from concrete_multiprocessing.shared_sample_pool import SharedSamplePool
+
+
+class ProcessConsumerProducer(ProcessConsumer, AbstractProducer):
+    """
+    Models a consumer/producer that runs its process in a pool of worker processes.
+
+    Can be chained with any other consumer, in place of a ThreadedConsumerProducer.
+    Results are given to the consumer in the order the items were given to this stage.
+    """
+
+    def __init__(self, buffer_size, consumer: AbstractConsumer, process: Process, workers=None,
+                 sample_pool: SharedSamplePool = None) -> None:
+        ProcessConsumer.__init__(self, buffer_size, process, workers, sample_pool)
+        AbstractProducer.__init__(self, consumer, process)
+
+    def _deliver(self, result):
+        self._give_to_consumer(result)
+
+    def start(self):
+        self._consumer.start()
+        super().start()
+
+    def set_consumer(self, consumer):
+        super().set_consumer(consumer)
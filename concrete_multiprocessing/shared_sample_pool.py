@@ -0,0 +1,141 @@
+"""
+Transport of SoundSamples between processes through shared memory.
+
+The samples are copied once into a slot of a shared memory block. Only a small SharedSampleHandle,
+holding the slot index and the sample metadata, crosses the process boundary. The receiving process
+gets a SoundSample whose samples are a view into the slot.
+
+Processes attach to the shared memory of a pool on first use, and stay attached until they close their
+attachments with close_attached_memories, e.g. in a finalizer when a worker exits.
+"""
+import queue
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from sound_sample import SoundSample
+
+# the shared memory blocks attached by this process, by name
+_attached_memories = {}
+
+
+class SharedSampleHandle:
+    """
+    Models a reference to a SoundSample held in a slot of a SharedSamplePool.
+    """
+
+    def __init__(self, memory_name, slot, slot_size, dtype, length, sample_rate, sample_duration, capture_time,
+                 sequence_number, channels=None) -> None:
+        self.memory_name = memory_name
+        self.slot = slot
+        self.slot_size = slot_size
+        self.dtype = dtype
+        self.length = length
+        # None for one dimensional samples
+        self.channels = channels
+        self.sample_rate = sample_rate
+        self.sample_duration = sample_duration
+        self.capture_time = capture_time
+        self.sequence_number = sequence_number
+
+
+class SharedSamplePool:
+    """
+    Models a fixed pool of slots in shared memory, each able to hold the samples of one SoundSample.
+
+    Slots are taken and released by the process that created the pool. The pool must be closed
+    by its creator once no process uses it anymore.
+
+    A pool holds either one dimensional SoundSamples or multi-channel SoundSamples of a given number of
+    channels, as set when it is constructed.
+    """
+
+    def __init__(self, slots, slot_size, dtype='int32', channels=None) -> None:
+        """
+        Construct an instance of SharedSamplePool.
+
+        :param slots: The number of slots
+        :param slot_size: The maximum number of samples in a slot
+        :param dtype: The numpy dtype the samples are stored as
+        :param channels: Optional. The number of channels of each sample. None for one dimensional samples
+        """
+        self.__slot_size = slot_size
+        self.__dtype = np.dtype(dtype)
+        self.__channels = channels
+        sample_shape = () if channels is None else (channels,)
+        self.__memory = shared_memory.SharedMemory(
+            create=True, size=slots * slot_size * int(np.prod(sample_shape)) * self.__dtype.itemsize)
+        self.__slots = np.ndarray((slots, slot_size) + sample_shape, dtype=self.__dtype, buffer=self.__memory.buf)
+        self.__free_slots = queue.Queue()
+        for slot in range(slots):
+            self.__free_slots.put(slot)
+
+    def put(self, sound_sample: SoundSample):
+        """
+        Copy a SoundSample into a free slot. Blocks until a slot is free.
+
+        :param sound_sample: A SoundSample of at most slot_size samples, with the channels of the pool
+        :return: A SharedSampleHandle to the slot
+        """
+        samples = sound_sample.get_samples()
+        if self.__slot_size < len(samples):
+            raise ValueError("The SoundSample does not fit in a slot")
+        if np.shape(samples)[1:] != self.__slots.shape[2:]:
+            raise ValueError("The SoundSample does not have the channels of the pool")
+        slot = self.__free_slots.get()
+        self.__slots[slot, :len(samples)] = samples
+        return SharedSampleHandle(self.__memory.name, slot, self.__slot_size, self.__dtype.str, len(samples),
+                                  sound_sample.get_sample_rate(), sound_sample.get_sample_duration(),
+                                  sound_sample.get_capture_time(), sound_sample.get_sequence_number(),
+                                  self.__channels)
+
+    def release(self, handle: SharedSampleHandle):
+        """
+        Free the slot of a handle. The SoundSamples opened from the handle must not be used afterwards.
+
+        :param handle: A SharedSampleHandle obtained from put
+        """
+        self.__free_slots.put(handle.slot)
+
+    def close(self):
+        """
+        Free the shared memory.
+        """
+        self.__slots = None
+        self.__memory.close()
+        self.__memory.unlink()
+
+
+def open_sound_sample(handle: SharedSampleHandle):
+    """
+    Get the SoundSample a handle refers to, without copying its samples.
+
+    Attaches to the shared memory of the pool the first time it is used in this process.
+
+    :param handle: A SharedSampleHandle
+    :return: A SoundSample whose samples are a view into the shared memory
+    """
+    memory = _attached_memories.get(handle.memory_name)
+    if memory is None:
+        memory = shared_memory.SharedMemory(name=handle.memory_name)
+        _attached_memories[handle.memory_name] = memory
+    dtype = np.dtype(handle.dtype)
+    sample_shape = () if handle.channels is None else (handle.channels,)
+    offset = handle.slot * handle.slot_size * int(np.prod(sample_shape)) * dtype.itemsize
+    samples = np.ndarray((handle.length,) + sample_shape, dtype=dtype, buffer=memory.buf, offset=offset)
+    return SoundSample(handle.sample_rate, handle.sample_duration, samples, handle.capture_time, handle.sequence_number)
+
+
+def close_attached_memories():
+    """
+    Detach this process from the shared memory of every pool it opened SoundSamples from.
+
+    The SoundSamples opened must not be used afterwards. Memories still viewed by live SoundSamples are
+    left attached.
+    """
+    for name, memory in list(_attached_memories.items()):
+        try:
+            memory.close()
+        except BufferError:
+            continue
+        del _attached_memories[name]
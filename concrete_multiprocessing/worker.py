@@ -0,0 +1,51 @@
+"""
+Entry points run inside the worker processes of a process pool.
+
+Each worker receives its own copy of the Process once, when it starts, instead of with every item.
+"""
+from multiprocessing import util
+
+from abstracts_interfaces.process import Process
+from concrete_multiprocessing.shared_sample_pool import SharedSampleHandle, open_sound_sample, \
+    close_attached_memories
+
+_process = None
+
+
+def initialize_worker(process: Process):
+    """
+    Install the process that this worker runs. To be used as the initializer of the pool.
+
+    :param process: A picklable Process
+    """
+    global _process
+    _process = process
+    # workers exit without running atexit handlers, but with running the finalizers of multiprocessing
+    util.Finalize(None, close_attached_memories, exitpriority=0)
+
+
+def run_in_worker(item):
+    """
+    Run the installed process on the given item.
+
+    A SharedSampleHandle is resolved into its SoundSample before running the process.
+
+    :param item: any picklable object
+    :return: the result of the process, which must be picklable
+    """
+    if isinstance(item, SharedSampleHandle):
+        item = open_sound_sample(item)
+    return _process.run(item)
+
+
+def run_batch_in_worker(items):
+    """
+    Run the installed process on the given batch of items at once, with Process.run_batch.
+
+    SharedSampleHandles are resolved into their SoundSamples before running the process.
+
+    :param items: A list of picklable objects
+    :return: the results of the process, which must be picklable
+    """
+    items = [open_sound_sample(item) if isinstance(item, SharedSampleHandle) else item for item in items]
+    return _process.run_batch(items)
@@ -0,0 +1,155 @@
+import queue
+import threading
+import time
+
+from abstracts_interfaces.abstract_consumer import AbstractConsumer, OVERFLOW_BLOCK
+from abstracts_interfaces.process import Process
+from concrete_scheduled.stage_scheduler import StageScheduler
+
+
+class ScheduledConsumer(AbstractConsumer):
+    """
+    Models a consumer run by the workers of a StageScheduler instead of a thread of its own.
+
+    Giving an object schedules the consumer. A turn processes the objects already buffered, up to
+    the quantum of the scheduler, without ever waiting for more. Hence batches are formed of the
+    objects available when the batch is taken, and batch_wait does not apply.
+
+    Scheduled producers never block a worker on a full buffer: they hold their objects with try_give and
+    wait_for_space, and are scheduled again once the consumer frees space. Objects given with give from
+    other threads are buffered as for a ThreadedConsumer.
+    """
+
+    def __init__(self, buffer_size, process: Process, scheduler: StageScheduler, concurrency=1) -> None:
+        """
+        Initializes the consumer.
+
+        :param buffer_size: The consumption buffer size
+        :param process: A Process. Must be thread-safe and concurrent if concurrency is greater than 1
+        :param scheduler: The StageScheduler that runs this consumer
+        :param concurrency: The maximum number of workers running this consumer at once
+        """
+        super().__init__(buffer_size, process)
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if 1 < concurrency and not process.is_concurrent():
+            raise ValueError("A process that is not concurrent cannot be run by several workers")
+        self._scheduler = scheduler
+        self._concurrency = concurrency
+        self._take_lock = threading.Lock()
+        self._next_sequence = 0
+        self._waiting_lock = threading.Lock()
+        self._waiting_producers = []
+
+    def give(self, obj):
+        super().give(obj)
+        self._scheduler.schedule(self)
+
+    def try_give(self, obj):
+        """
+        Give an object for processing to this consumer if it can be buffered without waiting.
+
+        :param obj: any
+        :return: False if the buffer is full and the overflow policy is OVERFLOW_BLOCK. True otherwise
+        """
+        if self._overflow_policy != OVERFLOW_BLOCK:
+            self.give(obj)
+            return True
+        if not self._buffer.try_put((time.monotonic(), obj)):
+            return False
+        if self._metrics is not None:
+            self._metrics.record_in()
+        self._scheduler.schedule(self)
+        return True
+
+    def wait_for_space(self, producer):
+        """
+        Schedule a producer once this consumer takes objects from its buffer.
+
+        :param producer: A scheduled producer whose try_give failed
+        """
+        with self._waiting_lock:
+            self._waiting_producers.append(producer)
+        # space may have been freed since the producer's try_give
+        if len(self._buffer) < self._buffer.get_capacity():
+            self._wake_waiting_producers()
+
+    def get_concurrency(self):
+        return self._concurrency
+
+    def start(self):
+        self._running = True
+        self._scheduler.schedule(self)
+
+    def stop(self):
+        self._running = False
+
+    def _has_work(self):
+        return self._running and len(self._buffer) != 0
+
+    def _run_turn(self, max_items):
+        """
+        Process up to max_items objects from the buffer, without waiting for objects.
+
+        :param max_items: The quantum of the scheduler
+        """
+        processed = 0
+        while self._running and processed < max_items and self._can_take():
+            with self._take_lock:
+                items = self._take_available()
+                if len(items) == 0:
+                    return
+                sequence = self._next_sequence
+                self._next_sequence += 1
+            self._wake_waiting_producers()
+            if self._batch_size == 1:
+                objs = [self._run_process(items[0])]
+            else:
+                objs = self._run_process_batch(items)
+            self._deliver(sequence, objs)
+            processed += len(items)
+
+    def _can_take(self):
+        """
+        :return: Whether the consumer may take more objects in this turn
+        """
+        return True
+
+    def _deliver(self, sequence, objs):
+        """
+        Handle the results of the process.
+
+        :param sequence: The position in input order of the items, or batch of items, producing the results
+        :param objs: A list with the results of the process
+        """
+        pass
+
+    def _take_available(self):
+        """
+        Take up to batch_size fresh objects from the buffer, without waiting.
+
+        :return: A list of any. Empty if no fresh objects are buffered
+        """
+        try:
+            entries = self._buffer.get_many(self._batch_size, timeout=0)
+        except queue.Empty:
+            return []
+        if self._metrics is not None:
+            self._metrics.record_starved(0.0, len(self._buffer))
+        objs = [obj for given_at, obj in entries if self._is_fresh(given_at)]
+        if len(objs) != len(entries):
+            with self._counter_lock:
+                self._expired_count += len(entries) - len(objs)
+        return objs
+
+    def _wake_waiting_producers(self):
+        # a producer registering concurrently checks for space itself once registered
+        if len(self._waiting_producers) == 0:
+            return
+        with self._waiting_lock:
+            if len(self._waiting_producers) == 0:
+                return
+            producers = self._waiting_producers
+            self._waiting_producers = []
+        for producer in producers:
+            producer._on_space()
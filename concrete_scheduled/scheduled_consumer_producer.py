@@ -0,0 +1,63 @@
+import threading
+
+from abstracts_interfaces.abstract_consumer import AbstractConsumer
+from abstracts_interfaces.abstract_producer import AbstractProducer
+from abstracts_interfaces.process import Process
+from concrete_scheduled.scheduled_consumer import ScheduledConsumer
+from concrete_scheduled.scheduled_producer import ScheduledProducerMixin
+from concrete_scheduled.stage_scheduler import StageScheduler
+
+
+class ScheduledConsumerProducer(ScheduledConsumer, ScheduledProducerMixin, AbstractProducer):
+    """
+    Models a consumer/producer run by the workers of a StageScheduler instead of threads of its own.
+
+    Can be chained with any other consumer, in place of a ThreadedConsumerProducer. Results are given
+    to the consumer in the order the items were taken from the buffer, even with a concurrency greater
+    than 1. While the consumer is full, no more items are taken.
+    """
+
+    def __init__(self, buffer_size, consumer: AbstractConsumer, process: Process, scheduler: StageScheduler,
+                 concurrency=1) -> None:
+        """
+        Initializes the consumer/producer.
+
+        :param buffer_size: The consumption buffer size
+        :param consumer: The consumer of the items produced
+        :param process: A Process. Must be thread-safe if concurrency is greater than 1
+        :param scheduler: The StageScheduler that runs this consumer/producer
+        :param concurrency: The maximum number of workers running this consumer/producer at once
+        """
+        ScheduledConsumer.__init__(self, buffer_size, process, scheduler, concurrency)
+        AbstractProducer.__init__(self, consumer, process)
+        self._init_outbox()
+        self._delivery_lock = threading.Lock()
+        self._next_delivery = 0
+        self._pending_results = {}
+
+    def start(self):
+        self._consumer.start()
+        super().start()
+
+    def set_consumer(self, consumer):
+        super().set_consumer(consumer)
+
+    def _has_work(self):
+        if not self._running or self._blocked:
+            return False
+        return len(self._outbox) != 0 or len(self._buffer) != 0
+
+    def _run_turn(self, max_items):
+        if self._flush_outbox():
+            super()._run_turn(max_items)
+
+    def _can_take(self):
+        return not self._blocked
+
+    def _deliver(self, sequence, objs):
+        with self._delivery_lock:
+            self._pending_results[sequence] = objs
+            while self._next_delivery in self._pending_results:
+                self._outbox.extend(self._pending_results.pop(self._next_delivery))
+                self._next_delivery += 1
+        self._flush_outbox()
@@ -0,0 +1,105 @@
+import collections
+import threading
+
+from abstracts_interfaces.abstract_consumer import AbstractConsumer
+from abstracts_interfaces.abstract_producer import AbstractProducer
+from abstracts_interfaces.process import Process
+from concrete_scheduled.stage_scheduler import StageScheduler
+
+
+class ScheduledProducerMixin:
+    """
+    Gives the objects of an AbstractProducer to its consumer without blocking a worker of the scheduler.
+
+    Objects wait in an outbox, in order. If the consumer is scheduled and its buffer is full, the producer
+    stops, and the consumer schedules it again once it frees space. Other consumers are given objects
+    with give, which may block the worker as it would block a thread.
+    """
+
+    def _init_outbox(self):
+        self._outbox = collections.deque()
+        self._outbox_lock = threading.Lock()
+        self._blocked = False
+
+    def _flush_outbox(self):
+        """
+        Give the objects of the outbox to the consumer, in order, until the consumer is full.
+
+        :return: Whether the outbox is empty
+        """
+        with self._outbox_lock:
+            try_give = getattr(self._consumer, "try_give", None)
+            while len(self._outbox) != 0:
+                if try_give is None:
+                    self._give_to_consumer(self._outbox[0])
+                elif not try_give(self._outbox[0]):
+                    self._blocked = True
+                    self._consumer.wait_for_space(self)
+                    return False
+                self._outbox.popleft()
+            return True
+
+    def _on_space(self):
+        """
+        Called by the consumer once it freed space in its buffer.
+        """
+        self._blocked = False
+        self._scheduler.schedule(self)
+
+
+class ScheduledProducer(ScheduledProducerMixin, AbstractProducer):
+    """
+    Models a producer run by the workers of a StageScheduler instead of a thread of its own.
+
+    Stays scheduled while it produces, taking its turn with the other stages. Each call of the process
+    occupies a worker, hence processes that wait for their items, e.g. RecorderProcess, are better run
+    by a ThreadedProducer. Stops producing once the process produces None.
+    """
+
+    def __init__(self, consumer: AbstractConsumer, process: Process, scheduler: StageScheduler) -> None:
+        """
+        Initializes a producer.
+
+        :param consumer: A consumer for the items produced
+        :param process: A Process that produces one item at a time
+        :param scheduler: The StageScheduler that runs this producer
+        """
+        super().__init__(consumer, process)
+        self._scheduler = scheduler
+        self._init_outbox()
+
+    def get_concurrency(self):
+        return 1
+
+    def start(self):
+        """
+        Start producing, and start the consumer.
+        """
+        self._running = True
+        self._consumer.start()
+        self._scheduler.schedule(self)
+
+    def stop(self):
+        self._running = False
+
+    def _has_work(self):
+        return self._running and not self._blocked
+
+    def _run_turn(self, max_items):
+        """
+        Produce up to max_items objects, stopping early if the consumer is full.
+
+        :param max_items: The quantum of the scheduler
+        """
+        if not self._flush_outbox():
+            return
+        for _ in range(max_items):
+            if not self._running:
+                return
+            obj = self._run_process()
+            if obj is None:
+                self._running = False
+                return
+            self._outbox.append(obj)
+            if not self._flush_outbox():
+                return
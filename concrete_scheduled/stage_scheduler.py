@@ -0,0 +1,87 @@
+import collections
+import os
+import threading
+import traceback
+
+# the number of items a stage may process before its worker moves on to the next stage
+DEFAULT_QUANTUM = 8
+
+
+class StageScheduler:
+    """
+    Models a fixed pool of worker threads that run the stages of any number of pipelines.
+
+    A stage is scheduled only when it has work, e.g. when an item is given to it. Scheduled stages wait
+    in a single FIFO queue. A worker runs a stage for up to a quantum of items, then schedules it again at
+    the back of the queue if it still has work, so that every stage of every pipeline gets its turn.
+    A stage is never run by more workers at once than its concurrency.
+
+    The threads of the pool are the only threads of the stages, however many stages there are.
+    """
+
+    def __init__(self, workers=None, quantum=DEFAULT_QUANTUM) -> None:
+        """
+        Construct an instance of StageScheduler.
+
+        :param workers: The number of worker threads. Defaults to the number of CPUs
+        :param quantum: The number of items a stage may process per turn
+        """
+        workers = workers if workers is not None else os.cpu_count()
+        if workers < 1:
+            raise ValueError("There must be at least one worker")
+        self.__quantum = quantum
+        self.__lock = threading.Lock()
+        self.__stage_ready = threading.Condition(self.__lock)
+        self.__ready_stages = collections.deque()
+        # stage -> the number of times it is in the queue or being run
+        self.__scheduled_counts = {}
+        self.__running = False
+        self.__threads = [threading.Thread(target=self.__work, daemon=True) for _ in range(workers)]
+
+    def start(self):
+        self.__running = True
+        for thread in self.__threads:
+            thread.start()
+
+    def stop(self):
+        """
+        Stop the workers once they finish the turns they are running.
+        """
+        with self.__lock:
+            self.__running = False
+            self.__stage_ready.notify_all()
+
+    def schedule(self, stage):
+        """
+        Queue a stage for a turn, unless it is already queued or running as often as its concurrency allows.
+
+        :param stage: A scheduled stage
+        """
+        with self.__lock:
+            scheduled_count = self.__scheduled_counts.get(stage, 0)
+            if stage.get_concurrency() <= scheduled_count:
+                return
+            self.__scheduled_counts[stage] = scheduled_count + 1
+            self.__ready_stages.append(stage)
+            self.__stage_ready.notify()
+
+    def __work(self):
+        while True:
+            with self.__lock:
+                while self.__running and len(self.__ready_stages) == 0:
+                    self.__stage_ready.wait()
+                if not self.__running:
+                    return
+                stage = self.__ready_stages.popleft()
+            try:
+                stage._run_turn(self.__quantum)
+            except Exception:
+                # a failing stage must not take a shared worker down with it
+                traceback.print_exc()
+            with self.__lock:
+                self.__scheduled_counts[stage] -= 1
+                if self.__scheduled_counts[stage] == 0:
+                    del self.__scheduled_counts[stage]
+            # work given while the stage was at its concurrency could not schedule it
+            if stage._has_work():
+                self.schedule(stage)
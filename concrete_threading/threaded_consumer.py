@@ -26,12 +26,17 @@ class ThreadedConsumer(AbstractConsumer):
 
     def _consume(self):
         while self._running:
-            self._producer_semaphore.acquire()
-            item = self._buffer.get()
-            self._process.run(item)
-            self._consumer_semaphore.release()
+            if self._batch_size == 1:
+                item = self._take()
+                self._run_process(item)
+            else:
+                items = self._take_batch()
+                self._run_process_batch(items)
 
     def start(self):
+        # several producers may share this consumer, and each starts it
+        if self._running:
+            return
         self._running = True
         self._thread.start()
 
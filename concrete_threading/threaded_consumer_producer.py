@@ -6,24 +6,77 @@ from abstracts_interfaces.process import Process
 
 
 class ThreadedConsumerProducer(AbstractConsumer, AbstractProducer):
-    def __init__(self, buffer_size, consumer: AbstractConsumer, process: Process) -> None:
+    """
+    Models a threaded consumer/producer.
+
+    Several worker threads may consume from the same buffer. Processes run by more than one worker
+    must be thread-safe and concurrent, see Process.is_concurrent. In ordered mode, results are given to the consumer in the order the items
+    were taken from the buffer. Otherwise, results are given as soon as they are produced.
+    """
+
+    def __init__(self, buffer_size, consumer: AbstractConsumer, process: Process, workers=1, ordered=True) -> None:
+        """
+        Initializes the consumer/producer.
+
+        :param buffer_size: The consumption buffer size
+        :param consumer: The consumer of the items produced
+        :param process: A Process
+        :param workers: The number of worker threads. Only 1 if the process is not concurrent
+        :param ordered: Whether results must be given to the consumer in input order
+        """
         AbstractConsumer.__init__(self, buffer_size, process)
         AbstractProducer.__init__(self, consumer, process)
-        self._thread = threading.Thread(target=self._consume, daemon=True)
+        if workers < 1:
+            raise ValueError("There must be at least one worker")
+        if 1 < workers and not process.is_concurrent():
+            raise ValueError("A process that is not concurrent cannot be run by several workers")
+        self._ordered = ordered
+        self._threads = [threading.Thread(target=self._consume, daemon=True) for _ in range(workers)]
+        self._take_lock = threading.Lock()
+        self._delivery_lock = threading.Lock()
+        self._next_sequence = 0
+        self._next_delivery = 0
+        self._pending_results = {}
 
     def _consume(self):
         while self._running:
-            self._producer_semaphore.acquire()
-            item = self._buffer.get()
-            obj = self._process.run(item)
-            self._consumer_semaphore.release()
+            with self._take_lock:
+                items = [self._take()] if self._batch_size == 1 else self._take_batch()
+                sequence = self._next_sequence
+                self._next_sequence += 1
+            if self._batch_size == 1:
+                objs = [self._run_process(items[0])]
+            else:
+                objs = self._run_process_batch(items)
+
+            self._deliver(sequence, objs)
+
+    def _deliver(self, sequence, objs):
+        """
+        Give results to the consumer, after the results of all earlier items if in ordered mode.
 
-            self._consumer.give(obj)
+        :param sequence: The position in input order of the items, or batch of items, producing the results
+        :param objs: A list with the results of the process
+        """
+        if not self._ordered:
+            for obj in objs:
+                self._give_to_consumer(obj)
+            return
+        with self._delivery_lock:
+            self._pending_results[sequence] = objs
+            while self._next_delivery in self._pending_results:
+                for obj in self._pending_results.pop(self._next_delivery):
+                    self._give_to_consumer(obj)
+                self._next_delivery += 1
 
     def start(self):
+        # several producers may share this consumer, and each starts it
+        if self._running:
+            return
         self._running = True
         self._consumer.start()
-        self._thread.start()
+        for thread in self._threads:
+            thread.start()
 
     def stop(self):
         self._running = False
@@ -7,6 +7,8 @@ from abstracts_interfaces.abstract_producer import AbstractProducer
 class ThreadedProducer(AbstractProducer):
     """
     Models a threaded producer.
+
+    Stops producing once the process produces None, e.g. at the end of a recording.
     """
     def __init__(self, consumer: AbstractConsumer, process):
         """
@@ -37,5 +39,8 @@ class ThreadedProducer(AbstractProducer):
         Produce items
         """
         while self._running:
-            obj = self._process.run()
-            self._consumer.give(obj)
+            obj = self._run_process()
+            if obj is None:
+                self._running = False
+                return
+            self._give_to_consumer(obj)
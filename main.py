@@ -1,17 +1,39 @@
+import sys
+
+from abstracts_interfaces.abstract_consumer import OVERFLOW_DROP_OLDEST
 from concrete_threading.threaded_consumer import ThreadedConsumer
 from concrete_threading.threaded_consumer_producer import ThreadedConsumerProducer
 from concrete_threading.threaded_producer import ThreadedProducer
+from processes.file_source_process import FileSourceProcess
 from processes.frequency_extraction_process import FrequencyExtractionProcess
+from processes.latency_reporter_process import LatencyReporterProcess
 from processes.mock_consumer import MockConsumerProcess
 from processes.note_identifier import NoteIdentifierProcess
 from processes.recorder_process import RecorderProcess
+from processes.signal_gate import SignalGate
+from processes.tracing_process import TracingProcess
+
+LATENCY_REPORT_EVERY = 20
 
 
 def main():
-    mock_consumer = ThreadedConsumer(10, MockConsumerProcess())
-    note_identifier = ThreadedConsumerProducer(10, mock_consumer, NoteIdentifierProcess())
-    freq_extractor = ThreadedConsumerProducer(10, note_identifier, FrequencyExtractionProcess())
-    record_producer = ThreadedProducer(freq_extractor, RecorderProcess(2500, 0.5))
+    """
+    Identify notes from the microphone, or from a WAV file replayed in real-time if a path is given.
+    """
+    mock_consumer = ThreadedConsumer(10, LatencyReporterProcess(MockConsumerProcess(),
+                                                                report_every=LATENCY_REPORT_EVERY))
+    note_identifier = ThreadedConsumerProducer(10, mock_consumer,
+                                               TracingProcess(NoteIdentifierProcess(), "note_identifier"))
+    freq_extractor = ThreadedConsumerProducer(10, note_identifier,
+                                              TracingProcess(FrequencyExtractionProcess(gate=SignalGate()),
+                                                             "freq_extractor"))
+    # a stale pitch is useless to a tuner: never make the recorder wait for the extractor
+    freq_extractor.set_overflow_policy(OVERFLOW_DROP_OLDEST)
+    if 1 < len(sys.argv):
+        source = FileSourceProcess(sys.argv[1], 0.5, realtime_factor=1)
+    else:
+        source = RecorderProcess(2500, 0.5, streaming=True)
+    record_producer = ThreadedProducer(freq_extractor, source)
     record_producer.start()
 
 
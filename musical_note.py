@@ -1,6 +1,16 @@
 import math
 
+import numpy as np
+
 DELTA_EQ_TOLERANCE = 0.001
+# the semitone and octave of a missing note in a note array
+NO_NOTE = -1
+# a compact record of a MusicalNote. A missing note has a note and octave of NO_NOTE and a NaN delta
+NOTE_DTYPE = np.dtype([
+    ("note", np.int8),
+    ("octave", np.int8),
+    ("delta", np.float32),
+])
 
 
 class MusicalNote:
@@ -13,12 +23,15 @@ class MusicalNote:
     A5 is given as 0, 5
     C5 is given as 3, 5
     G#3 is given as 11, 3
+
+    Immutable. Notes equal within DELTA_EQ_TOLERANCE of their deltas share their hash.
     """
+    __slots__ = ("_note", "_octave", "_delta")
 
     def __init__(self, note, octave, delta) -> None:
-        self._note = note
-        self._octave = octave
-        self._delta = delta
+        object.__setattr__(self, "_note", note)
+        object.__setattr__(self, "_octave", octave)
+        object.__setattr__(self, "_delta", delta)
 
     def get_note(self):
         return self._note
@@ -29,6 +42,15 @@ class MusicalNote:
     def get_delta(self):
         return self._delta
 
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        return MusicalNote, (self._note, self._octave, self._delta)
+
     def __eq__(self, o) -> bool:
         if o.__class__ != self.__class__:
             return False
@@ -40,6 +62,10 @@ class MusicalNote:
             return False
         return True
 
+    def __hash__(self) -> int:
+        # deltas are only compared within a tolerance, so they cannot be hashed
+        return hash((self._note, self._octave))
+
     def __str__(self) -> str:
         return \
         f"""Musical Note:
@@ -49,5 +75,43 @@ class MusicalNote:
         """
 
 
+def make_note_array(notes, octaves, deltas):
+    """
+    Build a note array from arrays of semitones, octaves and deltas, e.g. those of note_identifier.get_notes.
+
+    :return: An array of NOTE_DTYPE
+    """
+    note_array = np.empty(len(notes), dtype=NOTE_DTYPE)
+    note_array["note"] = notes
+    note_array["octave"] = octaves
+    note_array["delta"] = deltas
+    return note_array
 
 
+def to_note_array(musical_notes):
+    """
+    Store MusicalNotes in a note array.
+
+    Deltas are stored in single precision, well within DELTA_EQ_TOLERANCE.
+    :param musical_notes: A sequence of MusicalNote, or None for missing notes
+    :return: An array of NOTE_DTYPE
+    """
+    note_array = np.empty(len(musical_notes), dtype=NOTE_DTYPE)
+    for i, musical_note in enumerate(musical_notes):
+        if musical_note is None:
+            note_array[i] = (NO_NOTE, NO_NOTE, np.nan)
+        else:
+            note_array[i] = (musical_note.get_note(), musical_note.get_octave(), musical_note.get_delta())
+    return note_array
+
+
+def from_note_array(note_array):
+    """
+    Get the MusicalNotes stored in a note array.
+
+    :param note_array: An array of NOTE_DTYPE
+    :return: A list of MusicalNote, or None for missing notes
+    """
+    return [None if note == NO_NOTE else MusicalNote(note, octave, delta)
+            for note, octave, delta in zip(note_array["note"].tolist(), note_array["octave"].tolist(),
+                                           note_array["delta"].tolist())]
@@ -0,0 +1,120 @@
+"""
+Offline analysis of whole recordings into pitch timelines.
+
+A recording is analysed every hop_size samples, with the same extraction as FrequencyExtractionProcess
+in STFT mode, and each fundamental frequency is identified as a note. The hops are split into chunks
+analysed in parallel by a pool of worker processes. Consecutive chunks overlap by the fft_size - hop_size
+samples their frames share, so the timeline is identical however it is chunked.
+
+Recordings given as files are memory-mapped by every worker, so only the chunk offsets are sent to
+the workers. Recordings given as arrays are sent to the workers chunk by chunk.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from processes.file_source_process import open_samples
+from processes.frequency_extraction_process import FrequencyExtractionProcess, DEFAULT_FFT_SIZE
+from processes.note_identifier import get_notes, DEFAULT_A4_FREQ
+
+PITCH_TIMELINE_DTYPE = np.dtype([
+    ("time", np.float64),
+    ("frequency", np.float64),
+    ("note", np.int8),
+    ("octave", np.int8),
+    ("cents", np.float32),
+])
+DEFAULT_HOP_SIZE = 512
+DEFAULT_CHUNK_HOPS = 4096
+# the number of frames analysed at once, bounding the memory used by the vectorized extraction
+BLOCK_HOPS = 256
+
+
+def get_pitch_timeline(source, sample_rate=None, hop_size=DEFAULT_HOP_SIZE, fft_size=DEFAULT_FFT_SIZE,
+                       workers=None, chunk_hops=DEFAULT_CHUNK_HOPS, A4_frequency=DEFAULT_A4_FREQ, file_kwargs=None,
+                       **extractor_kwargs):
+    """
+    Analyse a whole recording into a pitch timeline, one entry per hop.
+
+    Hops without a fundamental frequency have a frequency of -1, a note and octave of -1 and NaN cents.
+    :param source: The path of a WAV or raw PCM file, or a 1-D array of samples
+    :param sample_rate: The number of samples per second. Required for arrays and raw files
+    :param hop_size: The number of samples between the starts of consecutive frames
+    :param fft_size: The number of samples in a frame
+    :param workers: The number of worker processes. Defaults to the number of CPUs. 1 to analyse in this process
+    :param chunk_hops: The number of hops in each chunk given to a worker
+    :param A4_frequency: The frequency of A4 the notes are identified against
+    :param file_kwargs: Optional. Keyword arguments of open_samples for files, e.g. channel or the raw format
+    :param extractor_kwargs: Further keyword arguments of FrequencyExtractionProcess
+    :return: A structured array of PITCH_TIMELINE_DTYPE: the start time in seconds of each frame, its
+             fundamental frequency, and the note, octave and cents off the note identified
+    """
+    if hop_size <= 0 or chunk_hops <= 0:
+        raise ValueError("hop_size and chunk_hops must be greater than 0")
+    if isinstance(source, (str, os.PathLike)):
+        file_kwargs = {**(file_kwargs or {}), "sample_rate": sample_rate}
+        samples, sample_rate = open_samples(source, **file_kwargs)
+    else:
+        samples = np.asarray(source)
+        if sample_rate is None:
+            raise ValueError("Arrays need a sample_rate")
+    extractor_kwargs = {**extractor_kwargs, "fft_size": fft_size}
+    hop_count = 0 if len(samples) < fft_size else (len(samples) - fft_size) // hop_size + 1
+    chunks = []
+    for first_hop in range(0, hop_count, chunk_hops):
+        chunk_hop_count = min(chunk_hops, hop_count - first_hop)
+        if isinstance(source, (str, os.PathLike)):
+            chunk_source = (source, file_kwargs)
+        else:
+            start = first_hop * hop_size
+            chunk_source = samples[start:start + (chunk_hop_count - 1) * hop_size + fft_size]
+        chunks.append((chunk_source, first_hop, chunk_hop_count, sample_rate, hop_size, A4_frequency,
+                       extractor_kwargs))
+
+    workers = workers if workers is not None else os.cpu_count()
+    if workers == 1 or len(chunks) <= 1:
+        timelines = [_analyse_chunk(chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(min(workers, len(chunks))) as executor:
+            timelines = list(executor.map(_analyse_chunk, chunks))
+    if len(timelines) == 0:
+        return np.empty(0, dtype=PITCH_TIMELINE_DTYPE)
+    return np.concatenate(timelines)
+
+
+def _analyse_chunk(chunk):
+    """
+    Analyse a chunk of hops. Run in the worker processes.
+
+    :param chunk: A tuple: (samples or (path, file kwargs), first hop, hop count, sample rate, hop size,
+                  A4 frequency, FrequencyExtractionProcess kwargs)
+    :return: A structured array of PITCH_TIMELINE_DTYPE
+    """
+    chunk_source, first_hop, hop_count, sample_rate, hop_size, A4_frequency, extractor_kwargs = chunk
+    fft_size = extractor_kwargs["fft_size"]
+    if isinstance(chunk_source, tuple):
+        path, file_kwargs = chunk_source
+        samples, _ = open_samples(path, **file_kwargs)
+        start = first_hop * hop_size
+        samples = samples[start:start + (hop_count - 1) * hop_size + fft_size]
+    else:
+        samples = chunk_source
+    extractor = FrequencyExtractionProcess(**extractor_kwargs)
+    frames = np.lib.stride_tricks.sliding_window_view(samples, fft_size)[::hop_size]
+
+    timeline = np.empty(hop_count, dtype=PITCH_TIMELINE_DTYPE)
+    timeline["time"] = (first_hop + np.arange(hop_count)) * hop_size / sample_rate
+    # silent frames have no fundamental frequency
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for block_start in range(0, hop_count, BLOCK_HOPS):
+            block = frames[block_start:block_start + BLOCK_HOPS]
+            timeline["frequency"][block_start:block_start + len(block)] = \
+                extractor.get_fundamental_frequencies(block, sample_rate)
+    timeline["frequency"][~(0 < timeline["frequency"])] = -1
+
+    semitones, octaves, deltas = get_notes(timeline["frequency"], A4_frequency)
+    timeline["note"] = semitones
+    timeline["octave"] = octaves
+    timeline["cents"] = deltas * 100
+    return timeline
@@ -0,0 +1,154 @@
+import os
+import struct
+
+import numpy as np
+
+from abstracts_interfaces.process import Process
+from processes.pacing import CapturePacer
+from sound_sample import SoundSample
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_IEEE_FLOAT = 0x0003
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+PCM_DTYPES = {8: np.uint8, 16: np.int16, 32: np.int32}
+FLOAT_DTYPES = {32: np.float32, 64: np.float64}
+
+
+class FileSourceProcess(Process):
+    """
+    Models an audio source replaying a recording from a WAV or raw PCM file. A stand-in for RecorderProcess.
+
+    Produces a SoundSample per production cycle. The file is memory-mapped and never read into memory
+    as a whole: the samples of each SoundSample are a read-only view of the mapping, so are only read
+    from disk when accessed. Produces None once the end of the file is reached, unless looping.
+
+    By default samples are produced as fast as requested. Given a real-time factor, production is
+    paced so that samples are produced that many times faster than they would be captured, e.g. 1
+    for real-time.
+    """
+
+    def __init__(self, path, sample_duration=1, realtime_factor=None, loop=False, channel=0,
+                 sample_rate=None, dtype=None, channels=1, offset=0):
+        """
+        Construct an instance of FileSourceProcess.
+
+        Files ending in .wav are read as WAV, with 8, 16 or 32 bit PCM or float samples.
+        Other files are read as raw PCM, described by sample_rate, dtype, channels and offset.
+        :param path: The path of the file
+        :param sample_duration: The duration of each sample produced, in seconds
+        :param realtime_factor: Optional. How many times faster than real-time to produce samples
+        :param loop: Restart from the beginning of the file once the end is reached
+        :param channel: The channel to replay, if the file has several
+        :param sample_rate: Raw files only. The number of samples per second
+        :param dtype: Raw files only. The numpy dtype of the samples
+        :param channels: Raw files only. The number of interleaved channels
+        :param offset: Raw files only. The number of bytes before the first sample
+        """
+        self.__samples, sample_rate = open_samples(path, channel, sample_rate, dtype, channels, offset)
+        self.__sample_rate = sample_rate
+        self.__sample_duration = sample_duration
+        self.__sample_length = int(sample_rate * sample_duration)
+        self.__loop = loop
+        self.__pacer = CapturePacer(sample_duration, realtime_factor)
+        self.__position = 0
+        self.__sequence_number = 0
+        if len(self.__samples) < self.__sample_length and loop:
+            raise ValueError("The file is shorter than a single sample")
+
+    def run(self, _=None):
+        """
+        Produce the next sample.
+
+        :param _: unused
+        :return: A SoundSample. None once the end of the file is reached
+        """
+        if len(self.__samples) < self.__position + self.__sample_length:
+            if not self.__loop:
+                return None
+            self.__position = 0
+        self.__pacer.wait(self.__sequence_number)
+        samples = self.__samples[self.__position:self.__position + self.__sample_length]
+        sound_sample = SoundSample(self.__sample_rate, self.__sample_duration, samples,
+                                   sequence_number=self.__sequence_number)
+        self.__position += self.__sample_length
+        self.__sequence_number += 1
+        return sound_sample
+
+    def get_sample_rate(self):
+        return self.__sample_rate
+
+    def get_sample_count(self):
+        """
+        :return: The number of SoundSamples in the file, not counting a partial one at the end
+        """
+        return len(self.__samples) // self.__sample_length
+
+
+def open_samples(path, channel=0, sample_rate=None, dtype=None, channels=1, offset=0):
+    """
+    Memory-map the samples of a channel of a WAV or raw PCM file.
+
+    Files ending in .wav are read as WAV. Other files are read as raw PCM, described by the remaining arguments.
+    :param path: The path of the file
+    :param channel: The channel to map, if the file has several
+    :param sample_rate: Raw files only. The number of samples per second
+    :param dtype: Raw files only. The numpy dtype of the samples
+    :param channels: Raw files only. The number of interleaved channels
+    :param offset: Raw files only. The number of bytes before the first sample
+    :return: A tuple: (a read-only array view of the samples, the sample rate)
+    """
+    if str(path).lower().endswith(".wav"):
+        sample_rate, dtype, channels, offset, frame_count = _read_wav_header(path)
+    else:
+        if sample_rate is None or dtype is None:
+            raise ValueError("Raw files need a sample_rate and a dtype")
+        frame_count = None
+    if not 0 <= channel < channels:
+        raise ValueError(f"No channel {channel} in a file with {channels} channels")
+    frames = np.memmap(path, dtype=dtype, mode='r', offset=offset,
+                       shape=None if frame_count is None else (frame_count * channels,))
+    frames = frames[:len(frames) - len(frames) % channels].reshape(-1, channels)
+    return frames[:, channel], sample_rate
+
+
+def _read_wav_header(path):
+    """
+    Read the header of a WAV file.
+
+    :param path: The path of the file
+    :return: A tuple: (sample rate, dtype, channels, offset of the data in bytes, frame count)
+    """
+    with open(path, 'rb') as file:
+        riff, _, wave = struct.unpack('<4sI4s', file.read(12))
+        if riff != b'RIFF' or wave != b'WAVE':
+            raise ValueError(f"{path} is not a WAV file")
+        fmt = None
+        while True:
+            chunk_header = file.read(8)
+            if len(chunk_header) < 8:
+                raise ValueError(f"{path} has no data chunk")
+            chunk_id, chunk_size = struct.unpack('<4sI', chunk_header)
+            if chunk_id == b'fmt ':
+                fmt = file.read(chunk_size)
+            elif chunk_id == b'data':
+                if fmt is None:
+                    raise ValueError(f"{path} has no fmt chunk before its data")
+                data_offset = file.tell()
+                break
+            else:
+                file.seek(chunk_size, 1)
+            if chunk_size % 2 == 1:
+                file.seek(1, 1)
+
+    format_tag, channels, sample_rate, _, block_align, bits_per_sample = struct.unpack('<HHIIHH', fmt[:16])
+    if format_tag == WAVE_FORMAT_EXTENSIBLE:
+        format_tag = struct.unpack('<H', fmt[24:26])[0]
+    if format_tag == WAVE_FORMAT_PCM and bits_per_sample in PCM_DTYPES:
+        dtype = PCM_DTYPES[bits_per_sample]
+    elif format_tag == WAVE_FORMAT_IEEE_FLOAT and bits_per_sample in FLOAT_DTYPES:
+        dtype = FLOAT_DTYPES[bits_per_sample]
+    else:
+        raise ValueError(f"Unsupported WAV format in {path}: format {format_tag}, {bits_per_sample} bits")
+    # streamed recordings may leave the size of the data chunk unset
+    data_size = min(chunk_size, os.path.getsize(path) - data_offset)
+    return sample_rate, np.dtype(dtype).newbyteorder('<'), channels, data_offset, data_size // block_align
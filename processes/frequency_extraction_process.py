@@ -3,17 +3,31 @@ This extractor targets frequencies between 16Hz (C0) and 8000Hz (B8)
 
     Rationale:
     1- The consumer is given an array of samples
+        If a SignalGate is given, frames it takes for silence are marked as having no frequency (-1)
+        right away, skipping every following step
     2- The samples are normalized over a 32b range
     3- A Hann window is applied to the samples to improve accuracy, frequency resolution and decrease spectral leakage
+        Windows, frequency-bin tables and interpolation constants are cached per (window type, fft size, dtype)
+        and shared by all the extractors of the same configuration
     4- An FFT is applied to obtain the frequency spectrum
     5- Bins with outlier(right lobe of amplitude distribution only) amplitudes in are selected
         The fundamental frequency plus harmonics resounding over white noise
         with Gaussian distribution are selected by targeting
         amplitudes over a certain z-score coefficient.
         This is applicable since a high signal to noise ratio(SNR) is required
-    6- Given that we are only interested in the fundamental frequency, we select the peak that appears first
+    6- The peaks are the bins above the threshold that are local maxima, optionally filtered by
+        prominence and spacing. Given that we are only interested in the fundamental frequency,
+        we select the peak that appears first
     7- The frequency of the peak is determined using Gaussian interpolation
 
+    By default one frequency is extracted per SoundSample, from its first fft_size samples.
+    If a hop_size is given, the extractor runs in short-time (STFT) mode instead: a frame of fft_size
+    samples is analysed every hop_size samples across the whole SoundSample. The samples left over at the
+    end of a SoundSample are carried over and prepended to the next one, so frames span buffer boundaries.
+
+    A SoundSample of several channels yields one frequency per channel. The channels are analysed
+    together, as the rows of a single vectorized evaluation. STFT mode supports a single channel only.
+
 
     Bibliography:
     Improving FFT resolution, J. Marsar. 2015. http://www.add.ece.ufl.edu/4511/references/ImprovingFFTResoltuion.pdf
@@ -21,15 +35,87 @@ This extractor targets frequencies between 16Hz (C0) and 8000Hz (B8)
     M. Gasior, J.L. Gonzalez. 2004. https://mgasior.web.cern.ch/pap/FFT_resol_note.pdf
 """
 
+import functools
+import inspect
+import threading
+
 import numpy as np
+import scipy.signal as scipy_signal
 import scipy.signal.windows as scipy_win
 
 from abstracts_interfaces.process import Process
+from processes.signal_gate import get_rms
 from sound_sample import SoundSample
 
 # constants:
 DEFAULT_FFT_SIZE = 2048
 DEFAULT_TARGET_Z_SCORE = 3
+DEFAULT_DTYPE = np.float64
+DEFAULT_WINDOW_TYPE = "hann"
+ANALYSIS_TABLES_CACHE_SIZE = 16
+HALF_32B_RANGE = (2 ** 32 - 1) // 2
+
+# numpy >= 2.0 can write the rfft into a preallocated array
+_RFFT_SUPPORTS_OUT = 'out' in inspect.signature(np.fft.rfft).parameters
+
+
+class _AnalysisTables:
+    """
+    The read-only arrays and constants shared by every extractor of the same configuration.
+    """
+    __slots__ = ("window", "bin_frequencies", "freq_resolution_factor")
+
+    def __init__(self, window_type, fft_size, dtype) -> None:
+        self.window = scipy_win.get_window(window_type, fft_size, fftbins=True).astype(dtype)
+        self.window.setflags(write=False)
+        # the frequency of each bin at a sample rate of 1Hz
+        self.bin_frequencies = np.fft.rfftfreq(fft_size).astype(dtype)
+        self.bin_frequencies.setflags(write=False)
+        self.freq_resolution_factor = 1 / fft_size
+
+
+class _ScratchBuffers:
+    """
+    The arrays reused by every frame extracted in one thread, so that extracting a frame allocates no arrays.
+    """
+    __slots__ = ("frame", "spectrum", "amplitudes", "deviations", "peak_mask", "neighbour_mask", "peak_views")
+
+    def __init__(self, fft_size, dtype) -> None:
+        bin_count = fft_size // 2 + 1
+        self.frame = np.zeros(fft_size, dtype=dtype)
+        self.spectrum = np.zeros(bin_count, dtype=np.result_type(dtype, np.complex64))
+        self.amplitudes = np.zeros(bin_count, dtype=dtype)
+        self.deviations = np.zeros(bin_count, dtype=dtype)
+        self.peak_mask = np.zeros(bin_count, dtype=bool)
+        self.neighbour_mask = np.zeros(bin_count - 2, dtype=bool)
+        # views are arrays too: made once, they spare the first peak search from making its own
+        self.peak_views = (self.amplitudes[:-2], self.amplitudes[1:-1], self.amplitudes[2:], self.peak_mask[1:-1])
+
+
+@functools.lru_cache(maxsize=ANALYSIS_TABLES_CACHE_SIZE)
+def _get_analysis_tables(window_type, fft_size, dtype):
+    """
+    Get the analysis tables of a configuration, building them only if they are not cached.
+
+    The least recently used configurations are evicted once more than ANALYSIS_TABLES_CACHE_SIZE are in use.
+
+    :param window_type: The name of a scipy window, or a tuple of the name and its parameters
+    :param fft_size: The number of samples in the fft
+    :param dtype: A numpy dtype
+    :return: An _AnalysisTables
+    """
+    return _AnalysisTables(window_type, fft_size, dtype)
+
+
+def _gaussian_delta(previous, peak, following):
+    """
+    Evaluate the offset, in bins, of the true peak from the peak bin given the amplitudes around it.
+
+    Works element-wise on arrays.
+    """
+    top = np.log(following / previous)
+    bottom = 2 * np.log(peak ** 2 / (following * previous))
+    return top / bottom
 
 
 def _gaussian_interpolation(amplitudes, target_amplitude, fft_freq_resolution):
@@ -37,81 +123,381 @@ def _gaussian_interpolation(amplitudes, target_amplitude, fft_freq_resolution):
     Interpolate the frequency of the target_amplitude.
 
     :param amplitudes: A list of real numbers
-    :param target_amplitude: The index of the amplitude for which to interpolate the frequency
+    :param target_amplitude: The index of the amplitude for which to interpolate the frequency,
+                             or an array of indexes to interpolate them all at once
     :param fft_freq_resolution: The difference in frequency between each fft bin
-    :return: The frequency of the peak. -1 if 1 <= target_amplitude
+    :return: The frequency of the peak, or an array with the frequency of each peak.
+             -1 where the target does not have a neighbour on both sides
+    """
+    if np.ndim(target_amplitude) == 0:
+        if target_amplitude < 1 or len(amplitudes) - 1 <= target_amplitude:
+            return -1
+        delta = _gaussian_delta(amplitudes[target_amplitude - 1], amplitudes[target_amplitude],
+                                amplitudes[target_amplitude + 1])
+        return fft_freq_resolution * (delta + target_amplitude)
+
+    amplitudes = np.asarray(amplitudes)
+    targets = np.asarray(target_amplitude)
+    valid = (1 <= targets) & (targets < len(amplitudes) - 1)
+    targets = np.clip(targets, 1, len(amplitudes) - 2)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        delta = _gaussian_delta(amplitudes[targets - 1], amplitudes[targets], amplitudes[targets + 1])
+    frequencies = fft_freq_resolution * (delta + targets)
+    frequencies[~valid] = -1
+    return frequencies
+
+
+def _gaussian_interpolation_rows(amplitudes, target_amplitudes, fft_freq_resolution):
+    """
+    Interpolate the frequency of one target amplitude in each row of amplitudes.
+
+    :param amplitudes: A 2-D array of real numbers, one spectrum per row
+    :param target_amplitudes: An array with the index of the target amplitude of each row
+    :param fft_freq_resolution: The difference in frequency between each fft bin
+    :return: An array with the frequency of each peak. -1 where the target has no neighbour on both sides
+    """
+    valid = (1 <= target_amplitudes) & (target_amplitudes < amplitudes.shape[1] - 1)
+    targets = np.clip(target_amplitudes, 1, amplitudes.shape[1] - 2)
+    rows = np.arange(amplitudes.shape[0])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        delta = _gaussian_delta(amplitudes[rows, targets - 1], amplitudes[rows, targets],
+                                amplitudes[rows, targets + 1])
+    frequencies = fft_freq_resolution * (delta + targets)
+    frequencies[~valid] = -1
+    return frequencies
+
+
+def _find_peaks(amplitudes, threshold, min_prominence=None, min_distance=None, mask=None):
+    """
+    Find the local maxima above a threshold.
+
+    Only the bins above the threshold are compared against their neighbours, so the cost grows with
+    the number of candidates rather than the number of bins. The first and last bins are never peaks,
+    since they lack a neighbour on one side.
+
+    :param amplitudes: An array of real numbers
+    :param threshold: The amplitude that peaks must exceed
+    :param min_prominence: Optional. The minimum height of a peak over the lowest contour around it
+    :param min_distance: Optional. The minimum number of bins between peaks; the highest peaks are kept
+    :param mask: Optional. A bool array of the same length to use as scratch space
+    :return: An array with the indexes of the peaks in ascending order
     """
-    if target_amplitude < 1 or len(amplitudes) <= target_amplitude:
-        return -1
+    candidates = np.flatnonzero(np.greater(amplitudes, threshold, out=mask))
+    if len(candidates) != 0 and candidates[0] == 0:
+        candidates = candidates[1:]
+    if len(candidates) != 0 and candidates[-1] == len(amplitudes) - 1:
+        candidates = candidates[:-1]
+    candidate_amplitudes = amplitudes[candidates]
+    # a plateau counts once, at its last bin
+    is_local_maximum = (amplitudes[candidates - 1] <= candidate_amplitudes) & \
+                       (amplitudes[candidates + 1] < candidate_amplitudes)
+    peaks = candidates[is_local_maximum]
 
-    top = np.log(amplitudes[target_amplitude + 1] / amplitudes[target_amplitude - 1])
-    bottom = 2 * np.log(amplitudes[target_amplitude] ** 2 /
-                        (amplitudes[target_amplitude + 1] * amplitudes[target_amplitude - 1]))
-    delta = top / bottom
-    return fft_freq_resolution * (delta + target_amplitude)
+    if min_prominence is not None and len(peaks) != 0:
+        prominences = scipy_signal.peak_prominences(amplitudes, peaks)[0]
+        peaks = peaks[min_prominence <= prominences]
+    if min_distance is not None and 1 < len(peaks):
+        peaks = _space_peaks(amplitudes, peaks, min_distance)
+    return peaks
 
 
-def _normalize_32b(amplitudes):
+def _find_first_peak(buffers, threshold):
+    """
+    Find the first local maximum above a threshold in the amplitude scratch buffer, as _find_peaks would,
+    without allocating any array.
+
+    :param buffers: The _ScratchBuffers holding the amplitudes
+    :param threshold: The amplitude that peaks must exceed
+    :return: The index of the peak. -1 if there are no peaks
+    """
+    previous, amplitudes, following, is_peak = buffers.peak_views
+    np.greater(amplitudes, threshold, out=is_peak)
+    # a plateau counts once, at its last bin
+    np.less_equal(previous, amplitudes, out=buffers.neighbour_mask)
+    np.logical_and(is_peak, buffers.neighbour_mask, out=is_peak)
+    np.less(following, amplitudes, out=buffers.neighbour_mask)
+    np.logical_and(is_peak, buffers.neighbour_mask, out=is_peak)
+    first_peak = int(is_peak.argmax())
+    return first_peak + 1 if is_peak[first_peak] else -1
+
+
+def _space_peaks(amplitudes, peaks, min_distance):
+    """
+    Drop the peaks closer than min_distance to a higher peak.
+
+    :param amplitudes: An array of real numbers
+    :param peaks: An array with the indexes of the peaks in ascending order
+    :param min_distance: The minimum number of bins between peaks
+    :return: An array with the indexes of the remaining peaks in ascending order
+    """
+    keep = np.ones(len(peaks), dtype=bool)
+    for peak in np.argsort(amplitudes[peaks], kind='stable')[::-1]:
+        if not keep[peak]:
+            continue
+        too_close = np.abs(peaks - peaks[peak]) < min_distance
+        too_close[peak] = False
+        keep[too_close] = False
+    return peaks[keep]
+
+
+def _normalize_32b(amplitudes, out=None):
     """
     Increase the amplitudes proportionally to optimize use of 32b range
 
-    :param amplitudes: A list of real numbers
-    :return: A list of real numbers. the normalized amplitudes
+    :param amplitudes: An array of real numbers
+    :param out: An optional float array of the same length to hold the result. May be amplitudes itself
+    :return: An array of real numbers. the normalized amplitudes
     """
-    max_amp = max(amplitudes.max(), abs(amplitudes.min()))
-    half_range = (2 ** 32 - 1) // 2
-    return [(amp / max_amp) * half_range for amp in amplitudes]
+    max_amp = max(float(amplitudes.max()), -float(amplitudes.min()))
+    if out is None:
+        out = np.empty(len(amplitudes), dtype=DEFAULT_DTYPE)
+    # casting in a plain copy first avoids the casting buffers of a mixed-type ufunc
+    np.copyto(out, amplitudes, casting='unsafe')
+    np.divide(out, max_amp, out=out)
+    np.multiply(out, HALF_32B_RANGE, out=out)
+    return out
 
 
 class FrequencyExtractionProcess(Process):
     """
     A consumer that extracts the base frequency in a SoundSample
+
+    May be run by several threads at once, unless it runs in STFT mode or has a gate: both keep state
+    across consecutive SoundSamples, hence must see the SoundSamples of a stream one at a time, in order.
     """
 
     def __init__(self, **kwargs) -> None:
         K_FFT_SIZE = "fft_size"
         K_TARGET_Z_SCORE = "target_z_score"
         K_WINDOW = "window"
+        K_WINDOW_TYPE = "window_type"
+        K_HOP_SIZE = "hop_size"
+        K_DTYPE = "dtype"
+        K_MIN_PROMINENCE = "min_prominence"
+        K_MIN_PEAK_DISTANCE = "min_peak_distance"
+        K_GATE = "gate"
         default_kwargs = {
             K_FFT_SIZE: DEFAULT_FFT_SIZE,
             K_TARGET_Z_SCORE: DEFAULT_TARGET_Z_SCORE,
-            K_WINDOW: scipy_win.hann(DEFAULT_FFT_SIZE, sym=False)
+            K_WINDOW: None,
+            K_WINDOW_TYPE: DEFAULT_WINDOW_TYPE,
+            K_HOP_SIZE: None,
+            K_DTYPE: DEFAULT_DTYPE,
+            K_MIN_PROMINENCE: None,
+            K_MIN_PEAK_DISTANCE: None,
+            K_GATE: None
         }
         kwargs = {**default_kwargs, **kwargs}
         self.__fft_size = kwargs[K_FFT_SIZE]
         self.__target_z_score = kwargs[K_TARGET_Z_SCORE]
-        self.__window = kwargs[K_WINDOW]
+        self.__dtype = np.dtype(kwargs[K_DTYPE])
+        self.__tables = _get_analysis_tables(kwargs[K_WINDOW_TYPE], self.__fft_size, self.__dtype)
+        self.__window = self.__tables.window
+        if kwargs[K_WINDOW] is not None:
+            self.__window = np.asarray(kwargs[K_WINDOW], dtype=self.__dtype)
+            if self.__window.shape != (self.__fft_size,):
+                raise ValueError("The window must be fft_size long")
+        self.__hop_size = kwargs[K_HOP_SIZE]
+        self.__min_prominence = kwargs[K_MIN_PROMINENCE]
+        self.__min_peak_distance = kwargs[K_MIN_PEAK_DISTANCE]
+        # the gate holds the state of a single stream
+        self.__gate = kwargs[K_GATE]
+        if self.__hop_size is not None and self.__hop_size <= 0:
+            raise ValueError("hop_size must be greater than 0")
+        self.__carried_samples = None
+        self.__carried_sample_rate = None
+        self.__pending_skip = 0
+        self.__scratch = threading.local()
 
     def run(self, sound_sample=None):
         """
         Consume from buffer.
+
+        :return: The fundamental frequency. For a multi-channel SoundSample, an array with the fundamental
+                 frequency of each channel. In STFT mode, a list with the fundamental frequency of each hop.
+                 -1 where there is no frequency, e.g. in silence
         """
+        if self.__hop_size is not None:
+            return self.__get_fundamental_frequencies_per_hop(sound_sample)
         return self.__get_fundamental_frequency(sound_sample)
 
-    def __get_amplitude_threshold(self, amplitudes):
+    def is_concurrent(self):
+        return self.__hop_size is None and self.__gate is None
+
+    def get_fft_size(self):
+        return self.__fft_size
+
+    def get_hop_size(self):
+        """
+        :return: The hop size in STFT mode. None otherwise
+        """
+        return self.__hop_size
+
+    def get_gate(self):
+        """
+        :return: The SignalGate, or None if there is none
+        """
+        return self.__gate
+
+    def get_bin_frequencies(self, sample_rate):
+        """
+        Get the frequency of each bin of the spectrum.
+
+        :param sample_rate: The number of samples per second
+        :return: An array of real numbers
+        """
+        return self.__tables.bin_frequencies * sample_rate
+
+    def get_peak_frequencies(self, sound_sample):
+        """
+        Evaluate the frequency of every peak in a sample, not only the fundamental.
+
+        The frequencies of all the peaks are interpolated at once. Useful to inspect the harmonics.
+
+        :param sound_sample: A SoundSample
+        :return: An array with the frequency of each peak, in ascending order. Empty if there are no peaks
+        """
+        amplitudes, peaks = self.__get_frame_peaks(sound_sample.get_samples()[:self.__fft_size])
+        if peaks[0] == -1:
+            return np.empty(0)
+        return _gaussian_interpolation(amplitudes, np.asarray(peaks),
+                                       self.__get_fft_freq_resolution(sound_sample.get_sample_rate()))
+
+    def run_batch(self, sound_samples):
+        """
+        Extract the base frequency of many SoundSamples at once.
+
+        The SoundSamples must share their sample rate. Extraction runs on the first fft_size samples of each,
+        zero-padded if shorter, as in run. Each channel of a multi-channel SoundSample is evaluated as a frame of
+        its own. If there is a gate, the SoundSamples must be consecutive single channel samples of one stream.
+
+        In STFT mode, the SoundSamples are run one by one as in run, in order.
+
+        :param sound_samples: A list of SoundSample
+        :return: An array with the fundamental frequency of each SoundSample, in order.
+                 If any SoundSample is multi-channel, a list with what run gives for each SoundSample instead
+        """
+        if self.__hop_size is not None:
+            return super().run_batch(sound_samples)
+        if len(sound_samples) == 0:
+            return np.empty(0)
+        sample_rate = sound_samples[0].get_sample_rate()
+        if any(sound_sample.get_sample_rate() != sample_rate for sound_sample in sound_samples):
+            raise ValueError("All SoundSamples in a batch must share their sample rate")
+        # one row per channel
+        sample_rows = [np.atleast_2d(sound_sample.get_samples()[:self.__fft_size].T) for sound_sample in sound_samples]
+        is_multi_channel = any(np.ndim(sound_sample.get_samples()) == 2 for sound_sample in sound_samples)
+        if is_multi_channel and self.__gate is not None:
+            raise ValueError("A gate cannot be applied to multi-channel SoundSamples")
+        frames = np.zeros((sum(len(rows) for rows in sample_rows), self.__fft_size), dtype=self.__dtype)
+        frame_lengths = np.empty(len(frames))
+        row = 0
+        for rows in sample_rows:
+            frames[row:row + len(rows), :rows.shape[1]] = rows
+            frame_lengths[row:row + len(rows)] = rows.shape[1]
+            row += len(rows)
+        if is_multi_channel:
+            frequencies = self.get_fundamental_frequencies(frames, sample_rate)
+            row_ends = np.cumsum([len(rows) for rows in sample_rows])
+            return [channel_frequencies if np.ndim(sound_sample.get_samples()) == 2 else float(channel_frequencies[0])
+                    for sound_sample, channel_frequencies in zip(sound_samples, np.split(frequencies, row_ends[:-1]))]
+        durations = [sound_sample.get_sample_duration() for sound_sample in sound_samples]
+        # the gate hears the frames without their padding, as in run
+        rms_values = np.sqrt(np.einsum('ij,ij->i', frames, frames) / frame_lengths)
+        return self.__get_gated_frequencies(frames, sample_rate, durations, rms_values)
+
+    def get_fundamental_frequencies(self, frames, sample_rate):
+        """
+        Evaluate the fundamental frequency of each frame in a 2-D array of frames.
+
+        Every step runs vectorized along the rows of the array. The gate is not applied.
+
+        :param frames: A 2-D array of samples, one frame per row
+        :param sample_rate: The number of samples per second
+        :return: An array of doubles, the fundamental frequency of each frame
+        """
+        frames = np.asarray(frames, dtype=self.__dtype)
+        max_amplitudes = np.abs(frames).max(axis=1, keepdims=True)
+        normalized_frames = frames / max_amplitudes * HALF_32B_RANGE
+        windowed_frames = normalized_frames * self.__window
+        amplitudes = np.abs(np.fft.rfft(windowed_frames, n=self.__fft_size, axis=1))
+        amplitudes[:, 1:] *= 2
+        thresholds = self.__target_z_score * amplitudes.std(axis=1) + amplitudes.mean(axis=1)
+        if self.__min_prominence is not None or self.__min_peak_distance is not None:
+            first_peaks = np.array([self.__select_peaks(row)[0] for row in amplitudes])
+        else:
+            inner_amplitudes = amplitudes[:, 1:-1]
+            is_peak = (thresholds[:, np.newaxis] < inner_amplitudes) & \
+                      (amplitudes[:, :-2] <= inner_amplitudes) & (amplitudes[:, 2:] < inner_amplitudes)
+            first_peaks = is_peak.argmax(axis=1) + 1
+            first_peaks[~is_peak.any(axis=1)] = -1
+        return _gaussian_interpolation_rows(amplitudes, first_peaks, self.__get_fft_freq_resolution(sample_rate))
+
+    def reset(self):
+        """
+        Discard the samples carried over from the previous SoundSample in STFT mode, and the state of the gate.
+        """
+        self.__carried_samples = None
+        self.__carried_sample_rate = None
+        self.__pending_skip = 0
+        if self.__gate is not None:
+            self.__gate.reset()
+
+    def __getstate__(self):
+        # scratch buffers are per thread, hence not copied along with the extractor
+        state = self.__dict__.copy()
+        del state["_FrequencyExtractionProcess__scratch"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__scratch = threading.local()
+
+    def __get_scratch_buffers(self):
+        """
+        Get the scratch buffers of the calling thread, allocating them on first use.
+
+        Each thread has its own, so that an extractor can be run by several threads at once, if is_concurrent.
+
+        :return: A _ScratchBuffers
+        """
+        buffers = getattr(self.__scratch, "buffers", None)
+        if buffers is None:
+            buffers = _ScratchBuffers(self.__fft_size, self.__dtype)
+            self.__scratch.buffers = buffers
+        return buffers
+
+    def __get_amplitude_threshold(self, amplitudes, deviations=None):
         """
         Evaluate a threshold for the amplitudes.
 
         The assumption is that the source of interest is recorded over noise with a Gaussian distribution
         :param amplitudes: A list of amplitudes
+        :param deviations: An optional scratch array of the same length, to compute the deviation in place
         :return: the threshold
         """
-        mean = np.mean(amplitudes)
-        sd = np.std(amplitudes)
+        amplitudes = np.asarray(amplitudes)
+        mean = amplitudes.mean()
+        if deviations is None:
+            deviations = np.empty(len(amplitudes))
+        np.subtract(amplitudes, mean, out=deviations)
+        np.multiply(deviations, deviations, out=deviations)
+        sd = np.sqrt(deviations.mean())
         return self.__target_z_score * sd + mean
 
-    def __select_peaks(self, amplitudes):
+    def __select_peaks(self, amplitudes, deviations=None, peak_mask=None):
         """
         Select the indexes of the peak amplitudes
 
-        :param amplitudes: A list of tuples: (freq, amp)
-        :return: The peaks.  A list of tuples: (freq, amp)
+        :param amplitudes: A list of amplitudes
+        :param deviations: An optional scratch float array of the same length
+        :param peak_mask: An optional scratch bool array of the same length
+        :return: The peaks. An array of indexes. [-1] if there are no peaks
         """
-        amplitude_threshold = self.__get_amplitude_threshold(amplitudes)
-        peaks = []
-        for fft_bin in range(0, len(amplitudes)):
-            if amplitude_threshold < amplitudes[fft_bin]:
-                peaks.append(fft_bin)
+        amplitudes = np.asarray(amplitudes)
+        amplitude_threshold = self.__get_amplitude_threshold(amplitudes, deviations)
+        peaks = _find_peaks(amplitudes, amplitude_threshold, self.__min_prominence, self.__min_peak_distance,
+                            peak_mask)
         if len(peaks) == 0:
             return [-1]
         return peaks
@@ -132,25 +518,29 @@ class FrequencyExtractionProcess(Process):
         :param sample_rate: The number of samples per second
         :return: a real number
         """
-        return sample_rate / self.__fft_size
+        return sample_rate * self.__tables.freq_resolution_factor
 
     def __window_samples(self, amplitudes):
         """
-        Apply a window to the given sample
+        Apply the window to the given sample in place
 
-        :param amplitudes: A list of real numbers
+        :param amplitudes: An array of fft_size real numbers
         """
-        return amplitudes * self.__window
+        return np.multiply(amplitudes, self.__window, out=amplitudes)
 
-    def __get_spectrum(self, samples):
+    def __get_spectrum(self, samples, buffers):
         """
-        Get the frequency spectrum of the sample
+        Get the frequency spectrum of the sample, into the amplitude scratch buffer
 
-        :return: A list of real numbers, the values of amplitude across frequency in an instant
+        :param buffers: The _ScratchBuffers of the calling thread
+        :return: An array of real numbers, the values of amplitude across frequency in an instant
         """
-        complex_amplitudes = np.fft.rfft(samples, n=self.__fft_size)
-        complex_amplitudes[1:] = 2 * complex_amplitudes[1:]
-        real_amplitudes = np.abs(complex_amplitudes)
+        if _RFFT_SUPPORTS_OUT:
+            np.fft.rfft(samples, n=self.__fft_size, out=buffers.spectrum)
+        else:
+            buffers.spectrum[:] = np.fft.rfft(samples, n=self.__fft_size)
+        real_amplitudes = np.abs(buffers.spectrum, out=buffers.amplitudes)
+        np.multiply(real_amplitudes[1:], 2, out=real_amplitudes[1:])
         return real_amplitudes
 
     def __get_fundamental_frequency(self, sound_sample: SoundSample):
@@ -161,10 +551,141 @@ class FrequencyExtractionProcess(Process):
         :return: A double, The fundamental frequency
         """
         samples = sound_sample.get_samples()
-        cropped_samples = samples[:DEFAULT_FFT_SIZE]
-        normalized_samples = _normalize_32b(cropped_samples)
-        windowed_samples = self.__window_samples(normalized_samples)
-        amplitudes = self.__get_spectrum(windowed_samples)
-        peaks = self.__select_peaks(amplitudes)
-        return _gaussian_interpolation(amplitudes, peaks[0],
-                                       self.__get_fft_freq_resolution(sound_sample.get_sample_rate()))
+        cropped_samples = samples[:self.__fft_size]
+        if np.ndim(cropped_samples) == 2:
+            if self.__gate is not None:
+                raise ValueError("A gate cannot be applied to multi-channel SoundSamples")
+            return self.__get_channel_frequencies(cropped_samples, sound_sample.get_sample_rate())
+        return self.__get_frame_frequency(cropped_samples, sound_sample.get_sample_rate(),
+                                          sound_sample.get_sample_duration())
+
+    def __get_channel_frequencies(self, samples, sample_rate):
+        """
+        Evaluate the fundamental frequency of each channel of a multi-channel sample.
+
+        :param samples: A 2-D array of at most fft_size samples, one column per channel
+        :param sample_rate: The number of samples per second
+        :return: An array of doubles, the fundamental frequency of each channel
+        """
+        frames = samples.T
+        if len(samples) < self.__fft_size:
+            frames = np.zeros((samples.shape[1], self.__fft_size), dtype=self.__dtype)
+            frames[:, :len(samples)] = samples.T
+        return self.get_fundamental_frequencies(frames, sample_rate)
+
+    def __get_fundamental_frequencies_per_hop(self, sound_sample: SoundSample):
+        """
+        Evaluate the fundamental frequency of every hop in a sample, continuing from the carried over samples.
+
+        :param sound_sample: A SoundSample
+        :return: A list of doubles, the fundamental frequency of each hop in order
+        """
+        sample_rate = sound_sample.get_sample_rate()
+        samples = sound_sample.get_samples()
+        if np.ndim(samples) != 1:
+            raise ValueError("STFT mode supports single channel SoundSamples only")
+        remaining_skip = 0
+        if self.__carried_samples is not None and self.__carried_sample_rate == sample_rate:
+            # a skip longer than the sample consumes all of it, and the rest of the skip applies to the next
+            remaining_skip = max(0, self.__pending_skip - len(samples))
+            samples = np.concatenate((self.__carried_samples, samples[self.__pending_skip:]))
+        frequencies = []
+        frame_start = 0
+        if self.__fft_size <= len(samples):
+            frames = np.lib.stride_tricks.sliding_window_view(samples, self.__fft_size)[::self.__hop_size]
+            frequencies = self.__get_gated_frequencies(frames, sample_rate, self.__hop_size / sample_rate).tolist()
+            frame_start = len(frames) * self.__hop_size
+        self.__carried_samples = samples[frame_start:]
+        self.__carried_sample_rate = sample_rate
+        # a hop larger than the frame may jump past the end of the samples
+        self.__pending_skip = remaining_skip + max(0, frame_start - len(samples))
+        return frequencies
+
+    def __get_gated_frequencies(self, frames, sample_rate, durations, rms_values=None):
+        """
+        Evaluate the fundamental frequency of each consecutive frame the gate lets through.
+
+        :param frames: A 2-D array of samples, one frame per row
+        :param sample_rate: The number of samples per second
+        :param durations: The time from the previous frame to each frame, in seconds. A single value if all alike
+        :param rms_values: Optional. The RMS of each frame, if not that of the whole row
+        :return: An array of doubles, the fundamental frequency of each frame. -1 for the frames gated out
+        """
+        if self.__gate is None:
+            return self.get_fundamental_frequencies(frames, sample_rate)
+        if rms_values is None:
+            rms_values = get_rms(frames)
+        is_open = self.__gate.update_many(rms_values, durations)
+        frequencies = np.full(len(frames), -1.0)
+        if is_open.any():
+            frequencies[is_open] = self.get_fundamental_frequencies(frames[is_open], sample_rate)
+        return frequencies
+
+    def __get_frame_frequency(self, frame, sample_rate, duration):
+        """
+        Evaluate the fundamental frequency of a single frame, unless the gate takes it for silence.
+
+        :param frame: An array of samples, at most fft_size long
+        :param sample_rate: The number of samples per second
+        :param duration: The time from the previous frame, in seconds
+        :return: A double, The fundamental frequency. -1 if the frame is gated out
+        """
+        buffers = self.__get_scratch_buffers()
+        frame = self.__load_frame(frame, buffers)
+        if self.__gate is not None and not self.__gate.update(np.sqrt(np.dot(frame, frame) / len(frame)), duration):
+            return -1
+        amplitudes = self.__get_loaded_frame_spectrum(frame, buffers)
+        if self.__min_prominence is None and self.__min_peak_distance is None:
+            first_peak = _find_first_peak(buffers, self.__get_amplitude_threshold(amplitudes, buffers.deviations))
+        else:
+            first_peak = self.__select_peaks(amplitudes, buffers.deviations, buffers.peak_mask)[0]
+        return _gaussian_interpolation(amplitudes, first_peak, self.__get_fft_freq_resolution(sample_rate))
+
+    def __get_frame_peaks(self, frame):
+        """
+        Evaluate the spectrum of a single frame and find its peaks.
+
+        :param frame: An array of samples, at most fft_size long
+        :return: A tuple: (amplitudes, peaks).
+                 The amplitudes are only valid until the thread evaluates the next frame
+        """
+        buffers = self.__get_scratch_buffers()
+        return self.__get_loaded_frame_peaks(self.__load_frame(frame, buffers), buffers)
+
+    def __load_frame(self, frame, buffers):
+        """
+        Copy a single frame into the frame scratch buffer, zero-padded to fft_size.
+
+        :param frame: An array of samples, at most fft_size long
+        :param buffers: The _ScratchBuffers of the calling thread
+        :return: The part of the scratch buffer holding the frame
+        """
+        buffers.frame[len(frame):] = 0
+        loaded_frame = buffers.frame[:len(frame)]
+        # casting in a plain copy first avoids the casting buffers of a mixed-type ufunc
+        np.copyto(loaded_frame, frame, casting='unsafe')
+        return loaded_frame
+
+    def __get_loaded_frame_peaks(self, loaded_frame, buffers):
+        """
+        Evaluate the spectrum of the frame in the frame scratch buffer and find its peaks.
+
+        :param loaded_frame: The part of the scratch buffer holding the frame, as given by __load_frame
+        :param buffers: The _ScratchBuffers of the calling thread
+        :return: A tuple: (amplitudes, peaks).
+                 The amplitudes are only valid until the thread evaluates the next frame
+        """
+        amplitudes = self.__get_loaded_frame_spectrum(loaded_frame, buffers)
+        return amplitudes, self.__select_peaks(amplitudes, buffers.deviations, buffers.peak_mask)
+
+    def __get_loaded_frame_spectrum(self, loaded_frame, buffers):
+        """
+        Evaluate the spectrum of the frame in the frame scratch buffer, into the amplitude scratch buffer.
+
+        :param loaded_frame: The part of the scratch buffer holding the frame, as given by __load_frame
+        :param buffers: The _ScratchBuffers of the calling thread
+        :return: The amplitudes. Only valid until the thread evaluates the next frame
+        """
+        _normalize_32b(loaded_frame, out=loaded_frame)
+        windowed_samples = self.__window_samples(buffers.frame)
+        return self.__get_spectrum(windowed_samples, buffers)
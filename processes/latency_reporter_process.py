@@ -0,0 +1,85 @@
+import collections
+import time
+
+import numpy as np
+
+from abstracts_interfaces.process import Process
+from traced_result import TracedResult
+
+DEFAULT_WINDOW = 1000
+DISPLAY_STAGE = "display"
+PERCENTILES = (50, 95, 99)
+
+
+class LatencyReporterProcess(Process):
+    """
+    A sink that measures the latency from capture to display of TracedResults.
+
+    Each result is displayed by the wrapped process, after which its total latency and the latency of
+    each stage are recorded. Percentiles are computed over the most recent results.
+    """
+
+    def __init__(self, display_process: Process = None, window=DEFAULT_WINDOW, report_every=None):
+        """
+        Construct an instance of LatencyReporterProcess.
+
+        :param display_process: Optional. The Process that displays the values of the results
+        :param window: The number of most recent results the percentiles are computed over
+        :param report_every: Optional. Print a summary every report_every results
+        """
+        self.__display_process = display_process
+        self.__report_every = report_every
+        self.__totals = collections.deque(maxlen=window)
+        self.__stage_latencies = collections.OrderedDict()
+        self.__window = window
+        self.__count = 0
+
+    def run(self, traced_result: TracedResult = None):
+        if self.__display_process is not None:
+            self.__display_process.run(traced_result.get_value())
+        displayed_at = time.monotonic()
+        self.__totals.append(displayed_at - traced_result.get_capture_time())
+        latencies = traced_result.derive(None, DISPLAY_STAGE, displayed_at).get_stage_latencies()
+        for stage_name, latency in latencies:
+            if stage_name not in self.__stage_latencies:
+                self.__stage_latencies[stage_name] = collections.deque(maxlen=self.__window)
+            self.__stage_latencies[stage_name].append(latency)
+        self.__count += 1
+        if self.__report_every is not None and self.__count % self.__report_every == 0:
+            print(format_latency_summary(self.get_latency_summary()))
+
+    def get_latency_summary(self):
+        """
+        Get the latency percentiles over the most recent results.
+
+        :return: A dict: {"count": int, "total": {percentile: seconds}, "stages": {stage name: {percentile: seconds}}}
+        """
+        return {
+            "count": self.__count,
+            "total": _get_percentiles(self.__totals),
+            "stages": {stage_name: _get_percentiles(latencies)
+                       for stage_name, latencies in self.__stage_latencies.items()},
+        }
+
+
+def _get_percentiles(latencies):
+    if len(latencies) == 0:
+        return {percentile: 0.0 for percentile in PERCENTILES}
+    values = np.percentile(np.fromiter(latencies, dtype=float, count=len(latencies)), PERCENTILES)
+    return dict(zip(PERCENTILES, values.tolist()))
+
+
+def format_latency_summary(summary):
+    """
+    Format a latency summary in milliseconds.
+
+    :param summary: A dict from LatencyReporterProcess.get_latency_summary
+    :return: A str
+    """
+    def format_percentiles(percentiles):
+        return " ".join(f"p{percentile} {seconds * 1e3:.1f}ms" for percentile, seconds in percentiles.items())
+
+    lines = [f"LATENCY over {summary['count']} results: {format_percentiles(summary['total'])}"]
+    for stage_name, percentiles in summary["stages"].items():
+        lines.append(f"    {stage_name}: {format_percentiles(percentiles)}")
+    return "\n".join(lines)
@@ -1,12 +1,24 @@
+import bisect
+import functools
 import math
 
+import numpy as np
+
 from abstracts_interfaces.process import Process
-from musical_note import MusicalNote
+from musical_note import MusicalNote, NO_NOTE
 
 SEMITONE_FREQ_RATIO = math.pow(2, 1 / 12)
+# the vectorized paths use np.log, which may differ from the math.log of get_note in the last bit
+LOG_SEMITONE_FREQ_RATIO = math.log(SEMITONE_FREQ_RATIO)
 SEMITONES_IN_SCALE = 12
 INITIAL_OCTAVE = 4
 DEFAULT_A4_FREQ = 440
+# the offset in cents of each note from equal temperament, indexed by semitones from A
+EQUAL_TEMPERAMENT = (0,) * SEMITONES_IN_SCALE
+# the range of the note tables, in semitones from A4: C0 to B8
+NOTE_TABLE_LOWEST_NOTE = -57
+NOTE_TABLE_HIGHEST_NOTE = 50
+NOTE_TABLE_CACHE_SIZE = 8
 
 
 def get_semitone_diff(freq, reference_freq):
@@ -25,12 +37,12 @@ def get_note(freq, A4_frequency):
     """
     Get a MusicalNote for a given frequency.
 
-    :param freq: a double greater than 0
+    :param freq: a double
     :param A4_frequency: The frequency of A4
-    :return: a MusicalNote
+    :return: a MusicalNote. None if freq is not greater than 0, as get_notes gives no note
     """
-    if freq < 0:
-        return
+    if freq <= 0:
+        return None
 
     semitones_diff = get_semitone_diff(freq, A4_frequency)
     octave = INITIAL_OCTAVE
@@ -55,6 +67,190 @@ def get_note(freq, A4_frequency):
     return MusicalNote(semitones_diff, octave, delta)
 
 
+def get_notes(freqs, A4_frequency):
+    """
+    Get the note of each frequency in an array, following the same rules as get_note.
+
+    The deltas may differ from those of get_note in the last bits, as np.log may differ from math.log.
+
+    Frequencies that are not greater than 0, e.g. -1 for "no pitch", have no note.
+    :param freqs: an array of doubles
+    :param A4_frequency: The frequency of A4
+    :return: A tuple of arrays: (semitones from A, octaves, deltas).
+             Frequencies without a note have a semitone and octave of NO_NOTE and a NaN delta
+    """
+    freqs = np.asarray(freqs, dtype=np.float64)
+    has_note = 0 < freqs
+    semitones_diff = np.log(np.where(has_note, freqs, A4_frequency) / A4_frequency) / LOG_SEMITONE_FREQ_RATIO
+    full_octaves_from_A4 = np.trunc(semitones_diff / SEMITONES_IN_SCALE)
+    octaves = INITIAL_OCTAVE + full_octaves_from_A4.astype(np.int64)
+    semitones_diff -= full_octaves_from_A4 * SEMITONES_IN_SCALE
+    below_A = semitones_diff < 0
+    octaves -= below_A
+    semitones_diff[below_A] += SEMITONES_IN_SCALE
+
+    semitones = np.trunc(semitones_diff)
+    deltas = semitones_diff - semitones
+    semitones = semitones.astype(np.int64)
+    rounded_up = 0.5 < deltas
+    deltas[rounded_up] -= 1
+    semitones += rounded_up
+
+    octaves += 3 <= semitones
+    semitones[semitones == SEMITONES_IN_SCALE] = 0
+
+    semitones[~has_note] = NO_NOTE
+    octaves[~has_note] = NO_NOTE
+    deltas[~has_note] = np.nan
+    return semitones, octaves, deltas
+
+
+def _get_note_index(semitones, octaves):
+    """
+    :return: The number of semitones from A4 of notes given as semitones from A and octaves
+    """
+    return semitones + SEMITONES_IN_SCALE * (octaves - INITIAL_OCTAVE - (3 <= semitones))
+
+
+class NoteTable:
+    """
+    A sorted table of the frequencies at which one note ends and the next begins, for one A4 frequency
+    and temperament, from C0 to B8.
+
+    A frequency is identified by searching the table for its note, then evaluating only its delta from
+    the note. Frequencies outside the table are moved into it by whole octaves, which is exact.
+
+    Ties between two notes go to the lower note. In equal temperament, the notes of the frequencies within
+    the table are those of get_note, and their deltas may differ from those of get_note in the last bit.
+    """
+
+    def __init__(self, A4_frequency=DEFAULT_A4_FREQ, temperament=EQUAL_TEMPERAMENT) -> None:
+        """
+        Construct an instance of NoteTable.
+
+        :param A4_frequency: The frequency of A4
+        :param temperament: The offset in cents of each note from equal temperament, indexed by semitones from A.
+                            Each within 50 cents
+        """
+        if len(temperament) != SEMITONES_IN_SCALE:
+            raise ValueError(f"A temperament has {SEMITONES_IN_SCALE} offsets")
+        if any(not -50 < offset < 50 for offset in temperament):
+            raise ValueError("The offsets of a temperament must be within 50 cents")
+        self.__A4_frequency = A4_frequency
+        # one extra note on each side to place the outer boundaries
+        note_indices = np.arange(NOTE_TABLE_LOWEST_NOTE - 1, NOTE_TABLE_HIGHEST_NOTE + 2)
+        semitones = note_indices % SEMITONES_IN_SCALE
+        positions = note_indices + np.asarray(temperament, dtype=np.float64)[semitones] / 100
+        boundary_positions = (positions[:-1] + positions[1:]) / 2
+        boundaries = A4_frequency * np.exp(boundary_positions * LOG_SEMITONE_FREQ_RATIO)
+        lower_note_indices = note_indices[:-1]
+        if tuple(temperament) == EQUAL_TEMPERAMENT:
+            # ties as rounded by get_note, after its reduction to an octave
+            def belongs_to_lower_note(freqs):
+                semitones, octaves, _ = get_notes(freqs, A4_frequency)
+                return _get_note_index(semitones, octaves) <= lower_note_indices
+        else:
+            def belongs_to_lower_note(freqs):
+                return np.log(freqs / A4_frequency) / LOG_SEMITONE_FREQ_RATIO <= boundary_positions
+        boundaries = NoteTable.__align_boundaries(boundaries, belongs_to_lower_note)
+
+        self.__boundaries = boundaries
+        self.__boundary_list = boundaries.tolist()
+        self.__positions = positions[1:-1]
+        self.__semitones = semitones[1:-1]
+        self.__octaves = INITIAL_OCTAVE + note_indices[1:-1] // SEMITONES_IN_SCALE + (3 <= self.__semitones)
+        self.__position_list = self.__positions.tolist()
+        self.__semitone_list = self.__semitones.tolist()
+        self.__octave_list = self.__octaves.tolist()
+
+    def get_A4_frequency(self):
+        return self.__A4_frequency
+
+    def get_note(self, freq):
+        """
+        Get a MusicalNote for a given frequency.
+
+        :param freq: a double
+        :return: a MusicalNote. None if freq is not greater than 0
+        """
+        if freq <= 0:
+            return None
+        octave_shift = 0
+        if not self.__boundary_list[0] < freq <= self.__boundary_list[-1]:
+            octave_shift = math.floor(math.log2(freq / self.__A4_frequency))
+            freq = math.ldexp(freq, -octave_shift)
+        note = bisect.bisect_left(self.__boundary_list, freq) - 1
+        semitones_diff = math.log(freq / self.__A4_frequency) / LOG_SEMITONE_FREQ_RATIO
+        return MusicalNote(self.__semitone_list[note], self.__octave_list[note] + octave_shift,
+                           semitones_diff - self.__position_list[note])
+
+    def get_notes(self, freqs):
+        """
+        Get the note of each frequency in an array.
+
+        :param freqs: an array of doubles
+        :return: A tuple of arrays: (semitones from A, octaves, deltas), as in get_notes
+        """
+        freqs = np.asarray(freqs, dtype=np.float64)
+        has_note = 0 < freqs
+        freqs = np.where(has_note, freqs, self.__A4_frequency)
+        in_table = (self.__boundaries[0] < freqs) & (freqs <= self.__boundaries[-1])
+        octave_shifts = np.zeros(len(freqs), dtype=np.int64)
+        if not in_table.all():
+            octave_shifts[~in_table] = np.floor(np.log2(freqs[~in_table] / self.__A4_frequency))
+            freqs = np.ldexp(freqs, -octave_shifts)
+        semitones_diff = np.log(freqs / self.__A4_frequency) / LOG_SEMITONE_FREQ_RATIO
+        # the nearest equal tempered note is at most one note away from the note in the table,
+        # which is cheaper to correct than to search for
+        notes = np.rint(semitones_diff).astype(np.int64) - NOTE_TABLE_LOWEST_NOTE
+        np.clip(notes, 0, len(self.__semitones) - 1, out=notes)
+        notes += (notes < len(self.__semitones) - 1) & (self.__boundaries[notes + 1] < freqs)
+        notes -= (0 < notes) & (freqs <= self.__boundaries[notes])
+
+        semitones = self.__semitones[notes]
+        octaves = self.__octaves[notes] + octave_shifts
+        deltas = semitones_diff - self.__positions[notes]
+        semitones[~has_note] = NO_NOTE
+        octaves[~has_note] = NO_NOTE
+        deltas[~has_note] = np.nan
+        return semitones, octaves, deltas
+
+    @staticmethod
+    def __align_boundaries(boundaries, belongs_to_lower_note):
+        """
+        Move each boundary to the highest frequency that belongs to the lower of its two notes.
+
+        :param boundaries: An array with an estimate of each boundary
+        :param belongs_to_lower_note: A callable that maps an array of frequencies close to the boundaries
+                                      to whether each belongs to the lower note of its boundary
+        """
+        boundaries = boundaries.copy()
+        # the closed form is off by a few units in the last place at most
+        for _ in range(64):
+            too_high = ~belongs_to_lower_note(boundaries)
+            boundaries[too_high] = np.nextafter(boundaries[too_high], 0)
+            next_boundaries = np.nextafter(boundaries, np.inf)
+            too_low = ~too_high & belongs_to_lower_note(next_boundaries)
+            boundaries[too_low] = next_boundaries[too_low]
+            if not (too_high.any() or too_low.any()):
+                break
+        return boundaries
+
+
+@functools.lru_cache(maxsize=NOTE_TABLE_CACHE_SIZE)
+def get_note_table(A4_frequency=DEFAULT_A4_FREQ, temperament=EQUAL_TEMPERAMENT):
+    """
+    Get the NoteTable of a reference, building it only if it is not cached.
+
+    The least recently used references are evicted once more than NOTE_TABLE_CACHE_SIZE are in use.
+
+    :param A4_frequency: The frequency of A4
+    :param temperament: A tuple with the offset in cents of each note from equal temperament
+    :return: A NoteTable
+    """
+    return NoteTable(A4_frequency, tuple(temperament))
+
+
 class NoteIdentifierProcess(Process):
     """
     A consumer that identifies a musical note given a frequency.
@@ -65,24 +261,59 @@ class NoteIdentifierProcess(Process):
     The difference in semitones between the given note and the reference is determined by the formula:
     diff(frG) = log(frG / frR) / log(2^(1/12))
 
+    Notes are looked up in the NoteTable of the reference, which is shared by every identifier of the
+    same reference. Another temperament may be given as the offset in cents of each note from equal
+    temperament.
     """
 
-    def __init__(self, A4_frequency=DEFAULT_A4_FREQ):
+    def __init__(self, A4_frequency=DEFAULT_A4_FREQ, temperament=EQUAL_TEMPERAMENT):
         """
         Construct instance of Frequency FrequencyExtractor.
 
         This class is a producer/consumer.
 
-        :param consumer: The consumer of the data produced by this class
+        :param A4_frequency: The frequency of A4
+        :param temperament: The offset in cents of each note from equal temperament, indexed by semitones from A
         """
         self.A4_frequency = A4_frequency
+        self.__temperament = tuple(temperament)
+        self.__note_table = get_note_table(A4_frequency, self.__temperament)
 
     def run(self, freq=None):
         """
         Consume from buffer.
+
+        :param freq: A frequency, or an array with a frequency per channel
+        :return: A MusicalNote, or None if there is no note. A list of them for an array of frequencies
+        """
+        # a type check keeps scalars, the most frequent, off the array path
+        if isinstance(freq, (list, tuple, np.ndarray)):
+            return self.__get_notes(freq)
+        return self.__note_table.get_note(freq)
+
+    def run_batch(self, freqs):
+        """
+        Identify the notes of many items at once.
+
+        :param freqs: A sequence of items as given to run: frequencies, or arrays of frequencies
+        :return: A list with what run gives for each item
+        """
+        if any(isinstance(freq, (list, tuple, np.ndarray)) for freq in freqs):
+            return [self.run(freq) for freq in freqs]
+        return self.__get_notes(freqs)
+
+    def __get_notes(self, freqs):
+        """
+        Identify the notes of many frequencies at once.
+
+        :param freqs: A sequence of frequencies
+        :return: A list with the MusicalNote of each frequency, or None where there is no note
         """
-        return get_note(freq, self.A4_frequency)
+        semitones, octaves, deltas = self.__note_table.get_notes(freqs)
+        return [None if semitone == NO_NOTE else MusicalNote(semitone, octave, delta)
+                for semitone, octave, delta in zip(semitones.tolist(), octaves.tolist(), deltas.tolist())]
 
     def set_A4_frequency(self, new_A4_frequency):
         self.A4_frequency = new_A4_frequency
+        self.__note_table = get_note_table(new_A4_frequency, self.__temperament)
 
@@ -0,0 +1,35 @@
+import time
+
+
+class CapturePacer:
+    """
+    Paces a stand-in for the recorder, so that samples are handed out no sooner than they would have
+    been captured, sped up by a real-time factor.
+    """
+
+    def __init__(self, sample_duration, realtime_factor=None) -> None:
+        """
+        Construct an instance of CapturePacer.
+
+        :param sample_duration: The duration of each sample, in seconds
+        :param realtime_factor: How many times faster than real-time to hand out samples.
+                                None to hand them out as fast as requested
+        """
+        self.__sample_duration = sample_duration
+        self.__realtime_factor = realtime_factor
+        self.__started_at = None
+
+    def wait(self, sequence_number):
+        """
+        Wait until a sample would have been fully captured. The first call starts the clock.
+
+        :param sequence_number: The position of the sample, counting from 0
+        """
+        if self.__realtime_factor is None:
+            return
+        if self.__started_at is None:
+            self.__started_at = time.monotonic()
+        captured_at = self.__started_at + (sequence_number + 1) * self.__sample_duration / self.__realtime_factor
+        remaining = captured_at - time.monotonic()
+        if 0 < remaining:
+            time.sleep(remaining)
@@ -1,27 +1,58 @@
 import threading as th
-import sounddevice as soundd
+import time
+
 from abstracts_interfaces.process import Process
+from ring_buffer import RingBuffer
 from sound_sample import SoundSample
 
+DEFAULT_BUFFERED_SAMPLES = 4
+
 
 class RecorderProcess(Process):
     """
     Models an audio recorder. A threaded producer.
 
     Produces a SoundSample per production cycle.
+
+    Several channels of a device may be captured in a single stream. Each production cycle then produces
+    either one SoundSample whose samples have a column per channel, or a list with a SoundSample per
+    channel. In both cases the channels are views of a single capture, never copies.
+
+    By default each production cycle records a new sample, hence audio is lost while the sample is
+    being handed to the consumer. In streaming mode the device is captured continuously by a callback
+    stream into a ring buffer, and each production cycle hands out the next frame from the buffer
+    without gaps between cycles.
     """
-    __CHANNELS = 1
     __SAMPLE_TYPE = 'int32'
 
-    def __init__(self, target_frequency_max=3000, sample_duration=1):
+    def __init__(self, target_frequency_max=3000, sample_duration=1, streaming=False, stream_factory=None,
+                 buffered_samples=DEFAULT_BUFFERED_SAMPLES, channels=1, split_channels=False):
         """
         Construct an instance of recorder.
 
         Will determine sample rate from the given target_target_frequency_max as according to Nyquist's theorem.
         :param target_frequency_max: in Hz
+        :param sample_duration: The duration of each sample produced, in seconds
+        :param streaming: Capture continuously instead of recording once per production cycle
+        :param stream_factory: A callable that accepts the keyword arguments of sounddevice.InputStream
+                               and returns a stream. Defaults to sounddevice.InputStream
+        :param buffered_samples: The number of samples the ring buffer can hold in streaming mode
+        :param channels: The number of channels to capture
+        :param split_channels: Produce a list with a SoundSample per channel instead of one multi-channel SoundSample
         """
+        if channels < 1:
+            raise ValueError("There must be at least one channel")
         self.__sample_rate = target_frequency_max * 2
         self.__sample_duration = sample_duration
+        self.__streaming = streaming
+        self.__stream_factory = stream_factory
+        self.__buffered_samples = buffered_samples
+        self.__channels = channels
+        self.__split_channels = split_channels
+        self.__stream = None
+        self.__ring_buffer = None
+        self.__stream_lock = th.Lock()
+        self.__sequence_number = 0
 
     def run(self, _=None):
         """
@@ -30,10 +61,97 @@ class RecorderProcess(Process):
         To be run threaded.
         :param _: unused
         """
+        if self.__streaming:
+            return self.get_streamed_sample()
         return self.get_sample()
 
     def get_sample(self):
-        return SoundSample(self.__sample_rate, self.__sample_duration,
-                           soundd.rec(int(self.__sample_rate * self.__sample_duration),
-                                      self.__sample_rate, RecorderProcess.__CHANNELS,
-                                      RecorderProcess.__SAMPLE_TYPE, blocking=True)[:, 0])
+        # imported on use: sounddevice needs the PortAudio library, which a stream factory does not
+        import sounddevice as soundd
+        samples = soundd.rec(self.__get_sample_length(), self.__sample_rate, self.__channels,
+                             RecorderProcess.__SAMPLE_TYPE, blocking=True)
+        return self.__get_sound_sample(samples)
+
+    def get_streamed_sample(self):
+        """
+        Get the next sample from the capture stream. Opens the stream on first use.
+
+        :return: A SoundSample, or a list with a SoundSample per channel if splitting channels
+        """
+        self.open_stream()
+        samples = self.__ring_buffer.read(self.__get_sample_length())
+        return self.__get_sound_sample(samples, self.__ring_buffer.get_read_capture_time())
+
+    def open_stream(self):
+        """
+        Start capturing continuously into the ring buffer. Does nothing if the stream is already open.
+        """
+        with self.__stream_lock:
+            if self.__stream is not None:
+                return
+            self.__ring_buffer = RingBuffer(self.__get_sample_length() * self.__buffered_samples,
+                                            RecorderProcess.__SAMPLE_TYPE,
+                                            None if self.__channels == 1 else self.__channels)
+            stream_factory = self.__stream_factory
+            if stream_factory is None:
+                import sounddevice as soundd
+                stream_factory = soundd.InputStream
+            self.__stream = stream_factory(samplerate=self.__sample_rate,
+                                           channels=self.__channels,
+                                           dtype=RecorderProcess.__SAMPLE_TYPE,
+                                           callback=self.__on_block)
+            self.__stream.start()
+
+    def close_stream(self):
+        """
+        Stop capturing. Samples remaining in the ring buffer are discarded.
+        """
+        with self.__stream_lock:
+            if self.__stream is None:
+                return
+            self.__stream.stop()
+            self.__stream.close()
+            self.__stream = None
+
+    def get_overrun_count(self):
+        """
+        Get the number of captured samples that were lost because the consumer fell behind.
+
+        :return: an int
+        """
+        if self.__ring_buffer is None:
+            return 0
+        return self.__ring_buffer.get_overrun_count()
+
+    def __on_block(self, indata, frames, time_info, status):
+        """
+        Callback of the capture stream. Runs in the audio thread, hence must not block.
+        """
+        # the block was fully captured just before the callback runs
+        captured_at = time.monotonic()
+        if self.__channels == 1:
+            self.__ring_buffer.write(indata[:frames, 0], captured_at)
+        else:
+            self.__ring_buffer.write(indata[:frames], captured_at)
+
+    def __get_sound_sample(self, samples, capture_time=None):
+        """
+        Wrap captured samples, with a row per sample instant and a column per channel, into SoundSamples.
+
+        :param capture_time: The time.monotonic() at which the last sample was captured. Defaults to now
+        """
+        if samples.ndim == 2 and self.__channels == 1:
+            samples = samples[:, 0]
+        sound_sample = SoundSample(self.__sample_rate, self.__sample_duration, samples, capture_time,
+                                   sequence_number=self.__next_sequence_number())
+        if self.__split_channels:
+            return [sound_sample.get_channel(channel) for channel in range(self.__channels)]
+        return sound_sample
+
+    def __next_sequence_number(self):
+        sequence_number = self.__sequence_number
+        self.__sequence_number += 1
+        return sequence_number
+
+    def __get_sample_length(self):
+        return int(self.__sample_rate * self.__sample_duration)
@@ -0,0 +1,148 @@
+"""
+A gate that tells frames of sound apart from silence, cheaply enough to run before every FFT.
+
+    Rationale:
+    1- The RMS of a frame costs a single pass over its samples, far less than the FFT and peak picking
+    2- The noise floor is estimated incrementally, across frames, from the RMS alone:
+        It follows quieter frames down at once, and rises towards louder frames by at most floor_rise_db
+        per second of audio. Hence it settles on the background noise between notes, while a sustained
+        note only lifts it slowly
+    3- A frame opens the gate if its RMS is open_db above the noise floor
+    4- A frame also opens the gate on an onset: an RMS rise of onset_db over the previous frame.
+        Attacks are not missed while the floor is still elevated, e.g. by the decay of the previous note
+    5- Frames at or under min_rms, such as digital silence, never open the gate nor move the noise floor
+
+    The gate holds the state of a single stream: the frames given must be consecutive frames of one signal.
+    Until it hears a quieter frame, the gate takes the first frame for noise.
+"""
+import threading
+
+import numpy as np
+
+DEFAULT_OPEN_DB = 10
+DEFAULT_ONSET_DB = 6
+DEFAULT_FLOOR_RISE_DB = 1
+
+
+def get_rms(frames):
+    """
+    Evaluate the root mean square of a frame, or of each row of a 2-D array of frames.
+
+    :param frames: An array of samples
+    :return: A double, or an array of doubles with the RMS of each row
+    """
+    frames = np.asarray(frames, dtype=np.float64)
+    return np.sqrt(np.einsum('...i,...i->...', frames, frames) / frames.shape[-1])
+
+
+def _db_to_ratio(db):
+    return 10 ** (db / 20)
+
+
+class SignalGate:
+    """
+    Models a noise gate on the RMS of consecutive frames. Thread-safe.
+    """
+
+    def __init__(self, open_db=DEFAULT_OPEN_DB, onset_db=DEFAULT_ONSET_DB, floor_rise_db=DEFAULT_FLOOR_RISE_DB,
+                 min_rms=0) -> None:
+        """
+        Construct an instance of SignalGate.
+
+        :param open_db: How far above the noise floor a frame must be to open the gate, in dB
+        :param onset_db: How far above the previous frame a frame must be to be an onset, in dB
+        :param floor_rise_db: How fast the noise floor may rise, in dB per second of audio
+        :param min_rms: The RMS, in sample units, at or under which frames are silent
+        """
+        self.__open_ratio = _db_to_ratio(open_db)
+        self.__onset_ratio = _db_to_ratio(onset_db)
+        self.__floor_rise_db = floor_rise_db
+        self.__min_rms = min_rms
+        self.__lock = threading.Lock()
+        self.__noise_floor = None
+        self.__previous_rms = None
+        self.__gated_count = 0
+        self.__onset_count = 0
+
+    def update(self, rms, duration):
+        """
+        Decide whether a frame holds sound, and account it in the noise floor.
+
+        :param rms: The RMS of the frame
+        :param duration: The time from the previous frame to this one, in seconds
+        :return: True if the frame opens the gate, False if it is silence
+        """
+        with self.__lock:
+            return self.__update(float(rms), duration)
+
+    def update_many(self, rms_values, durations):
+        """
+        Decide whether each of many consecutive frames holds sound, in order.
+
+        :param rms_values: The RMS of each frame
+        :param durations: The time from the previous frame to each frame, in seconds. A single value if all alike
+        :return: An array of bools, True where the frame opens the gate
+        """
+        rms_values = np.asarray(rms_values, dtype=np.float64)
+        durations = np.broadcast_to(durations, rms_values.shape)
+        with self.__lock:
+            return np.array([self.__update(rms, duration)
+                             for rms, duration in zip(rms_values.tolist(), durations.tolist())], dtype=bool)
+
+    def get_noise_floor(self):
+        """
+        :return: The estimated RMS of the background noise. None until a frame above min_rms is heard
+        """
+        return self.__noise_floor
+
+    def get_gated_count(self):
+        """
+        Get the number of frames that did not open the gate.
+
+        :return: an int
+        """
+        return self.__gated_count
+
+    def get_onset_count(self):
+        """
+        Get the number of onsets detected.
+
+        :return: an int
+        """
+        return self.__onset_count
+
+    def reset(self):
+        """
+        Forget the noise floor and the previous frame, e.g. when the stream changes.
+        """
+        with self.__lock:
+            self.__noise_floor = None
+            self.__previous_rms = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_SignalGate__lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__lock = threading.Lock()
+
+    def __update(self, rms, duration):
+        if rms <= self.__min_rms:
+            self.__gated_count += 1
+            return False
+        if self.__noise_floor is None:
+            self.__noise_floor = rms
+        is_onset = self.__previous_rms is not None and self.__previous_rms * self.__onset_ratio <= rms
+        is_open = is_onset or self.__noise_floor * self.__open_ratio <= rms
+        if rms < self.__noise_floor:
+            self.__noise_floor = rms
+        else:
+            self.__noise_floor = min(rms, self.__noise_floor * _db_to_ratio(self.__floor_rise_db * duration))
+        self.__previous_rms = rms
+        if is_onset:
+            self.__onset_count += 1
+        if not is_open:
+            self.__gated_count += 1
+        return is_open
@@ -0,0 +1,232 @@
+"""
+Processes that serve several input streams through shared stages.
+
+Each object travelling through the shared stages is a StreamFrame, tagged with the stream it belongs to.
+"""
+import collections
+import threading
+
+from abstracts_interfaces.process import Process
+from processes.frequency_extraction_process import FrequencyExtractionProcess
+from processes.signal_gate import get_rms
+
+
+class StreamFrame:
+    """
+    Models an object of one of several streams.
+    """
+    __slots__ = ("stream", "value")
+
+    def __init__(self, stream, value) -> None:
+        """
+        :param stream: The index of the stream
+        :param value: any
+        """
+        self.stream = stream
+        self.value = value
+
+
+class StreamSourceProcess(Process):
+    """
+    Tags the objects produced by the source of a stream with its index.
+    """
+
+    def __init__(self, source: Process, stream) -> None:
+        """
+        :param source: A Process that produces one object at a time, e.g. a RecorderProcess
+        :param stream: The index of the stream
+        """
+        self.__source = source
+        self.__stream = stream
+
+    def run(self, _=None):
+        """
+        :return: A StreamFrame. None once the source produces None
+        """
+        value = self.__source.run()
+        if value is None:
+            return None
+        return StreamFrame(self.__stream, value)
+
+
+class MultiChannelCapture:
+    """
+    Shares the SoundSamples of one multi-channel source among a ChannelSourceProcess per channel.
+
+    The source is run once per capture, by whichever channel asks for the capture first. Each capture
+    is kept until every channel has taken it.
+    """
+
+    def __init__(self, source: Process, channel_count) -> None:
+        """
+        :param source: A Process that produces multi-channel SoundSamples, e.g. a RecorderProcess with channels
+        :param channel_count: The number of channels taken from the source
+        """
+        self.__source = source
+        self.__channel_count = channel_count
+        self.__captured = threading.Condition()
+        self.__captures = {}
+        self.__next_sequence = 0
+        self.__capturing = False
+
+    def get_channel_count(self):
+        return self.__channel_count
+
+    def take(self, sequence):
+        """
+        Take a capture, running the source if it was not captured yet.
+
+        :param sequence: The position of the capture, counting from 0. Each channel takes every capture once
+        :return: A SoundSample. None once the source produces None
+        """
+        with self.__captured:
+            while self.__next_sequence <= sequence:
+                if self.__capturing:
+                    self.__captured.wait()
+                    continue
+                self.__capturing = True
+                # captured without the lock, so that channels ahead never hold back the captures behind them
+                self.__captured.release()
+                try:
+                    sound_sample = self.__source.run()
+                finally:
+                    self.__captured.acquire()
+                    self.__capturing = False
+                    self.__captured.notify_all()
+                self.__captures[self.__next_sequence] = [sound_sample, self.__channel_count]
+                self.__next_sequence += 1
+            capture = self.__captures[sequence]
+            capture[1] -= 1
+            if capture[1] == 0:
+                del self.__captures[sequence]
+            return capture[0]
+
+
+class ChannelSourceProcess(Process):
+    """
+    Produces the SoundSamples of one channel of a MultiChannelCapture, as views of the captures.
+    """
+
+    def __init__(self, capture: MultiChannelCapture, channel) -> None:
+        """
+        :param capture: The MultiChannelCapture
+        :param channel: The index of the channel
+        """
+        self.__capture = capture
+        self.__channel = channel
+        self.__sequence = 0
+
+    def run(self, _=None):
+        """
+        :return: A SoundSample. None once the source produces None
+        """
+        sound_sample = self.__capture.take(self.__sequence)
+        self.__sequence += 1
+        if sound_sample is None:
+            return None
+        return sound_sample.get_channel(self.__channel)
+
+
+def get_channel_sources(source: Process, channel_count):
+    """
+    Split a multi-channel source into a source per channel, e.g. to tune each channel as a stream.
+
+    :param source: A Process that produces multi-channel SoundSamples, e.g. a RecorderProcess with channels
+    :param channel_count: The number of channels of the source
+    :return: A list with a ChannelSourceProcess per channel
+    """
+    capture = MultiChannelCapture(source, channel_count)
+    return [ChannelSourceProcess(capture, channel) for channel in range(channel_count)]
+
+
+class CrossStreamExtractionProcess(Process):
+    """
+    Extracts the fundamental frequency of SoundSamples of many streams at once.
+
+    A batch of StreamFrames, whatever their streams, is extracted by a single FrequencyExtractionProcess.run_batch
+    per sample rate, so the FFT and peak picking run once over a 2-D array of frames.
+
+    Each stream may have its own SignalGate. Frames a gate takes for silence have no frequency (-1),
+    and are left out of the batch given to the extractor.
+    """
+
+    def __init__(self, extractor: FrequencyExtractionProcess = None, gates=None) -> None:
+        """
+        :param extractor: Optional. The FrequencyExtractionProcess. It must not be in STFT mode nor have a gate
+        :param gates: Optional. A SignalGate, or None, per stream
+        """
+        extractor = extractor if extractor is not None else FrequencyExtractionProcess()
+        if extractor.get_hop_size() is not None:
+            raise ValueError("The extractor of many streams cannot run in STFT mode")
+        if extractor.get_gate() is not None:
+            raise ValueError("The extractor of many streams cannot have a gate: give a gate per stream instead")
+        self.__extractor = extractor
+        self.__gates = gates
+
+    def run(self, stream_frame: StreamFrame = None):
+        return self.run_batch([stream_frame])[0]
+
+    def run_batch(self, stream_frames):
+        """
+        :param stream_frames: A list of StreamFrames of SoundSamples
+        :return: A list of StreamFrames of fundamental frequencies, in the same order
+        """
+        indices_by_rate = collections.defaultdict(list)
+        frequencies = [None] * len(stream_frames)
+        for i, stream_frame in enumerate(stream_frames):
+            if self.__is_gated_out(stream_frame):
+                frequencies[i] = -1
+            else:
+                indices_by_rate[stream_frame.value.get_sample_rate()].append(i)
+        for indices in indices_by_rate.values():
+            rate_frequencies = self.__extractor.run_batch([stream_frames[i].value for i in indices])
+            for i, frequency in zip(indices, rate_frequencies.tolist()):
+                frequencies[i] = frequency
+        return [StreamFrame(stream_frame.stream, frequency)
+                for stream_frame, frequency in zip(stream_frames, frequencies)]
+
+    def __is_gated_out(self, stream_frame):
+        if self.__gates is None or self.__gates[stream_frame.stream] is None:
+            return False
+        sound_sample = stream_frame.value
+        # gated on the frame the extractor analyses, as the extractor's own gate would
+        frame = sound_sample.get_samples()[:self.__extractor.get_fft_size()]
+        return not self.__gates[stream_frame.stream].update(get_rms(frame), sound_sample.get_sample_duration())
+
+
+class StreamRouterProcess(Process):
+    """
+    Identifies the note of the frequency of each StreamFrame with the NoteIdentifierProcess of its stream,
+    and hands the note to the sink of its stream.
+    """
+
+    def __init__(self, note_identifiers, sinks) -> None:
+        """
+        :param note_identifiers: A NoteIdentifierProcess per stream, e.g. each with its own A4 frequency
+        :param sinks: A Process per stream, run with the MusicalNote of each frame, or None where there is no note
+        """
+        if len(note_identifiers) != len(sinks):
+            raise ValueError("There must be a sink per note identifier")
+        self.__note_identifiers = note_identifiers
+        self.__sinks = sinks
+
+    def run(self, stream_frame: StreamFrame = None):
+        self.run_batch([stream_frame])
+
+    def run_batch(self, stream_frames):
+        """
+        Identify the notes of each stream at once, then run the sinks in the order of the frames.
+
+        :param stream_frames: A list of StreamFrames of fundamental frequencies
+        :return: A list of None
+        """
+        frames_by_stream = collections.defaultdict(list)
+        for stream_frame in stream_frames:
+            frames_by_stream[stream_frame.stream].append(stream_frame)
+        notes = {}
+        for stream, frames in frames_by_stream.items():
+            stream_notes = self.__note_identifiers[stream].run_batch([frame.value for frame in frames])
+            notes.update(zip(map(id, frames), stream_notes))
+        for stream_frame in stream_frames:
+            self.__sinks[stream_frame.stream].run(notes[id(stream_frame)])
+        return [None] * len(stream_frames)
@@ -0,0 +1,81 @@
+import numpy as np
+
+from abstracts_interfaces.process import Process
+from processes.pacing import CapturePacer
+from sound_sample import SoundSample
+
+DEFAULT_SAMPLE_RATE = 5000
+DEFAULT_AMPLITUDE = 2 ** 24
+SAMPLE_TYPE = 'int32'
+
+
+class SyntheticSignalProcess(Process):
+    """
+    Models a synthetic audio source. A stand-in for RecorderProcess that needs no audio device.
+
+    Produces a SoundSample per production cycle. Each sample holds a chord: one or more tones, each
+    with its harmonics, with white noise added at a given signal-to-noise ratio. The chords given are
+    cycled through, one per sample.
+
+    By default samples are produced as fast as requested. Given a real-time factor, production is
+    paced so that samples are produced that many times faster than they would be captured.
+    """
+
+    def __init__(self, chords=((440,),), sample_rate=DEFAULT_SAMPLE_RATE, sample_duration=0.5, harmonics=0,
+                 harmonic_decay=0.5, snr_db=None, amplitude=DEFAULT_AMPLITUDE, realtime_factor=None, seed=0):
+        """
+        Construct an instance of SyntheticSignalProcess.
+
+        :param chords: A sequence of chords, each a sequence of frequencies in Hz
+        :param sample_rate: The number of samples per second
+        :param sample_duration: The duration of each sample produced, in seconds
+        :param harmonics: The number of harmonics above the fundamental of each tone
+        :param harmonic_decay: The amplitude of each harmonic relative to the previous one
+        :param snr_db: The signal-to-noise ratio, in dB. None for no noise
+        :param amplitude: The peak amplitude of the fundamental of each tone
+        :param realtime_factor: Optional. How many times faster than real-time to produce samples
+        :param seed: The seed of the noise
+        """
+        if len(chords) == 0:
+            raise ValueError("There must be at least one chord")
+        self.__sample_rate = sample_rate
+        self.__sample_duration = sample_duration
+        self.__pacer = CapturePacer(sample_duration, realtime_factor)
+        self.__rng = np.random.default_rng(seed)
+        self.__snr_db = snr_db
+        time_space = np.arange(int(sample_rate * sample_duration)) / sample_rate
+        self.__signals = [SyntheticSignalProcess.__get_chord_signal(chord, time_space, harmonics, harmonic_decay,
+                                                                     amplitude)
+                          for chord in chords]
+        self.__sequence_number = 0
+
+    def run(self, _=None):
+        """
+        Produce the next sample.
+
+        :param _: unused
+        :return: A SoundSample
+        """
+        self.__pacer.wait(self.__sequence_number)
+        signal = self.__signals[self.__sequence_number % len(self.__signals)]
+        if self.__snr_db is not None:
+            signal = signal + self.__get_noise(signal)
+        samples = np.clip(signal, np.iinfo(SAMPLE_TYPE).min, np.iinfo(SAMPLE_TYPE).max).astype(SAMPLE_TYPE)
+        sound_sample = SoundSample(self.__sample_rate, self.__sample_duration, samples,
+                                   sequence_number=self.__sequence_number)
+        self.__sequence_number += 1
+        return sound_sample
+
+    def __get_noise(self, signal):
+        signal_power = np.mean(signal ** 2)
+        noise_power = signal_power / 10 ** (self.__snr_db / 10)
+        return self.__rng.normal(0, np.sqrt(noise_power), len(signal))
+
+    @staticmethod
+    def __get_chord_signal(chord, time_space, harmonics, harmonic_decay, amplitude):
+        signal = np.zeros(len(time_space))
+        for frequency in chord:
+            for harmonic in range(harmonics + 1):
+                signal += (amplitude * harmonic_decay ** harmonic
+                           * np.sin(2 * np.pi * frequency * (harmonic + 1) * time_space))
+        return signal
@@ -0,0 +1,52 @@
+from abstracts_interfaces.process import Process
+from sound_sample import SoundSample
+from traced_result import TracedResult
+
+
+class TracingProcess(Process):
+    """
+    Wraps a process to carry the trace of each SoundSample through it.
+
+    The wrapped process receives and returns plain objects, as usual. This process accepts a SoundSample
+    or a TracedResult and returns a TracedResult holding the result of the wrapped process, stamped with
+    the time the stage finished.
+    """
+
+    def __init__(self, process: Process, stage_name=None):
+        """
+        Construct an instance of TracingProcess.
+
+        :param process: The Process to wrap
+        :param stage_name: The name of the stage in traces. Defaults to the class name of the process
+        """
+        self.__process = process
+        self.__stage_name = stage_name if stage_name is not None else type(process).__name__
+
+    def run(self, item=None):
+        trace = _get_trace(item)
+        return trace.derive(self.__process.run(_get_value(item)), self.__stage_name)
+
+    def is_concurrent(self):
+        return self.__process.is_concurrent()
+
+    def run_batch(self, items):
+        traces = [_get_trace(item) for item in items]
+        results = self.__process.run_batch([_get_value(item) for item in items])
+        return [trace.derive(result, self.__stage_name) for trace, result in zip(traces, results)]
+
+
+def _get_trace(item):
+    """
+    :return: A TracedResult with the trace of the item and no stage times
+    """
+    if isinstance(item, TracedResult):
+        return item
+    if isinstance(item, SoundSample):
+        return TracedResult(None, item.get_capture_time(), item.get_sequence_number())
+    raise TypeError(f"Cannot trace a {type(item).__name__}")
+
+
+def _get_value(item):
+    if isinstance(item, TracedResult):
+        return item.get_value()
+    return item
@@ -0,0 +1,154 @@
+import collections
+import threading
+import time
+
+import numpy as np
+
+DEFAULT_WAIT_TIMEOUT = 0.1
+
+
+class RingBuffer:
+    """
+    Models a single-producer single-consumer ring buffer of samples.
+
+    The writer (usually an audio callback) never takes a lock: it copies the incoming block into
+    a preallocated array and then advances a monotonically increasing write counter. The reader
+    owns the read counter. Since each counter is written by a single side, no lock is needed to
+    keep them consistent.
+
+    If the writer laps the reader, the oldest samples are lost. The reader then skips ahead to the
+    oldest sample still available, and the loss is accounted in get_overrun_count.
+
+    Each block written is stamped with its capture time, so that the reader can tell how long the
+    samples it reads waited in the buffer.
+
+    Multi-channel samples are held interleaved, one row per sample instant. Lengths and counts are
+    given in sample instants, whatever the number of channels.
+    """
+
+    def __init__(self, capacity, dtype='int32', channels=None) -> None:
+        """
+        Construct an instance of RingBuffer.
+
+        :param capacity: The maximum number of samples held
+        :param dtype: The numpy dtype of the samples
+        :param channels: Optional. The number of channels of each sample. None for one dimensional samples
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be greater than 0")
+        self.__capacity = capacity
+        self.__samples = np.zeros(capacity if channels is None else (capacity, channels), dtype=dtype)
+        self.__written = 0
+        self.__read = 0
+        self.__overrun_count = 0
+        # (write counter after the block, capture time of the block), oldest first. Appended by the
+        # writer and popped by the reader only, which a deque supports without a lock
+        self.__capture_times = collections.deque(maxlen=capacity)
+        self.__read_capture_time = None
+        self.__data_ready = threading.Event()
+
+    def get_capacity(self):
+        return self.__capacity
+
+    def get_overrun_count(self):
+        """
+        Get the number of samples that were overwritten before being read.
+
+        :return: an int
+        """
+        return self.__overrun_count
+
+    def get_read_capture_time(self):
+        """
+        Get the capture time of the block holding the last sample read.
+
+        :return: A time.monotonic() time. None if nothing was read yet
+        """
+        return self.__read_capture_time
+
+    def available(self):
+        """
+        Get the number of samples written but not read yet.
+
+        :return: an int
+        """
+        return self.__written - self.__read
+
+    def write(self, block, capture_time=None):
+        """
+        Write a block of samples. Never blocks.
+
+        To be called from the producer side only.
+        :param block: An array of samples. Two dimensional, one column per channel, if the buffer has channels
+        :param capture_time: The time.monotonic() at which the last sample of the block was captured. Defaults to now
+        """
+        if capture_time is None:
+            capture_time = time.monotonic()
+        block_length = len(block)
+        if self.__capacity < block_length:
+            # the head of the block would be overwritten by its own tail
+            self.__written += block_length - self.__capacity
+            block = block[block_length - self.__capacity:]
+            block_length = self.__capacity
+        start = self.__written % self.__capacity
+        first_part = min(block_length, self.__capacity - start)
+        self.__samples[start:start + first_part] = block[:first_part]
+        self.__samples[:block_length - first_part] = block[first_part:]
+        # stamped before the samples are published, so the reader always finds the stamp of what it reads
+        self.__capture_times.append((self.__written + block_length, capture_time))
+        self.__written += block_length
+        self.__data_ready.set()
+
+    def read(self, length, timeout=None):
+        """
+        Read the next length samples, waiting until they are available.
+
+        To be called from the consumer side only.
+        :param length: The number of samples to read. Must not exceed the capacity
+        :param timeout: The maximum time to wait in seconds. None to wait indefinitely
+        :return: A new array of samples, with a column per channel if the buffer has channels.
+                 None if the timeout expired
+        """
+        if self.__capacity < length:
+            raise ValueError("Cannot read more samples than the capacity of the buffer")
+        if not self.__wait_for(length, timeout):
+            return None
+        self.__skip_overrun()
+        out = np.empty((length,) + self.__samples.shape[1:], dtype=self.__samples.dtype)
+        start = self.__read % self.__capacity
+        first_part = min(length, self.__capacity - start)
+        out[:first_part] = self.__samples[start:start + first_part]
+        out[first_part:] = self.__samples[:length - first_part]
+        self.__read += length
+        if self.__written - self.__capacity > self.__read - length:
+            # the writer wrapped over the samples while they were being copied
+            self.__overrun_count += self.__written - self.__capacity - (self.__read - length)
+        self.__update_read_capture_time()
+        return out
+
+    def __update_read_capture_time(self):
+        # drop the stamps of the blocks read entirely before the last sample read
+        while self.__capture_times and self.__capture_times[0][0] < self.__read:
+            self.__capture_times.popleft()
+        if self.__capture_times:
+            self.__read_capture_time = self.__capture_times[0][1]
+
+    def __wait_for(self, length, timeout):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.available() < length:
+            self.__data_ready.clear()
+            if length <= self.available():
+                break
+            wait_time = DEFAULT_WAIT_TIMEOUT
+            if deadline is not None:
+                wait_time = min(wait_time, deadline - time.monotonic())
+                if wait_time <= 0:
+                    return False
+            self.__data_ready.wait(wait_time)
+        return True
+
+    def __skip_overrun(self):
+        oldest_available = self.__written - self.__capacity
+        if self.__read < oldest_available:
+            self.__overrun_count += oldest_available - self.__read
+            self.__read = oldest_available
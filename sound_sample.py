@@ -1,17 +1,26 @@
+import time
+
+import numpy as np
+
+
 class SoundSample:
     """
     Models a sound sample.
     """
-    def __init__(self, sample_rate, sample_duration, samples):
+    def __init__(self, sample_rate, sample_duration, samples, capture_time=None, sequence_number=None):
         """
         Construct an instance of SoundSample
         :param sample_rate: the number of samples per second
         :param sample_duration: the duration in seconds
-        :param samples: the samples taken
+        :param samples: the samples taken. Two dimensional, one column per channel, for multi-channel samples
+        :param capture_time: the time.monotonic() at which the last sample was captured. Defaults to now
+        :param sequence_number: the position of this sample in the stream it belongs to, if any
         """
         self.__sample_rate = sample_rate
         self.__sample_duration = sample_duration
         self.__samples = samples
+        self.__capture_time = capture_time if capture_time is not None else time.monotonic()
+        self.__sequence_number = sequence_number
 
     def get_sample_rate(self):
         return self.__sample_rate
@@ -21,3 +30,26 @@ class SoundSample:
 
     def get_samples(self):
         return self.__samples
+
+    def get_capture_time(self):
+        return self.__capture_time
+
+    def get_sequence_number(self):
+        return self.__sequence_number
+
+    def get_channel_count(self):
+        return 1 if np.ndim(self.__samples) == 1 else self.__samples.shape[1]
+
+    def get_channel(self, channel):
+        """
+        Get the samples of one channel of a multi-channel sample, without copying them.
+
+        :param channel: The index of the channel
+        :return: A SoundSample, whose samples are a view of the samples of this one
+        """
+        if np.ndim(self.__samples) == 1:
+            if channel != 0:
+                raise IndexError(f"No channel {channel} in a single channel sample")
+            return self
+        return SoundSample(self.__sample_rate, self.__sample_duration, self.__samples[:, channel],
+                           self.__capture_time, self.__sequence_number)
@@ -0,0 +1,219 @@
+"""
+Instrumentation of the stages of a pipeline.
+
+A StageMetrics records, for one stage:
+- the items given to it and the items it processed
+- the time it spent blocked giving items to the next stage (back-pressure)
+- the time it spent waiting for items to process (starvation)
+- a histogram of the duration of Process.run
+- the depth of its buffer, sampled whenever an item is taken
+
+Stages record nothing until metrics are enabled on them, so that disabled instrumentation
+costs a single attribute check.
+"""
+import threading
+import time
+
+HISTOGRAM_BUCKETS = 32
+DEFAULT_REPORT_INTERVAL = 1
+
+
+class DurationHistogram:
+    """
+    Models a histogram of durations with logarithmic buckets.
+
+    Bucket 0 holds durations under 1us. Bucket i holds durations in [2^(i-1), 2^i) us.
+    The last bucket also holds every longer duration.
+    """
+
+    def __init__(self) -> None:
+        self.__buckets = [0] * HISTOGRAM_BUCKETS
+        self.__count = 0
+        self.__total = 0.0
+        self.__max = 0.0
+
+    def record(self, duration):
+        """
+        Record a duration. Not thread-safe.
+
+        :param duration: In seconds
+        """
+        bucket = min(int(duration * 1e6).bit_length(), HISTOGRAM_BUCKETS - 1)
+        self.__buckets[bucket] += 1
+        self.__count += 1
+        self.__total += duration
+        if self.__max < duration:
+            self.__max = duration
+
+    def get_percentile(self, percentile):
+        """
+        Estimate a percentile of the durations as the upper bound of the bucket it falls in.
+
+        :param percentile: Between 0 and 100
+        :return: A duration in seconds. 0 if there are no durations
+        """
+        if self.__count == 0:
+            return 0.0
+        target = percentile / 100 * self.__count
+        cumulative = 0
+        for bucket, count in enumerate(self.__buckets):
+            cumulative += count
+            if target <= cumulative:
+                return min((1 << bucket) / 1e6, self.__max)
+        return self.__max
+
+    def snapshot(self):
+        """
+        :return: A dict with the count, mean, p50, p95, p99 and max durations in seconds, and the bucket counts
+        """
+        return {
+            "count": self.__count,
+            "mean": self.__total / self.__count if self.__count else 0.0,
+            "p50": self.get_percentile(50),
+            "p95": self.get_percentile(95),
+            "p99": self.get_percentile(99),
+            "max": self.__max,
+            "buckets": list(self.__buckets),
+        }
+
+
+class StageMetrics:
+    """
+    Models the metrics of a stage. Thread-safe.
+    """
+
+    def __init__(self, name) -> None:
+        """
+        Construct an instance of StageMetrics.
+
+        :param name: The name of the stage in reports
+        """
+        self.__name = name
+        self.__lock = threading.Lock()
+        self.__started_at = time.monotonic()
+        self.__items_in = 0
+        self.__items_out = 0
+        self.__blocked_time = 0.0
+        self.__starved_time = 0.0
+        self.__run_durations = DurationHistogram()
+        self.__depth = 0
+        self.__max_depth = 0
+        self.__depth_total = 0
+        self.__depth_samples = 0
+
+    def get_name(self):
+        return self.__name
+
+    def record_in(self):
+        """
+        Record that an item was given to the stage.
+        """
+        with self.__lock:
+            self.__items_in += 1
+
+    def record_blocked(self, duration):
+        """
+        Record time spent giving an item to the next stage.
+
+        :param duration: In seconds
+        """
+        with self.__lock:
+            self.__blocked_time += duration
+
+    def record_starved(self, duration, depth):
+        """
+        Record time spent waiting for an item to process, and the depth of the buffer once it was taken.
+
+        :param duration: In seconds
+        :param depth: The number of items left in the buffer
+        """
+        with self.__lock:
+            self.__starved_time += duration
+            self.__depth = depth
+            self.__depth_total += depth
+            self.__depth_samples += 1
+            if self.__max_depth < depth:
+                self.__max_depth = depth
+
+    def record_run(self, duration, item_count=1):
+        """
+        Record a run of the process of the stage.
+
+        :param duration: In seconds
+        :param item_count: The number of items processed in the run
+        """
+        with self.__lock:
+            self.__run_durations.record(duration)
+            self.__items_out += item_count
+
+    def snapshot(self):
+        """
+        Get the metrics recorded so far.
+
+        :return: A dict
+        """
+        with self.__lock:
+            elapsed = time.monotonic() - self.__started_at
+            return {
+                "name": self.__name,
+                "elapsed": elapsed,
+                "items_in": self.__items_in,
+                "items_out": self.__items_out,
+                "throughput": self.__items_out / elapsed if elapsed else 0.0,
+                "blocked_time": self.__blocked_time,
+                "starved_time": self.__starved_time,
+                "depth": self.__depth,
+                "max_depth": self.__max_depth,
+                "mean_depth": self.__depth_total / self.__depth_samples if self.__depth_samples else 0.0,
+                "run_durations": self.__run_durations.snapshot(),
+            }
+
+
+def format_snapshot(snapshot):
+    """
+    Format a StageMetrics snapshot as a one-line summary.
+
+    :param snapshot: A dict from StageMetrics.snapshot
+    :return: A str
+    """
+    run_durations = snapshot["run_durations"]
+    return (f"{snapshot['name']}: in {snapshot['items_in']} out {snapshot['items_out']} "
+            f"({snapshot['throughput']:.1f}/s) "
+            f"blocked {snapshot['blocked_time']:.3f}s starved {snapshot['starved_time']:.3f}s "
+            f"depth {snapshot['depth']} (max {snapshot['max_depth']}) "
+            f"run p50 {run_durations['p50'] * 1e3:.2f}ms p99 {run_durations['p99'] * 1e3:.2f}ms")
+
+
+class MetricsReporter:
+    """
+    Models a thread that periodically reports the metrics of a set of stages.
+    """
+
+    def __init__(self, runnables, interval=DEFAULT_REPORT_INTERVAL, report=None) -> None:
+        """
+        Construct an instance of MetricsReporter.
+
+        :param runnables: The Runnables to report on. Metrics must be enabled on them
+        :param interval: The time between reports, in seconds
+        :param report: A callable that receives the list of snapshots. Defaults to printing them
+        """
+        self.__runnables = runnables
+        self.__interval = interval
+        self.__report = report if report is not None else MetricsReporter.__print_snapshots
+        self.__stopped = threading.Event()
+        self.__thread = threading.Thread(target=self.__run, daemon=True)
+
+    def start(self):
+        self.__thread.start()
+
+    def stop(self):
+        self.__stopped.set()
+
+    def __run(self):
+        while not self.__stopped.wait(self.__interval):
+            self.__report([runnable.get_metrics().snapshot() for runnable in self.__runnables])
+
+    @staticmethod
+    def __print_snapshots(snapshots):
+        for snapshot in snapshots:
+            print(format_snapshot(snapshot))
@@ -0,0 +1,50 @@
+import tracemalloc
+from unittest import TestCase, skipIf
+import numpy as np
+from processes import frequency_extraction_process
+from processes.frequency_extraction_process import FrequencyExtractionProcess
+from processes.signal_gate import SignalGate
+from sound_sample import SoundSample
+
+
+@skipIf(not frequency_extraction_process._RFFT_SUPPORTS_OUT, "rfft cannot write into a preallocated array")
+class TestAllocationFree(TestCase):
+    def test_run_allocates_no_arrays_per_frame(self):
+        self.assert_run_allocates_no_arrays_per_frame(FrequencyExtractionProcess())
+
+    def test_gated_run_allocates_no_arrays_per_frame(self):
+        # the frames repeat, hence the gate takes them for noise after the first
+        self.assert_run_allocates_no_arrays_per_frame(FrequencyExtractionProcess(gate=SignalGate()))
+
+    def assert_run_allocates_no_arrays_per_frame(self, extractor):
+        """
+        Once warmed up, extracting frames must not allocate anything the size of a spectrum, and must not leave
+        behind a single block allocated by the extractor.
+
+        numpy itself makes small transient Python objects on every call, so the transient allocations
+        are bounded rather than required to be none.
+        """
+        sample_rate = 5000
+        time_space = np.arange(sample_rate // 2) / sample_rate
+        samples = (2 ** 20 * np.sin(440 * 2 * np.pi * time_space)).astype('int32')
+        sound_sample = SoundSample(sample_rate, 0.5, samples)
+        extractor_file = tracemalloc.Filter(True, frequency_extraction_process.__file__)
+
+        tracemalloc.start()
+        try:
+            extractor.run(sound_sample)
+            warmed_up = tracemalloc.take_snapshot().filter_traces([extractor_file])
+            tracemalloc.reset_peak()
+            # the snapshot is traced too
+            before, _ = tracemalloc.get_traced_memory()
+            for _ in range(100):
+                extractor.run(sound_sample)
+            _, peak = tracemalloc.get_traced_memory()
+            finished = tracemalloc.take_snapshot().filter_traces([extractor_file])
+        finally:
+            tracemalloc.stop()
+        new_blocks = sum(max(0, stat.count_diff) for stat in finished.compare_to(warmed_up, "lineno"))
+        self.assertEqual(new_blocks, 0)
+        # half a spectrum, so that a single temporary the size of the spectrum or of a frame fails
+        spectrum_bytes = (frequency_extraction_process.DEFAULT_FFT_SIZE // 2 + 1) * np.dtype(np.float64).itemsize
+        self.assertLess(peak - before, spectrum_bytes // 2)
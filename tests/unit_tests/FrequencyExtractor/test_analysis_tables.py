@@ -0,0 +1,34 @@
+from unittest import TestCase
+import numpy as np
+import scipy.signal.windows as scipy_win
+from processes import frequency_extraction_process
+from processes.frequency_extraction_process import FrequencyExtractionProcess
+from sound_sample import SoundSample
+
+
+class TestAnalysisTables(TestCase):
+    def test_tables_are_shared(self):
+        first = frequency_extraction_process._get_analysis_tables("hann", 1024, np.dtype(np.float64))
+        second = frequency_extraction_process._get_analysis_tables("hann", 1024, np.dtype(np.float64))
+        self.assertIs(first, second)
+        np.testing.assert_array_equal(first.window, scipy_win.hann(1024, sym=False))
+        self.assertFalse(first.window.flags.writeable)
+
+    def test_cache_is_bounded(self):
+        for fft_size in range(16, 16 + 2 * frequency_extraction_process.ANALYSIS_TABLES_CACHE_SIZE):
+            frequency_extraction_process._get_analysis_tables("hann", fft_size, np.dtype(np.float32))
+        cache_info = frequency_extraction_process._get_analysis_tables.cache_info()
+        self.assertEqual(cache_info.currsize, frequency_extraction_process.ANALYSIS_TABLES_CACHE_SIZE)
+
+    def test_custom_fft_size(self):
+        sample_rate = 8000
+        time_space = np.arange(sample_rate) / sample_rate
+        sound_sample = SoundSample(sample_rate, 1, np.sin(330 * 2 * np.pi * time_space))
+        for fft_size in (1024, 4096, 8000):
+            extractor = FrequencyExtractionProcess(fft_size=fft_size, window_type="blackman")
+            self.assertAlmostEqual(extractor.run(sound_sample), 330, delta=1)
+            self.assertEqual(len(extractor.get_bin_frequencies(sample_rate)), fft_size // 2 + 1)
+
+    def test_window_must_match_fft_size(self):
+        with self.assertRaises(ValueError):
+            FrequencyExtractionProcess(fft_size=1024, window=np.ones(2048))
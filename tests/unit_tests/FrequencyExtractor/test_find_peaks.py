@@ -0,0 +1,51 @@
+from unittest import TestCase
+import numpy as np
+from processes import frequency_extraction_process
+from processes.frequency_extraction_process import FrequencyExtractionProcess
+from sound_sample import SoundSample
+
+
+class TestFindPeaks(TestCase):
+    def test_peak_is_the_maximum_of_the_lobe(self):
+        amplitudes = np.array([0, 1, 6, 8, 9, 7, 1, 0, 0, 3, 0], dtype=float)
+        peaks = frequency_extraction_process._find_peaks(amplitudes, 5)
+        np.testing.assert_array_equal(peaks, [4])
+
+    def test_edges_are_not_peaks(self):
+        amplitudes = np.array([9, 1, 0, 4, 0, 1, 9], dtype=float)
+        peaks = frequency_extraction_process._find_peaks(amplitudes, 2)
+        np.testing.assert_array_equal(peaks, [3])
+
+    def test_min_prominence(self):
+        amplitudes = np.array([0, 10, 9, 9.5, 0, 0, 8, 0], dtype=float)
+        peaks = frequency_extraction_process._find_peaks(amplitudes, 5, min_prominence=2)
+        np.testing.assert_array_equal(peaks, [1, 6])
+
+    def test_min_distance_keeps_highest(self):
+        amplitudes = np.array([0, 7, 0, 9, 0, 0, 0, 8, 0], dtype=float)
+        peaks = frequency_extraction_process._find_peaks(amplitudes, 5, min_distance=3)
+        np.testing.assert_array_equal(peaks, [3, 7])
+
+    def test_first_peak_matches_find_peaks(self):
+        rng = np.random.default_rng(0)
+        buffers = frequency_extraction_process._ScratchBuffers(64, np.float64)
+        for threshold in (0.5, 0.9, 2):
+            buffers.amplitudes[:] = rng.random(len(buffers.amplitudes))
+            buffers.amplitudes[[5, 6]] = 0.95
+            peaks = frequency_extraction_process._find_peaks(buffers.amplitudes, threshold)
+            expected = peaks[0] if len(peaks) != 0 else -1
+            self.assertEqual(frequency_extraction_process._find_first_peak(buffers, threshold), expected)
+
+    def test_gaussian_interpolation_of_many_peaks(self):
+        amplitudes = np.array([1, 2, 4, 2, 1, 3, 6, 4, 1], dtype=float)
+        frequencies = frequency_extraction_process._gaussian_interpolation(amplitudes, np.array([2, 6, 8]), 1)
+        self.assertEqual(frequencies[0], frequency_extraction_process._gaussian_interpolation(amplitudes, 2, 1))
+        self.assertEqual(frequencies[1], frequency_extraction_process._gaussian_interpolation(amplitudes, 6, 1))
+        self.assertEqual(frequencies[2], -1)
+
+    def test_get_peak_frequencies_finds_harmonics(self):
+        sample_rate = 5000
+        time_space = np.arange(sample_rate // 2) / sample_rate
+        samples = np.sin(220 * 2 * np.pi * time_space) + 0.8 * np.sin(440 * 2 * np.pi * time_space)
+        peak_frequencies = FrequencyExtractionProcess().get_peak_frequencies(SoundSample(sample_rate, 0.5, samples))
+        np.testing.assert_allclose(peak_frequencies, [220, 440], atol=1)
@@ -0,0 +1,58 @@
+from unittest import TestCase
+from unittest.mock import patch
+import numpy as np
+from processes import frequency_extraction_process
+from processes.frequency_extraction_process import FrequencyExtractionProcess
+from processes.signal_gate import SignalGate
+from sound_sample import SoundSample
+
+SAMPLE_RATE = 5000
+A_FREQUENCY = 440
+
+
+def get_sample(amplitude, rng, length=SAMPLE_RATE // 2):
+    time_space = np.arange(length) / SAMPLE_RATE
+    samples = amplitude * np.sin(A_FREQUENCY * 2 * np.pi * time_space) + rng.normal(scale=1, size=length)
+    return SoundSample(SAMPLE_RATE, length / SAMPLE_RATE, samples)
+
+
+class TestGate(TestCase):
+    def test_silence_is_gated_without_fft(self):
+        rng = np.random.default_rng(0)
+        extractor = FrequencyExtractionProcess(gate=SignalGate())
+        extractor.run(get_sample(0, rng))
+        with patch.object(frequency_extraction_process.np.fft, "rfft", wraps=np.fft.rfft) as rfft:
+            self.assertEqual(extractor.run(get_sample(0, rng)), -1)
+            rfft.assert_not_called()
+            self.assertAlmostEqual(extractor.run(get_sample(100, rng)), A_FREQUENCY, delta=2)
+            rfft.assert_called_once()
+
+    def test_gated_run_matches_ungated_on_sound(self):
+        rng = np.random.default_rng(1)
+        noise, tone = get_sample(0, rng), get_sample(100, rng)
+        extractor = FrequencyExtractionProcess(gate=SignalGate())
+        extractor.run(noise)
+        self.assertEqual(extractor.run(tone), FrequencyExtractionProcess().run(tone))
+
+    def test_run_batch_gates_each_sample_in_order(self):
+        rng = np.random.default_rng(2)
+        sound_samples = [get_sample(amplitude, rng) for amplitude in (0, 0, 100, 0)]
+        frequencies = FrequencyExtractionProcess(gate=SignalGate()).run_batch(sound_samples)
+        self.assertEqual(frequencies[[0, 1, 3]].tolist(), [-1, -1, -1])
+        self.assertAlmostEqual(frequencies[2], A_FREQUENCY, delta=2)
+
+    def test_stft_gates_each_hop(self):
+        rng = np.random.default_rng(3)
+        samples = np.concatenate([get_sample(0, rng, 4096).get_samples(), get_sample(100, rng, 4096).get_samples()])
+        frequencies = FrequencyExtractionProcess(hop_size=512, gate=SignalGate()).run(
+            SoundSample(SAMPLE_RATE, len(samples) / SAMPLE_RATE, samples))
+        self.assertEqual(frequencies[:4], [-1] * 4)
+        for frequency in frequencies[-4:]:
+            self.assertAlmostEqual(frequency, A_FREQUENCY, delta=2)
+
+    def test_reset_resets_the_gate(self):
+        gate = SignalGate()
+        extractor = FrequencyExtractionProcess(gate=gate)
+        extractor.run(get_sample(0, np.random.default_rng(4)))
+        extractor.reset()
+        self.assertIsNone(gate.get_noise_floor())
@@ -0,0 +1,59 @@
+from unittest import TestCase
+import numpy as np
+from processes.frequency_extraction_process import FrequencyExtractionProcess
+from processes.note_identifier import NoteIdentifierProcess
+from processes.signal_gate import SignalGate
+from sound_sample import SoundSample
+
+SAMPLE_RATE = 5000
+FREQUENCIES = (110, 440, 1318.5)
+
+
+def get_multi_channel_sample(length, rng):
+    time_space = np.arange(length) / SAMPLE_RATE
+    channels = [10 * np.sin(frequency * 2 * np.pi * time_space) + rng.normal(scale=0.5, size=length)
+                for frequency in FREQUENCIES]
+    return SoundSample(SAMPLE_RATE, length / SAMPLE_RATE, np.stack(channels, axis=1))
+
+
+class TestMultiChannel(TestCase):
+    def test_run_matches_run_per_channel(self):
+        for length in (SAMPLE_RATE // 2, 1000):
+            sound_sample = get_multi_channel_sample(length, np.random.default_rng(1))
+            extractor = FrequencyExtractionProcess()
+            expected = [extractor.run(sound_sample.get_channel(channel)) for channel in range(len(FREQUENCIES))]
+            np.testing.assert_allclose(extractor.run(sound_sample), expected)
+
+    def test_run_batch_matches_run(self):
+        rng = np.random.default_rng(5)
+        sound_samples = [get_multi_channel_sample(SAMPLE_RATE // 2, rng), get_multi_channel_sample(1000, rng),
+                         get_multi_channel_sample(SAMPLE_RATE // 2, rng).get_channel(1)]
+        extractor = FrequencyExtractionProcess()
+        batched = extractor.run_batch(sound_samples)
+        self.assertEqual(len(batched), len(sound_samples))
+        for sound_sample, frequencies in zip(sound_samples, batched):
+            np.testing.assert_allclose(frequencies, extractor.run(sound_sample))
+        self.assertIsInstance(batched[2], float)
+
+    def test_run_batch_rejects_a_gate(self):
+        sound_samples = [get_multi_channel_sample(1000, np.random.default_rng(6))]
+        with self.assertRaises(ValueError):
+            FrequencyExtractionProcess(gate=SignalGate()).run_batch(sound_samples)
+
+    def test_channels_are_views(self):
+        sound_sample = get_multi_channel_sample(1000, np.random.default_rng(2))
+        channel = sound_sample.get_channel(1)
+        self.assertTrue(np.shares_memory(channel.get_samples(), sound_sample.get_samples()))
+        self.assertEqual(channel.get_channel_count(), 1)
+        self.assertEqual(channel.get_capture_time(), sound_sample.get_capture_time())
+
+    def test_note_identifier_names_each_channel(self):
+        frequencies = FrequencyExtractionProcess().run(get_multi_channel_sample(SAMPLE_RATE // 2,
+                                                                                np.random.default_rng(3)))
+        notes = NoteIdentifierProcess().run(frequencies)
+        self.assertEqual([(note.get_note(), note.get_octave()) for note in notes], [(0, 2), (0, 4), (7, 6)])
+
+    def test_stft_mode_rejects_multi_channel(self):
+        sound_sample = get_multi_channel_sample(1000, np.random.default_rng(4))
+        with self.assertRaises(ValueError):
+            FrequencyExtractionProcess(hop_size=256).run(sound_sample)
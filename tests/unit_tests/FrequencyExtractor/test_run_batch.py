@@ -0,0 +1,44 @@
+from unittest import TestCase
+import numpy as np
+from processes.frequency_extraction_process import FrequencyExtractionProcess
+from processes.signal_gate import SignalGate
+from sound_sample import SoundSample
+
+SAMPLE_RATE = 5000
+
+
+def get_tone_sample(frequency, rng, length=SAMPLE_RATE // 2):
+    time_space = np.arange(length) / SAMPLE_RATE
+    samples = 10 * np.sin(frequency * 2 * np.pi * time_space) + rng.normal(scale=0.5, size=len(time_space))
+    return SoundSample(SAMPLE_RATE, length / SAMPLE_RATE, samples)
+
+
+class TestRunBatch(TestCase):
+    def test_run_batch_matches_run(self):
+        rng = np.random.default_rng(1)
+        sound_samples = [get_tone_sample(frequency, rng) for frequency in (110, 261.63, 440, 880, 1318.5)]
+        extractor = FrequencyExtractionProcess()
+        expected = [extractor.run(sound_sample) for sound_sample in sound_samples]
+        np.testing.assert_allclose(extractor.run_batch(sound_samples), expected)
+
+    def test_short_samples_are_zero_padded_as_in_run(self):
+        rng = np.random.default_rng(3)
+        sound_samples = [get_tone_sample(440, rng, 1000), get_tone_sample(261.63, rng), get_tone_sample(880, rng, 1500)]
+        expected = [FrequencyExtractionProcess().run(sound_sample) for sound_sample in sound_samples]
+        np.testing.assert_allclose(FrequencyExtractionProcess().run_batch(sound_samples), expected)
+        self.assertAlmostEqual(expected[0], 440, delta=5)
+
+    def test_gate_hears_short_samples_as_in_run(self):
+        rng = np.random.default_rng(4)
+        sound_samples = [get_tone_sample(440, rng, length) for length in (1000, 2500, 700, 2500)]
+        sound_samples[1] = SoundSample(SAMPLE_RATE, 0.5, rng.normal(scale=0.01, size=2500))
+        extractor = FrequencyExtractionProcess(gate=SignalGate())
+        expected = [extractor.run(sound_sample) for sound_sample in sound_samples]
+        batched = FrequencyExtractionProcess(gate=SignalGate()).run_batch(sound_samples)
+        np.testing.assert_allclose(batched, expected)
+
+    def test_run_batch_rejects_mixed_sample_rates(self):
+        rng = np.random.default_rng(2)
+        sound_samples = [get_tone_sample(440, rng), SoundSample(8000, 0.5, rng.normal(size=4000))]
+        with self.assertRaises(ValueError):
+            FrequencyExtractionProcess().run_batch(sound_samples)
@@ -0,0 +1,38 @@
+from unittest import TestCase
+import numpy as np
+from processes.frequency_extraction_process import FrequencyExtractionProcess
+from sound_sample import SoundSample
+
+SAMPLE_RATE = 5000
+A_FREQUENCY = 440
+
+
+def get_A_samples(start, length):
+    rng = np.random.default_rng(0)
+    time_space = np.arange(start, start + length) / SAMPLE_RATE
+    return 10 * np.sin(A_FREQUENCY * 2 * np.pi * time_space) + rng.normal(scale=0.1, size=length)
+
+
+class TestSTFT(TestCase):
+    def test_one_frequency_per_hop_across_samples(self):
+        extractor = FrequencyExtractionProcess(hop_size=256)
+        first = extractor.run(SoundSample(SAMPLE_RATE, 0.5, get_A_samples(0, 2500)))
+        second = extractor.run(SoundSample(SAMPLE_RATE, 0.5, get_A_samples(2500, 2500)))
+        self.assertEqual(len(first), 2)
+        self.assertEqual(len(first) + len(second), (5000 - 2048) // 256 + 1)
+        for frequency in first + second:
+            self.assertAlmostEqual(frequency, A_FREQUENCY, delta=2)
+
+    def test_hop_larger_than_frame_skips_samples(self):
+        extractor = FrequencyExtractionProcess(hop_size=3000)
+        self.assertEqual(len(extractor.run(SoundSample(SAMPLE_RATE, 0.5, get_A_samples(0, 2500)))), 1)
+        self.assertEqual(len(extractor.run(SoundSample(SAMPLE_RATE, 0.5, get_A_samples(2500, 2500)))), 0)
+        self.assertEqual(len(extractor.run(SoundSample(SAMPLE_RATE, 0.5, get_A_samples(5000, 2500)))), 1)
+
+    def test_hop_longer_than_the_samples_keeps_the_hops_aligned(self):
+        extractor = FrequencyExtractionProcess(hop_size=3000)
+        frame_count = 0
+        for start in range(0, 15000, 300):
+            frame_count += len(extractor.run(SoundSample(SAMPLE_RATE, 0.06, get_A_samples(start, 300))))
+            end = start + 300
+            self.assertEqual(frame_count, max(0, (end - 2048) // 3000 + 1), "after {} samples".format(end))
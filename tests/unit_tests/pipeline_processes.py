@@ -0,0 +1,41 @@
+"""
+Processes shared by the tests of pipeline stages.
+"""
+import threading
+
+from abstracts_interfaces.process import Process
+
+
+class CounterProcess(Process):
+    """
+    Produces the integers from 0 to item_count, then None.
+    """
+    def __init__(self, item_count):
+        self.next_item = 0
+        self.item_count = item_count
+
+    def run(self, item=None):
+        if self.next_item == self.item_count:
+            return None
+        self.next_item += 1
+        return self.next_item - 1
+
+
+class DoubleProcess(Process):
+    def run(self, item=None):
+        return item * 2
+
+
+class CollectorProcess(Process):
+    """
+    Collects the items it consumes, and sets done once it has item_count of them.
+    """
+    def __init__(self, item_count):
+        self.items = []
+        self.item_count = item_count
+        self.done = threading.Event()
+
+    def run(self, item=None):
+        self.items.append(item)
+        if len(self.items) == self.item_count:
+            self.done.set()
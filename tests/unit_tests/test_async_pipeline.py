@@ -0,0 +1,123 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from abstracts_interfaces.abstract_consumer import OVERFLOW_DROP_OLDEST
+from abstracts_interfaces.process import Process
+from concrete_asyncio.async_consumer import AsyncConsumer
+from concrete_asyncio.async_consumer_producer import AsyncConsumerProducer
+from concrete_asyncio.async_producer import AsyncProducer
+from concrete_threading.threaded_consumer import ThreadedConsumer
+from concrete_threading.threaded_producer import ThreadedProducer
+from tests.unit_tests.pipeline_processes import CounterProcess, DoubleProcess, CollectorProcess
+
+ITEM_COUNT = 20
+PIPELINE_COUNT = 100
+
+
+async def wait_for(event, timeout=5):
+    await asyncio.get_running_loop().run_in_executor(None, event.wait, timeout)
+
+
+async def get_tasks():
+    return asyncio.all_tasks() - {asyncio.current_task()}
+
+
+class TestAsyncPipeline(TestCase):
+    def test_pipelines_share_one_thread(self):
+        async def run_pipelines():
+            collectors = [CollectorProcess(ITEM_COUNT) for _ in range(PIPELINE_COUNT)]
+            threads_before = threading.active_count()
+            for collector in collectors:
+                sink = AsyncConsumer(4, collector)
+                doubler = AsyncConsumerProducer(4, sink, DoubleProcess())
+                AsyncProducer(doubler, CounterProcess(ITEM_COUNT)).start()
+            self.assertEqual(threads_before, threading.active_count())
+            for collector in collectors:
+                await wait_for(collector.done)
+            return collectors
+
+        for collector in asyncio.run(run_pipelines()):
+            self.assertEqual([item * 2 for item in range(ITEM_COUNT)], collector.items)
+
+    def test_process_is_offloaded_to_executor(self):
+        class ThreadNameProcess(Process):
+            def run(self, item=None):
+                return threading.current_thread().name
+
+        async def run_pipeline(executor):
+            collector = CollectorProcess(ITEM_COUNT)
+            sink = AsyncConsumer(4, collector)
+            stage = AsyncConsumerProducer(4, sink, ThreadNameProcess(), executor)
+            AsyncProducer(stage, CounterProcess(ITEM_COUNT)).start()
+            await wait_for(collector.done)
+            return collector.items
+
+        with ThreadPoolExecutor(thread_name_prefix="offload") as executor:
+            thread_names = asyncio.run(run_pipeline(executor))
+        self.assertTrue(all(name.startswith("offload") for name in thread_names))
+
+    def test_batches(self):
+        class BatchSizeProcess(Process):
+            def run_batch(self, items):
+                return [len(items)] * len(items)
+
+        async def run_pipeline():
+            collector = CollectorProcess(ITEM_COUNT)
+            batcher = AsyncConsumerProducer(ITEM_COUNT, AsyncConsumer(ITEM_COUNT, collector), BatchSizeProcess())
+            batcher.set_batching(5, 50)
+            AsyncProducer(batcher, CounterProcess(ITEM_COUNT)).start()
+            await wait_for(collector.done)
+            return collector.items
+
+        self.assertEqual([5] * ITEM_COUNT, asyncio.run(run_pipeline()))
+
+    def test_drop_oldest(self):
+        async def give_all():
+            consumer = AsyncConsumer(2, DoubleProcess())
+            consumer.set_overflow_policy(OVERFLOW_DROP_OLDEST)
+            for item in range(5):
+                await consumer.give_async(item)
+            return consumer
+
+        consumer = asyncio.run(give_all())
+        self.assertEqual(3, consumer.get_dropped_count())
+        self.assertEqual([3, 4], [consumer._buffer.get_nowait()[1] for _ in range(2)])
+
+    def test_threads_and_coroutines_compose(self):
+        collector = CollectorProcess(ITEM_COUNT)
+        loop = asyncio.new_event_loop()
+        loop_thread = threading.Thread(target=loop.run_forever, daemon=True)
+        loop_thread.start()
+        try:
+            # threaded producer -> async stage -> threaded consumer
+            doubler = AsyncConsumerProducer(4, ThreadedConsumer(4, collector), DoubleProcess(), loop=loop)
+            ThreadedProducer(doubler, CounterProcess(ITEM_COUNT)).start()
+            self.assertTrue(collector.done.wait(5))
+            doubler.stop()
+            self.assertEqual(set(), asyncio.run_coroutine_threadsafe(get_tasks(), loop).result(5))
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            loop_thread.join()
+            loop.close()
+        self.assertEqual([item * 2 for item in range(ITEM_COUNT)], collector.items)
+
+    def test_shared_stage_starts_once(self):
+        async def run_pipeline():
+            collector = CollectorProcess(2 * ITEM_COUNT)
+            sink = AsyncConsumer(4, collector)
+            doubler = AsyncConsumerProducer(4, sink, DoubleProcess())
+            producers = [AsyncProducer(doubler, CounterProcess(ITEM_COUNT)) for _ in range(2)]
+            for producer in producers:
+                producer.start()
+            # a task per producer, one for the doubler and one for the sink
+            self.assertEqual(4, len(await get_tasks()))
+            await wait_for(collector.done)
+            await doubler.stop()
+            await sink.stop()
+            self.assertEqual(set(), await get_tasks())
+            return collector.items
+
+        items = asyncio.run(run_pipeline())
+        self.assertEqual(sorted(item * 2 for item in list(range(ITEM_COUNT)) * 2), sorted(items))
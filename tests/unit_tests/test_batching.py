@@ -0,0 +1,55 @@
+import threading
+from unittest import TestCase
+
+from abstracts_interfaces.process import Process
+from concrete_threading.threaded_consumer import ThreadedConsumer
+from concrete_threading.threaded_consumer_producer import ThreadedConsumerProducer
+from tests.unit_tests.pipeline_processes import CollectorProcess
+
+ITEM_COUNT = 10
+
+
+class BatchRecorderProcess(Process):
+    def __init__(self):
+        self.batch_sizes = []
+
+    def run(self, item=None):
+        return item * 2
+
+    def run_batch(self, items):
+        self.batch_sizes.append(len(items))
+        return super().run_batch(items)
+
+
+class TestBatching(TestCase):
+    def test_queued_items_are_drained_in_batches(self):
+        collector = CollectorProcess(ITEM_COUNT)
+        sink = ThreadedConsumer(ITEM_COUNT, collector)
+        process = BatchRecorderProcess()
+        stage = ThreadedConsumerProducer(ITEM_COUNT, sink, process)
+        stage.set_batching(4)
+        for item in range(ITEM_COUNT):
+            stage.give(item)
+        stage.start()
+        self.assertTrue(collector.done.wait(5))
+        stage.stop()
+        sink.stop()
+        self.assertEqual(process.batch_sizes, [4, 4, 2])
+        self.assertEqual(collector.items, [item * 2 for item in range(ITEM_COUNT)])
+
+    def test_batch_waits_for_more_items(self):
+        process = BatchRecorderProcess()
+        consumer = ThreadedConsumer(ITEM_COUNT, process)
+        consumer.set_batching(ITEM_COUNT, batch_wait_ms=2000)
+        consumer.give(0)
+        timer = threading.Timer(0.05, lambda: [consumer.give(item) for item in range(1, ITEM_COUNT)])
+        timer.start()
+        self.assertEqual(len(consumer._take_batch()), ITEM_COUNT)
+        timer.join()
+
+    def test_cannot_change_batching_while_running(self):
+        consumer = ThreadedConsumer(ITEM_COUNT, Process())
+        consumer.start()
+        with self.assertRaises(RuntimeError):
+            consumer.set_batching(4)
+        consumer.stop()
@@ -0,0 +1,28 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from benchmarks.results import make_result, save_results, load_results, compare_results
+
+
+class TestBenchmarkResults(TestCase):
+    def test_save_and_load(self):
+        results = {"stage": {"run": make_result(1.5, "us")}}
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "results.json")
+            save_results(results, path)
+            self.assertEqual(results, load_results(path))
+
+    def test_compare_flags_regressions_in_both_directions(self):
+        baseline = {"stage": {"run": make_result(100, "us"),
+                              "throughput": make_result(100, "frames/s", higher_is_better=True)}}
+        results = {"stage": {"run": make_result(120, "us"),
+                             "throughput": make_result(80, "frames/s", higher_is_better=True)}}
+        regressions = compare_results(results, baseline, tolerance=0.1)
+        self.assertEqual([("stage", "run"), ("stage", "throughput")], [r[:2] for r in regressions])
+
+    def test_compare_ignores_improvements_and_missing_metrics(self):
+        baseline = {"stage": {"run": make_result(100, "us")}}
+        results = {"stage": {"run": make_result(50, "us"), "new": make_result(1, "us")},
+                   "new_stage": {"run": make_result(1, "us")}}
+        self.assertEqual([], compare_results(results, baseline))
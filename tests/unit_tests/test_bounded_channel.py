@@ -0,0 +1,42 @@
+import queue
+import threading
+from unittest import TestCase
+
+from bounded_channel import BoundedChannel
+
+
+class TestBoundedChannel(TestCase):
+    def test_fifo_order(self):
+        channel = BoundedChannel(4)
+        channel.put_many([1, 2, 3])
+        channel.put(4)
+        self.assertEqual(channel.get(), 1)
+        self.assertEqual(channel.get_many(10), [2, 3, 4])
+
+    def test_try_put_on_full_channel(self):
+        channel = BoundedChannel(1)
+        self.assertTrue(channel.try_put(1))
+        self.assertFalse(channel.try_put(2))
+        self.assertEqual(len(channel), 1)
+
+    def test_timeouts(self):
+        channel = BoundedChannel(1)
+        with self.assertRaises(queue.Empty):
+            channel.get(timeout=0.01)
+        channel.put(1)
+        with self.assertRaises(queue.Full):
+            channel.put(2, timeout=0.01)
+
+    def test_put_many_waits_for_space(self):
+        channel = BoundedChannel(3)
+        received = []
+
+        def get_all():
+            while len(received) < 10:
+                received.extend(channel.get_many(2))
+
+        getter = threading.Thread(target=get_all)
+        getter.start()
+        channel.put_many(range(10))
+        getter.join(5)
+        self.assertEqual(received, list(range(10)))
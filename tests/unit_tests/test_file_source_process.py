@@ -0,0 +1,83 @@
+import os
+import tempfile
+import wave
+from unittest import TestCase
+
+import numpy as np
+
+from concrete_threading.threaded_consumer import ThreadedConsumer
+from concrete_threading.threaded_producer import ThreadedProducer
+from processes.file_source_process import FileSourceProcess
+from processes.frequency_extraction_process import FrequencyExtractionProcess
+from tests.unit_tests.pipeline_processes import CollectorProcess
+
+SAMPLE_RATE = 5000
+
+
+def write_wav(path, frames):
+    frames = np.asarray(frames, dtype='<i2')
+    with wave.open(path, 'wb') as file:
+        file.setnchannels(1 if frames.ndim == 1 else frames.shape[1])
+        file.setsampwidth(2)
+        file.setframerate(SAMPLE_RATE)
+        file.writeframes(frames.tobytes())
+
+
+class TestFileSourceProcess(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.tone = (2 ** 14 * np.sin(2 * np.pi * 440 * np.arange(SAMPLE_RATE * 2) / SAMPLE_RATE)).astype('<i2')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def get_path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def test_wav_samples_are_views_of_the_file(self):
+        path = self.get_path("tone.wav")
+        write_wav(path, self.tone)
+        source = FileSourceProcess(path, 0.5)
+        self.assertEqual(4, source.get_sample_count())
+        sound_samples = [source.run() for _ in range(4)]
+        self.assertIsNone(source.run())
+        self.assertEqual(SAMPLE_RATE, sound_samples[0].get_sample_rate())
+        self.assertIsInstance(sound_samples[0].get_samples().base, np.memmap)
+        np.testing.assert_array_equal(self.tone, np.concatenate([s.get_samples() for s in sound_samples]))
+        self.assertAlmostEqual(440, FrequencyExtractionProcess().run(sound_samples[1]), delta=1)
+
+    def test_channel_is_selected(self):
+        path = self.get_path("stereo.wav")
+        write_wav(path, np.stack([np.zeros_like(self.tone), self.tone], axis=1))
+        samples = FileSourceProcess(path, 0.5, channel=1).run().get_samples()
+        np.testing.assert_array_equal(self.tone[:SAMPLE_RATE // 2], samples)
+
+    def test_raw_file_loops(self):
+        path = self.get_path("tone.raw")
+        self.tone.tofile(path)
+        source = FileSourceProcess(path, 1, loop=True, sample_rate=SAMPLE_RATE, dtype='<i2')
+        sequence_numbers = [source.run().get_sequence_number() for _ in range(5)]
+        self.assertEqual([0, 1, 2, 3, 4], sequence_numbers)
+
+    def test_raw_file_needs_a_format(self):
+        path = self.get_path("tone.raw")
+        self.tone.tofile(path)
+        with self.assertRaises(ValueError):
+            FileSourceProcess(path)
+
+    def test_producer_stops_at_end_of_file(self):
+        path = self.get_path("tone.wav")
+        write_wav(path, self.tone)
+        collector = CollectorProcess(4)
+        consumer = ThreadedConsumer(10, collector)
+        producer = ThreadedProducer(consumer, FileSourceProcess(path, 0.5))
+        producer.start()
+        try:
+            self.assertTrue(collector.done.wait(1))
+            producer_thread = producer._ThreadedProducer__thread
+            producer_thread.join(1)
+            self.assertFalse(producer_thread.is_alive())
+            self.assertFalse(producer._running)
+            self.assertEqual(4, len(collector.items))
+        finally:
+            consumer.stop()
@@ -0,0 +1,61 @@
+import time
+from unittest import TestCase
+
+import numpy as np
+
+from abstracts_interfaces.process import Process
+from processes.latency_reporter_process import LatencyReporterProcess, DISPLAY_STAGE
+from processes.tracing_process import TracingProcess
+from sound_sample import SoundSample
+from traced_result import TracedResult
+from tests.unit_tests.pipeline_processes import DoubleProcess
+
+
+class LengthProcess(Process):
+    def run(self, item=None):
+        return len(item.get_samples())
+
+
+class DisplayProcess(Process):
+    def __init__(self):
+        self.items = []
+
+    def run(self, item=None):
+        self.items.append(item)
+
+
+class TestLatencyTracing(TestCase):
+    def test_tracing_carries_the_capture(self):
+        sound_sample = SoundSample(10, 1, np.zeros(10), capture_time=time.monotonic() - 1, sequence_number=7)
+        first = TracingProcess(LengthProcess(), "length").run(sound_sample)
+        second = TracingProcess(DoubleProcess(), "double").run(first)
+        self.assertEqual(20, second.get_value())
+        self.assertEqual(7, second.get_sequence_number())
+        self.assertEqual(sound_sample.get_capture_time(), second.get_capture_time())
+        self.assertEqual(["length", "double"], [name for name, _ in second.get_stage_times()])
+        latencies = second.get_stage_latencies()
+        self.assertLessEqual(1, latencies[0][1])
+        self.assertLessEqual(0, latencies[1][1])
+
+    def test_run_batch_traces_each_item(self):
+        traced = [TracedResult(i, 0.0, i) for i in range(3)]
+        results = TracingProcess(DoubleProcess(), "double").run_batch(traced)
+        self.assertEqual([0, 2, 4], [result.get_value() for result in results])
+        self.assertEqual([0, 1, 2], [result.get_sequence_number() for result in results])
+
+    def test_tracing_rejects_untraceable_items(self):
+        with self.assertRaises(TypeError):
+            TracingProcess(DoubleProcess()).run(3)
+
+    def test_reporter_summarizes_latencies(self):
+        display = DisplayProcess()
+        reporter = LatencyReporterProcess(display)
+        now = time.monotonic()
+        for i in range(10):
+            reporter.run(TracedResult(i, now - 0.5, i).derive(i, "stage", now - 0.1))
+        summary = reporter.get_latency_summary()
+        self.assertEqual(list(range(10)), display.items)
+        self.assertEqual(10, summary["count"])
+        self.assertLessEqual(0.5, summary["total"][50])
+        self.assertAlmostEqual(0.4, summary["stages"]["stage"][99], places=6)
+        self.assertIn(DISPLAY_STAGE, summary["stages"])
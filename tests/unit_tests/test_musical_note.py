@@ -0,0 +1,42 @@
+import copy
+import pickle
+from unittest import TestCase
+
+import numpy as np
+
+from musical_note import MusicalNote, NOTE_DTYPE, NO_NOTE, to_note_array, from_note_array, make_note_array
+from processes.note_identifier import get_notes
+
+
+class TestMusicalNote(TestCase):
+    def test_is_compact_and_immutable(self):
+        musical_note = MusicalNote(3, 5, 0.1)
+        self.assertFalse(hasattr(musical_note, "__dict__"))
+        with self.assertRaises(AttributeError):
+            musical_note._note = 4
+        with self.assertRaises(AttributeError):
+            musical_note.extra = 1
+
+    def test_equal_notes_share_their_hash(self):
+        musical_note = MusicalNote(3, 5, 0.1)
+        close_note = MusicalNote(3, 5, 0.1005)
+        self.assertEqual(musical_note, close_note)
+        self.assertEqual(hash(musical_note), hash(close_note))
+        self.assertEqual(1, len({musical_note, close_note}))
+        self.assertNotEqual(musical_note, MusicalNote(3, 4, 0.1))
+
+    def test_copies(self):
+        musical_note = MusicalNote(3, 5, 0.1)
+        self.assertEqual(musical_note, pickle.loads(pickle.dumps(musical_note)))
+        self.assertEqual(musical_note, copy.deepcopy(musical_note))
+
+    def test_note_array_round_trip(self):
+        musical_notes = [MusicalNote(3, 5, 0.1), None, MusicalNote(11, -1, -0.4)]
+        note_array = to_note_array(musical_notes)
+        self.assertEqual(NOTE_DTYPE, note_array.dtype)
+        self.assertEqual(NO_NOTE, note_array[1]["note"])
+        self.assertEqual(musical_notes, from_note_array(note_array))
+
+    def test_make_note_array_from_get_notes(self):
+        note_array = make_note_array(*get_notes(np.array([523.25, -1]), 440))
+        self.assertEqual([MusicalNote(3, 5, 0), None], from_note_array(note_array))
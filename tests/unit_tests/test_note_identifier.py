@@ -1,7 +1,10 @@
 from unittest import TestCase
 
+import numpy as np
+
 from musical_note import MusicalNote
-from processes.note_identifier import get_note, get_semitone_diff
+from processes.note_identifier import get_note, get_notes, get_semitone_diff, NoteIdentifierProcess, NO_NOTE, \
+    NoteTable, get_note_table
 
 
 class TestNoteIdentifier(TestCase):
@@ -52,3 +55,70 @@ class TestNoteIdentifier(TestCase):
         freq = 442.54889
         got = get_note(freq, 440)
         self.assertTrue(expected == got)
+
+    def test_get_notes_matches_get_note(self):
+        rng = np.random.default_rng(0)
+        freqs = np.concatenate((np.exp(rng.uniform(np.log(10), np.log(8000), 10000)),
+                                440 * 2 ** (np.arange(-48, 48) / 12), 440 * 2 ** ((np.arange(-48, 48) + 0.5) / 12)))
+        semitones, octaves, deltas = get_notes(freqs, 440)
+        for freq, semitone, octave, delta in zip(freqs.tolist(), semitones.tolist(), octaves.tolist(), deltas.tolist()):
+            # deltas are equal within DELTA_EQ_TOLERANCE
+            self.assertEqual(get_note(freq, 440), MusicalNote(semitone, octave, delta))
+
+    def test_get_notes_masks_missing_pitches(self):
+        semitones, octaves, deltas = get_notes(np.array([-1, 0, 523.25]), 440)
+        self.assertEqual([NO_NOTE, NO_NOTE, 3], semitones.tolist())
+        self.assertEqual([NO_NOTE, NO_NOTE, 5], octaves.tolist())
+        self.assertTrue(np.isnan(deltas[:2]).all())
+
+    def test_get_note_agrees_with_get_notes_without_pitch(self):
+        for freq in (-1, 0):
+            self.assertIsNone(get_note(freq, 440))
+
+    def test_run_batch_matches_run(self):
+        identifier = NoteIdentifierProcess()
+        freqs = [-1, 415.30, 520.2374, 442.54889]
+        self.assertEqual([identifier.run(freq) for freq in freqs], identifier.run_batch(freqs))
+
+    def test_run_batch_of_multi_channel_items_matches_run(self):
+        identifier = NoteIdentifierProcess()
+        items = [np.array([440., 220.]), np.array([330., 20000.]), [-1, 261.63, 5.]]
+        batched = identifier.run_batch(items)
+        self.assertEqual([identifier.run(item) for item in items], batched)
+        self.assertEqual([(0, 4), (0, 3)], [(note.get_note(), note.get_octave()) for note in batched[0]])
+
+    def test_note_table_matches_get_note(self):
+        note_table = NoteTable(440)
+        boundaries = 440 * 2 ** ((np.arange(-57, 50) + 0.5) / 12)
+        freqs = np.concatenate((np.exp(np.random.default_rng(0).uniform(np.log(17), np.log(7900), 10000)),
+                                boundaries, np.nextafter(boundaries, 0), np.nextafter(boundaries, np.inf)))
+        expected = get_notes(freqs, 440)
+        got = note_table.get_notes(freqs)
+        np.testing.assert_array_equal(expected[0], got[0])
+        np.testing.assert_array_equal(expected[1], got[1])
+        np.testing.assert_allclose(expected[2], got[2], atol=1e-12)
+        for freq in freqs[::50].tolist():
+            self.assertEqual(get_note(freq, 440), note_table.get_note(freq))
+
+    def test_note_table_outside_its_range(self):
+        note_table = NoteTable(440)
+        for freq in (2.0, 8.1758, 12543.85, 30000.0):
+            self.assertEqual(get_note(freq, 440), note_table.get_note(freq))
+        self.assertIsNone(note_table.get_note(-1))
+
+    def test_note_table_temperament(self):
+        # a just major third above A, about 14 cents flat of equal temperament
+        just_third = 1200 * np.log2(5 / 4) - 400
+        note_table = NoteTable(440, (0, 0, 0, 0, just_third, 0, 0, 0, 0, 0, 0, 0))
+        musical_note = note_table.get_note(440 * 5 / 4)
+        self.assertEqual(MusicalNote(4, 5, 0), musical_note)
+        with self.assertRaises(ValueError):
+            NoteTable(440, (60,) + (0,) * 11)
+
+    def test_set_A4_frequency_uses_cached_tables(self):
+        identifier = NoteIdentifierProcess()
+        identifier.set_A4_frequency(442)
+        self.assertEqual(get_note(442, 442), identifier.run(442))
+        hits = get_note_table.cache_info().hits
+        identifier.set_A4_frequency(440)
+        self.assertEqual(hits + 1, get_note_table.cache_info().hits)
@@ -0,0 +1,48 @@
+import time
+from unittest import TestCase
+
+from abstracts_interfaces import abstract_consumer
+from abstracts_interfaces.process import Process
+from concrete_threading.threaded_consumer import ThreadedConsumer
+
+
+def give_all(policy, items, buffer_size=2):
+    consumer = ThreadedConsumer(buffer_size, Process())
+    consumer.set_overflow_policy(policy)
+    for item in items:
+        consumer.give(item)
+    return consumer
+
+
+def take_all(consumer, count):
+    return [consumer._take() for _ in range(count)]
+
+
+class TestOverflowPolicy(TestCase):
+    def test_drop_newest(self):
+        consumer = give_all(abstract_consumer.OVERFLOW_DROP_NEWEST, range(5))
+        self.assertEqual(take_all(consumer, 2), [0, 1])
+        self.assertEqual(consumer.get_dropped_count(), 3)
+
+    def test_drop_oldest(self):
+        consumer = give_all(abstract_consumer.OVERFLOW_DROP_OLDEST, range(5))
+        self.assertEqual(take_all(consumer, 2), [3, 4])
+        self.assertEqual(consumer.get_dropped_count(), 3)
+
+    def test_keep_latest(self):
+        consumer = give_all(abstract_consumer.OVERFLOW_KEEP_LATEST, range(5), buffer_size=4)
+        self.assertEqual(take_all(consumer, 1), [4])
+        self.assertEqual(consumer.get_dropped_count(), 4)
+
+    def test_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            ThreadedConsumer(2, Process()).set_overflow_policy("spill")
+
+    def test_expired_items_are_skipped(self):
+        consumer = ThreadedConsumer(4, Process())
+        consumer.set_max_age(10)
+        consumer.give("stale")
+        time.sleep(0.05)
+        consumer.give("fresh")
+        self.assertEqual(consumer._take(), "fresh")
+        self.assertEqual(consumer.get_expired_count(), 1)
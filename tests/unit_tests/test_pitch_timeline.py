@@ -0,0 +1,59 @@
+import os
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+
+from pitch_timeline import get_pitch_timeline, PITCH_TIMELINE_DTYPE
+
+SAMPLE_RATE = 5000
+HOP_SIZE = 500
+
+
+def get_recording():
+    time_space = np.arange(SAMPLE_RATE * 4) / SAMPLE_RATE
+    recording = np.where(time_space < 2, np.sin(2 * np.pi * 440 * time_space),
+                         np.sin(2 * np.pi * 261.63 * time_space)) * 2 ** 20
+    recording[:SAMPLE_RATE // 2] = 0
+    return recording.astype('int32')
+
+
+def assert_timelines_equal(expected, actual):
+    for field in PITCH_TIMELINE_DTYPE.names:
+        np.testing.assert_array_equal(expected[field], actual[field])
+
+
+class TestPitchTimeline(TestCase):
+    def test_timeline_follows_the_recording(self):
+        timeline = get_pitch_timeline(get_recording(), SAMPLE_RATE, hop_size=HOP_SIZE, workers=1)
+        self.assertEqual(PITCH_TIMELINE_DTYPE, timeline.dtype)
+        self.assertEqual((SAMPLE_RATE * 4 - 2048) // HOP_SIZE + 1, len(timeline))
+        np.testing.assert_allclose(np.arange(len(timeline)) * HOP_SIZE / SAMPLE_RATE, timeline["time"])
+        silent = timeline[0]
+        self.assertEqual((-1, -1, -1), (silent["frequency"], silent["note"], silent["octave"]))
+        self.assertTrue(np.isnan(silent["cents"]))
+        a4 = timeline[timeline["time"] == 1][0]
+        self.assertEqual((0, 4), (a4["note"], a4["octave"]))
+        self.assertAlmostEqual(440, a4["frequency"], delta=1)
+        c4 = timeline[-1]
+        self.assertEqual((3, 4), (c4["note"], c4["octave"]))
+
+    def test_timeline_does_not_depend_on_chunking(self):
+        recording = get_recording()
+        whole = get_pitch_timeline(recording, SAMPLE_RATE, hop_size=HOP_SIZE, workers=1)
+        chunked = get_pitch_timeline(recording, SAMPLE_RATE, hop_size=HOP_SIZE, workers=1, chunk_hops=7)
+        parallel = get_pitch_timeline(recording, SAMPLE_RATE, hop_size=HOP_SIZE, workers=2, chunk_hops=7)
+        assert_timelines_equal(whole, chunked)
+        assert_timelines_equal(whole, parallel)
+
+    def test_file_matches_array(self):
+        recording = get_recording()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "recording.raw")
+            recording.tofile(path)
+            from_file = get_pitch_timeline(path, SAMPLE_RATE, hop_size=HOP_SIZE, workers=2, chunk_hops=7,
+                                           file_kwargs={"dtype": recording.dtype})
+        assert_timelines_equal(get_pitch_timeline(recording, SAMPLE_RATE, hop_size=HOP_SIZE, workers=1), from_file)
+
+    def test_short_recording_has_no_hops(self):
+        self.assertEqual(0, len(get_pitch_timeline(np.zeros(100), SAMPLE_RATE, workers=1)))
@@ -0,0 +1,91 @@
+import os
+from unittest import TestCase
+
+from abstracts_interfaces.process import Process
+from concrete_multiprocessing.process_consumer_producer import ProcessConsumerProducer
+from concrete_threading.threaded_consumer import ThreadedConsumer
+from tests.unit_tests.pipeline_processes import CollectorProcess
+
+ITEM_COUNT = 50
+
+
+class SquareProcess(Process):
+    def run(self, item=None):
+        return item * item, os.getpid()
+
+
+class FailingProcess(Process):
+    def run(self, item=None):
+        if item % 20 == 7:
+            raise ValueError(f"Cannot process {item}")
+        return item
+
+
+class BatchSizeProcess(Process):
+    def run(self, item=None):
+        return item, 1
+
+    def run_batch(self, items):
+        return [(item, len(items)) for item in items]
+
+
+class StatefulProcess(Process):
+    def run(self, item=None):
+        return item
+
+    def is_concurrent(self):
+        return False
+
+
+class TestProcessConsumerProducer(TestCase):
+    def test_results_are_delivered_in_order_from_workers(self):
+        collector = CollectorProcess(ITEM_COUNT)
+        sink = ThreadedConsumer(10, collector)
+        stage = ProcessConsumerProducer(10, sink, SquareProcess(), workers=2)
+        stage.start()
+        for item in range(ITEM_COUNT):
+            stage.give(item)
+        self.assertTrue(collector.done.wait(30))
+        stage.stop()
+        sink.stop()
+        self.assertEqual([square for square, _ in collector.items], [item * item for item in range(ITEM_COUNT)])
+        self.assertNotIn(os.getpid(), {pid for _, pid in collector.items})
+
+    def test_failed_items_are_skipped_and_stop_ends_both_threads(self):
+        expected_items = [item for item in range(ITEM_COUNT) if item % 20 != 7]
+        collector = CollectorProcess(len(expected_items))
+        sink = ThreadedConsumer(10, collector)
+        stage = ProcessConsumerProducer(10, sink, FailingProcess(), workers=2)
+        stage.start()
+        with self.assertLogs("concrete_multiprocessing.process_consumer", "ERROR"):
+            for item in range(ITEM_COUNT):
+                stage.give(item)
+            self.assertTrue(collector.done.wait(30))
+        self.assertEqual(ITEM_COUNT - len(expected_items), stage.get_failed_count())
+        self.assertEqual(expected_items, collector.items)
+        stage.stop()
+        sink.stop()
+        stage._dispatcher.join(5)
+        stage._collector.join(5)
+        self.assertFalse(stage._dispatcher.is_alive())
+        self.assertFalse(stage._collector.is_alive())
+
+    def test_batches_are_run_with_run_batch_in_workers(self):
+        collector = CollectorProcess(ITEM_COUNT)
+        sink = ThreadedConsumer(10, collector)
+        stage = ProcessConsumerProducer(ITEM_COUNT, sink, BatchSizeProcess(), workers=2)
+        stage.set_batching(8, 100)
+        for item in range(ITEM_COUNT):
+            stage.give(item)
+        stage.start()
+        self.assertTrue(collector.done.wait(30))
+        stage.stop()
+        sink.stop()
+        self.assertEqual(list(range(ITEM_COUNT)), [item for item, _ in collector.items])
+        self.assertEqual(8, max(batch_size for _, batch_size in collector.items))
+
+    def test_process_that_is_not_concurrent_defaults_to_one_worker(self):
+        sink = ThreadedConsumer(10, CollectorProcess(1))
+        self.assertEqual(1, ProcessConsumerProducer(10, sink, StatefulProcess())._workers)
+        with self.assertRaises(ValueError):
+            ProcessConsumerProducer(10, sink, StatefulProcess(), workers=2)
@@ -0,0 +1,85 @@
+import threading
+import time
+from unittest import TestCase
+
+import numpy as np
+
+from processes.recorder_process import RecorderProcess
+
+BLOCK_SIZE = 100
+
+
+class FakeInputStream:
+    """
+    Mimics sounddevice.InputStream by feeding consecutive integers to the callback in blocks.
+
+    Channel c carries the integers multiplied by c + 1.
+    """
+
+    def __init__(self, samplerate, channels, dtype, callback):
+        self.callback = callback
+        self.channels = channels
+        self.dtype = dtype
+        self.running = False
+        self.next_sample = 0
+        self.thread = threading.Thread(target=self.feed, daemon=True)
+
+    def start(self):
+        self.running = True
+        self.thread.start()
+
+    def stop(self):
+        self.running = False
+        self.thread.join()
+
+    def close(self):
+        pass
+
+    def feed(self):
+        while self.running and self.next_sample < 100 * BLOCK_SIZE:
+            block = np.arange(self.next_sample, self.next_sample + BLOCK_SIZE, dtype=self.dtype)
+            self.callback(block[:, None] * np.arange(1, self.channels + 1, dtype=self.dtype), BLOCK_SIZE, None, None)
+            self.next_sample += BLOCK_SIZE
+
+
+class TestRecorderProcess(TestCase):
+    def test_streamed_samples_have_no_gaps(self):
+        recorder = RecorderProcess(500, 0.25, streaming=True, stream_factory=FakeInputStream, buffered_samples=100)
+        first = recorder.run()
+        second = recorder.run()
+        recorder.close_stream()
+        self.assertEqual(first.get_sample_rate(), 1000)
+        np.testing.assert_array_equal(np.concatenate([first.get_samples(), second.get_samples()]),
+                                      np.arange(0, 500))
+        self.assertEqual(recorder.get_overrun_count(), 0)
+
+    def test_lagging_sample_keeps_its_capture_time(self):
+        recorder = RecorderProcess(500, 0.25, streaming=True, stream_factory=FakeInputStream, buffered_samples=100)
+        opened_at = time.monotonic()
+        recorder.open_stream()
+        # the fake stream delivers its blocks at once: by now, the samples wait in the ring buffer
+        time.sleep(0.05)
+        read_at = time.monotonic()
+        first = recorder.run()
+        second = recorder.run()
+        recorder.close_stream()
+        self.assertLessEqual(opened_at, first.get_capture_time())
+        self.assertLess(second.get_capture_time(), read_at)
+        self.assertLessEqual(first.get_capture_time(), second.get_capture_time())
+
+    def test_streamed_channels_share_one_capture(self):
+        recorder = RecorderProcess(500, 0.25, streaming=True, stream_factory=FakeInputStream, buffered_samples=100,
+                                   channels=3)
+        sample = recorder.run()
+        recorder.close_stream()
+        self.assertEqual(sample.get_channel_count(), 3)
+        np.testing.assert_array_equal(sample.get_samples(), np.arange(0, 250)[:, None] * np.arange(1, 4))
+
+    def test_split_channels_are_views(self):
+        recorder = RecorderProcess(500, 0.25, streaming=True, stream_factory=FakeInputStream, buffered_samples=100,
+                                   channels=2, split_channels=True)
+        left, right = recorder.run()
+        recorder.close_stream()
+        np.testing.assert_array_equal(right.get_samples(), 2 * left.get_samples())
+        self.assertIs(left.get_samples().base, right.get_samples().base)
+        self.assertEqual(left.get_sequence_number(), right.get_sequence_number())
@@ -0,0 +1,55 @@
+import threading
+from unittest import TestCase
+
+import numpy as np
+
+from ring_buffer import RingBuffer
+
+
+class TestRingBuffer(TestCase):
+    def test_read_across_wrap_around(self):
+        ring_buffer = RingBuffer(8)
+        ring_buffer.write(np.arange(0, 6))
+        np.testing.assert_array_equal(ring_buffer.read(4), np.arange(0, 4))
+        ring_buffer.write(np.arange(6, 12))
+        np.testing.assert_array_equal(ring_buffer.read(8), np.arange(4, 12))
+        self.assertEqual(ring_buffer.get_overrun_count(), 0)
+
+    def test_overrun_skips_to_oldest_available(self):
+        ring_buffer = RingBuffer(8)
+        ring_buffer.write(np.arange(0, 12))
+        np.testing.assert_array_equal(ring_buffer.read(4), np.arange(4, 8))
+        self.assertEqual(ring_buffer.get_overrun_count(), 4)
+
+    def test_read_times_out(self):
+        ring_buffer = RingBuffer(8)
+        ring_buffer.write(np.arange(0, 2))
+        self.assertIsNone(ring_buffer.read(4, timeout=0.05))
+
+    def test_read_waits_for_writer(self):
+        ring_buffer = RingBuffer(64)
+        writer = threading.Thread(target=lambda: [ring_buffer.write(np.arange(i, i + 4)) for i in range(0, 32, 4)])
+        writer.start()
+        samples = ring_buffer.read(32, timeout=5)
+        writer.join()
+        np.testing.assert_array_equal(samples, np.arange(0, 32))
+
+    def test_multi_channel_read_across_wrap_around(self):
+        ring_buffer = RingBuffer(8, channels=2)
+        frames = np.stack([np.arange(0, 12), -np.arange(0, 12)], axis=1)
+        ring_buffer.write(frames[:6])
+        np.testing.assert_array_equal(ring_buffer.read(4), frames[:4])
+        ring_buffer.write(frames[6:])
+        np.testing.assert_array_equal(ring_buffer.read(8), frames[4:])
+
+    def test_read_capture_time_is_that_of_the_block_holding_the_last_sample(self):
+        ring_buffer = RingBuffer(16)
+        ring_buffer.write(np.arange(0, 4), 1.0)
+        ring_buffer.write(np.arange(4, 8), 2.0)
+        ring_buffer.write(np.arange(8, 12), 3.0)
+        ring_buffer.read(5)
+        self.assertEqual(ring_buffer.get_read_capture_time(), 2.0)
+        ring_buffer.read(3)
+        self.assertEqual(ring_buffer.get_read_capture_time(), 2.0)
+        ring_buffer.read(1)
+        self.assertEqual(ring_buffer.get_read_capture_time(), 3.0)
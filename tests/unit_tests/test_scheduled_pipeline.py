@@ -0,0 +1,86 @@
+import threading
+import time
+from unittest import TestCase
+
+from abstracts_interfaces.process import Process
+from concrete_scheduled.scheduled_consumer import ScheduledConsumer
+from concrete_scheduled.scheduled_consumer_producer import ScheduledConsumerProducer
+from concrete_scheduled.scheduled_producer import ScheduledProducer
+from concrete_scheduled.stage_scheduler import StageScheduler
+from concrete_threading.threaded_consumer import ThreadedConsumer
+from tests.unit_tests.pipeline_processes import CounterProcess, DoubleProcess, CollectorProcess
+
+ITEM_COUNT = 50
+PIPELINE_COUNT = 50
+
+
+class ConcurrencyProcess(Process):
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+
+    def run(self, item=None):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(0.002)
+        with self.lock:
+            self.running -= 1
+        return item
+
+
+class TestScheduledPipeline(TestCase):
+    def setUp(self):
+        self.scheduler = None
+
+    def tearDown(self):
+        if self.scheduler is not None:
+            self.scheduler.stop()
+
+    def start_scheduler(self, workers):
+        self.scheduler = StageScheduler(workers)
+        self.scheduler.start()
+        return self.scheduler
+
+    def test_pipelines_share_the_workers(self):
+        scheduler = self.start_scheduler(2)
+        threads_before = threading.active_count()
+        collectors = [CollectorProcess(ITEM_COUNT) for _ in range(PIPELINE_COUNT)]
+        for collector in collectors:
+            sink = ScheduledConsumer(4, collector, scheduler)
+            doubler = ScheduledConsumerProducer(4, sink, DoubleProcess(), scheduler)
+            ScheduledProducer(doubler, CounterProcess(ITEM_COUNT), scheduler).start()
+        self.assertEqual(threads_before, threading.active_count())
+        for collector in collectors:
+            self.assertTrue(collector.done.wait(5))
+            self.assertEqual([item * 2 for item in range(ITEM_COUNT)], collector.items)
+
+    def test_full_buffers_do_not_block_a_single_worker(self):
+        scheduler = self.start_scheduler(1)
+        collector = CollectorProcess(ITEM_COUNT)
+        sink = ScheduledConsumer(1, collector, scheduler)
+        first = ScheduledConsumerProducer(1, sink, DoubleProcess(), scheduler)
+        second = ScheduledConsumerProducer(1, first, DoubleProcess(), scheduler)
+        ScheduledProducer(second, CounterProcess(ITEM_COUNT), scheduler).start()
+        self.assertTrue(collector.done.wait(5))
+        self.assertEqual([item * 4 for item in range(ITEM_COUNT)], collector.items)
+
+    def test_concurrency_is_capped_and_order_kept(self):
+        scheduler = self.start_scheduler(4)
+        process = ConcurrencyProcess()
+        collector = CollectorProcess(ITEM_COUNT)
+        stage = ScheduledConsumerProducer(ITEM_COUNT, ScheduledConsumer(ITEM_COUNT, collector, scheduler), process,
+                                          scheduler, concurrency=2)
+        ScheduledProducer(stage, CounterProcess(ITEM_COUNT), scheduler).start()
+        self.assertTrue(collector.done.wait(5))
+        self.assertEqual(list(range(ITEM_COUNT)), collector.items)
+        self.assertEqual(2, process.max_running)
+
+    def test_feeds_threaded_consumers(self):
+        scheduler = self.start_scheduler(1)
+        collector = CollectorProcess(ITEM_COUNT)
+        stage = ScheduledConsumerProducer(2, ThreadedConsumer(1, collector), DoubleProcess(), scheduler)
+        ScheduledProducer(stage, CounterProcess(ITEM_COUNT), scheduler).start()
+        self.assertTrue(collector.done.wait(5))
+        self.assertEqual([item * 2 for item in range(ITEM_COUNT)], collector.items)
@@ -0,0 +1,102 @@
+from unittest import TestCase
+
+import numpy as np
+
+from abstracts_interfaces.process import Process
+from concrete_multiprocessing.process_consumer_producer import ProcessConsumerProducer
+from concrete_multiprocessing import shared_sample_pool
+from concrete_multiprocessing.shared_sample_pool import SharedSamplePool, open_sound_sample, \
+    close_attached_memories
+from concrete_threading.threaded_consumer import ThreadedConsumer
+from processes.frequency_extraction_process import FrequencyExtractionProcess
+from sound_sample import SoundSample
+from tests.unit_tests.pipeline_processes import CollectorProcess
+
+SAMPLE_RATE = 5000
+SAMPLE_COUNT = 12
+
+
+def get_tone_sample(frequency):
+    time_space = np.arange(SAMPLE_RATE // 2) / SAMPLE_RATE
+    return SoundSample(SAMPLE_RATE, 0.5, (2 ** 20 * np.sin(frequency * 2 * np.pi * time_space)).astype('int32'))
+
+
+class OddSequenceFailingProcess(Process):
+    def run(self, sound_sample=None):
+        if sound_sample.get_sequence_number() % 2 == 1:
+            raise ValueError("odd sequence number")
+        return sound_sample.get_sequence_number()
+
+
+class TestSharedSamplePool(TestCase):
+    def test_opened_sample_is_a_view_of_the_slot(self):
+        pool = SharedSamplePool(1, SAMPLE_RATE)
+        try:
+            first = get_tone_sample(440)
+            handle = pool.put(first)
+            opened = open_sound_sample(handle)
+            np.testing.assert_array_equal(opened.get_samples(), first.get_samples())
+            self.assertEqual(opened.get_sample_rate(), SAMPLE_RATE)
+            pool.release(handle)
+            second = get_tone_sample(220)
+            pool.release(pool.put(second))
+            np.testing.assert_array_equal(opened.get_samples(), second.get_samples())
+        finally:
+            pool.close()
+
+    def test_multi_channel_samples_keep_their_shape(self):
+        pool = SharedSamplePool(2, SAMPLE_RATE, channels=2)
+        try:
+            channels = np.stack([get_tone_sample(440).get_samples(), get_tone_sample(220).get_samples()], axis=1)
+            # the second slot, so that the offset of slots accounts for the channels
+            pool.put(SoundSample(SAMPLE_RATE, 0.5, np.zeros_like(channels)))
+            handle = pool.put(SoundSample(SAMPLE_RATE, 0.5, channels))
+            np.testing.assert_array_equal(open_sound_sample(handle).get_samples(), channels)
+            with self.assertRaises(ValueError):
+                pool.put(get_tone_sample(440))
+        finally:
+            close_attached_memories()
+            pool.close()
+
+    def test_close_attached_memories_detaches_unused_pools(self):
+        pool = SharedSamplePool(1, SAMPLE_RATE)
+        try:
+            handle = pool.put(get_tone_sample(440))
+            open_sound_sample(handle)
+            self.assertIn(handle.memory_name, shared_sample_pool._attached_memories)
+            close_attached_memories()
+            self.assertNotIn(handle.memory_name, shared_sample_pool._attached_memories)
+        finally:
+            pool.close()
+
+    def test_extraction_through_shared_memory(self):
+        pool = SharedSamplePool(3, SAMPLE_RATE)
+        collector = CollectorProcess(SAMPLE_COUNT)
+        sink = ThreadedConsumer(SAMPLE_COUNT, collector)
+        stage = ProcessConsumerProducer(SAMPLE_COUNT, sink, FrequencyExtractionProcess(), workers=2, sample_pool=pool)
+        stage.start()
+        frequencies = [220 + 20 * index for index in range(SAMPLE_COUNT)]
+        for frequency in frequencies:
+            stage.give(get_tone_sample(frequency))
+        self.assertTrue(collector.done.wait(30))
+        stage.stop()
+        sink.stop()
+        pool.close()
+        np.testing.assert_allclose(collector.items, frequencies, atol=2)
+
+    def test_failed_items_release_their_slot(self):
+        pool = SharedSamplePool(2, SAMPLE_RATE)
+        collector = CollectorProcess(SAMPLE_COUNT // 2)
+        sink = ThreadedConsumer(SAMPLE_COUNT, collector)
+        stage = ProcessConsumerProducer(SAMPLE_COUNT, sink, OddSequenceFailingProcess(), workers=2, sample_pool=pool)
+        stage.start()
+        with self.assertLogs("concrete_multiprocessing.process_consumer", "ERROR"):
+            for sequence_number in range(SAMPLE_COUNT):
+                stage.give(SoundSample(SAMPLE_RATE, 0.5, np.zeros(SAMPLE_RATE // 2, dtype='int32'),
+                                       sequence_number=sequence_number))
+            # with 2 slots, extraction stalls unless the failed items release theirs
+            self.assertTrue(collector.done.wait(30))
+        stage.stop()
+        sink.stop()
+        pool.close()
+        self.assertEqual(list(range(0, SAMPLE_COUNT, 2)), collector.items)
@@ -0,0 +1,55 @@
+import pickle
+from unittest import TestCase
+import numpy as np
+from processes.signal_gate import SignalGate, get_rms
+
+NOISE_RMS = 1
+NOTE_RMS = 100
+FRAME_DURATION = 0.1
+
+
+class TestSignalGate(TestCase):
+    def test_get_rms_of_rows(self):
+        frames = np.array([[3, -3, 3, -3], [0, 0, 0, 0]], dtype='int32')
+        np.testing.assert_allclose(get_rms(frames), [3, 0])
+        self.assertAlmostEqual(get_rms(frames[0]), 3)
+
+    def test_opens_on_sound_over_the_noise_floor(self):
+        gate = SignalGate()
+        opened = gate.update_many([NOISE_RMS] * 5 + [NOTE_RMS] * 5 + [NOISE_RMS] * 5, FRAME_DURATION)
+        np.testing.assert_array_equal(opened, [False] * 5 + [True] * 5 + [False] * 5)
+        self.assertAlmostEqual(gate.get_noise_floor(), NOISE_RMS)
+        self.assertEqual(gate.get_gated_count(), 10)
+
+    def test_digital_silence_never_opens(self):
+        gate = SignalGate()
+        self.assertFalse(gate.update(0, FRAME_DURATION))
+        self.assertIsNone(gate.get_noise_floor())
+
+    def test_noise_floor_follows_louder_noise_slowly(self):
+        gate = SignalGate(floor_rise_db=20)
+        gate.update(NOISE_RMS, FRAME_DURATION)
+        # 1s of noise 20dB louder lifts the floor by at most 20dB
+        gate.update_many([10 * NOISE_RMS] * 10, FRAME_DURATION)
+        self.assertAlmostEqual(gate.get_noise_floor(), 10 * NOISE_RMS)
+        self.assertFalse(gate.update(10 * NOISE_RMS, FRAME_DURATION))
+
+    def test_onset_opens_under_an_elevated_floor(self):
+        gate = SignalGate(open_db=40, onset_db=6)
+        gate.update(NOISE_RMS, FRAME_DURATION)
+        self.assertTrue(gate.update(4 * NOISE_RMS, FRAME_DURATION))
+        self.assertFalse(gate.update(4 * NOISE_RMS, FRAME_DURATION))
+        self.assertEqual(gate.get_onset_count(), 1)
+
+    def test_reset_forgets_the_noise_floor(self):
+        gate = SignalGate()
+        gate.update(NOISE_RMS, FRAME_DURATION)
+        gate.reset()
+        self.assertIsNone(gate.get_noise_floor())
+
+    def test_pickles_with_its_state(self):
+        gate = SignalGate()
+        gate.update(NOISE_RMS, FRAME_DURATION)
+        copy = pickle.loads(pickle.dumps(gate))
+        self.assertEqual(copy.get_noise_floor(), NOISE_RMS)
+        self.assertTrue(copy.update(NOTE_RMS, FRAME_DURATION))
@@ -0,0 +1,58 @@
+import time
+from unittest import TestCase
+
+from abstracts_interfaces.process import Process
+from concrete_threading.threaded_consumer import ThreadedConsumer
+from concrete_threading.threaded_consumer_producer import ThreadedConsumerProducer
+from stage_metrics import DurationHistogram, MetricsReporter
+from tests.unit_tests.pipeline_processes import CollectorProcess
+
+ITEM_COUNT = 20
+
+
+class SlowProcess(Process):
+    def run(self, item=None):
+        time.sleep(0.002)
+        return item
+
+
+class TestStageMetrics(TestCase):
+    def test_histogram_percentiles(self):
+        histogram = DurationHistogram()
+        for _ in range(99):
+            histogram.record(0.000003)
+        histogram.record(0.5)
+        snapshot = histogram.snapshot()
+        self.assertEqual(snapshot["count"], 100)
+        self.assertEqual(snapshot["p50"], 4e-6)
+        self.assertEqual(snapshot["max"], 0.5)
+        self.assertEqual(histogram.get_percentile(100), 0.5)
+
+    def test_pipeline_metrics(self):
+        collector = CollectorProcess(ITEM_COUNT)
+        sink = ThreadedConsumer(ITEM_COUNT, collector)
+        stage = ThreadedConsumerProducer(2, sink, SlowProcess())
+        self.assertIsNone(stage.get_metrics())
+        stage_metrics = stage.enable_metrics("slow")
+        sink_metrics = sink.enable_metrics()
+        reports = []
+        reporter = MetricsReporter([stage, sink], interval=0.01, report=reports.append)
+        reporter.start()
+        stage.start()
+        for item in range(ITEM_COUNT):
+            stage.give(item)
+        self.assertTrue(collector.done.wait(5))
+        reporter.stop()
+        stage.stop()
+        sink.stop()
+
+        snapshot = stage_metrics.snapshot()
+        self.assertEqual(snapshot["name"], "slow")
+        self.assertEqual(snapshot["items_in"], ITEM_COUNT)
+        self.assertEqual(snapshot["items_out"], ITEM_COUNT)
+        self.assertEqual(snapshot["run_durations"]["count"], ITEM_COUNT)
+        self.assertLessEqual(0.002, snapshot["run_durations"]["p50"])
+        self.assertLessEqual(snapshot["max_depth"], 2)
+        self.assertEqual(sink_metrics.snapshot()["name"], "CollectorProcess")
+        self.assertLess(0, sink_metrics.snapshot()["starved_time"])
+        self.assertLess(0, len(reports))
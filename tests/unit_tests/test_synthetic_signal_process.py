@@ -0,0 +1,35 @@
+import time
+from unittest import TestCase
+
+import numpy as np
+
+from processes.frequency_extraction_process import FrequencyExtractionProcess
+from processes.synthetic_signal_process import SyntheticSignalProcess
+
+
+class TestSyntheticSignalProcess(TestCase):
+    def test_chords_are_cycled(self):
+        source = SyntheticSignalProcess(((220,), (330,)), harmonics=3, snr_db=20)
+        extractor = FrequencyExtractionProcess()
+        frequencies = [extractor.run(source.run()) for _ in range(4)]
+        np.testing.assert_allclose([220, 330, 220, 330], frequencies, atol=1)
+
+    def test_samples_are_numbered(self):
+        source = SyntheticSignalProcess(sample_rate=1000, sample_duration=0.1)
+        sound_samples = [source.run() for _ in range(3)]
+        self.assertEqual([0, 1, 2], [sound_sample.get_sequence_number() for sound_sample in sound_samples])
+        self.assertEqual(100, len(sound_samples[0].get_samples()))
+        self.assertEqual(np.int32, sound_samples[0].get_samples().dtype)
+
+    def test_noise_matches_snr(self):
+        clean = SyntheticSignalProcess().run().get_samples().astype(float)
+        noisy = SyntheticSignalProcess(snr_db=10).run().get_samples().astype(float)
+        snr = 10 * np.log10(np.mean(clean ** 2) / np.mean((noisy - clean) ** 2))
+        self.assertAlmostEqual(10, snr, delta=0.5)
+
+    def test_production_is_paced(self):
+        source = SyntheticSignalProcess(sample_duration=0.1, realtime_factor=2)
+        start = time.monotonic()
+        for _ in range(3):
+            source.run()
+        self.assertLessEqual(0.15, time.monotonic() - start)
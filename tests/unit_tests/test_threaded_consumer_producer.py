@@ -0,0 +1,72 @@
+import random
+import threading
+import time
+from unittest import TestCase
+
+import numpy as np
+
+from abstracts_interfaces.process import Process
+from concrete_threading.threaded_consumer import ThreadedConsumer
+from concrete_threading.threaded_consumer_producer import ThreadedConsumerProducer
+from processes.frequency_extraction_process import FrequencyExtractionProcess
+from processes.signal_gate import SignalGate
+from sound_sample import SoundSample
+from tests.unit_tests.pipeline_processes import CollectorProcess
+
+ITEM_COUNT = 40
+
+
+class RandomDelayProcess(Process):
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def run(self, item=None):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(random.uniform(0, 0.01))
+        with self.lock:
+            self.active -= 1
+        return item
+
+
+def run_stage(process, workers, ordered, items):
+    collector = CollectorProcess(ITEM_COUNT)
+    sink = ThreadedConsumer(ITEM_COUNT, collector)
+    stage = ThreadedConsumerProducer(ITEM_COUNT, sink, process, workers=workers, ordered=ordered)
+    stage.start()
+    for item in items:
+        stage.give(item)
+    collector.done.wait(30)
+    stage.stop()
+    sink.stop()
+    return collector.items
+
+
+class TestThreadedConsumerProducer(TestCase):
+    def test_ordered_workers_keep_input_order(self):
+        process = RandomDelayProcess()
+        self.assertEqual(run_stage(process, 4, True, range(ITEM_COUNT)), list(range(ITEM_COUNT)))
+        self.assertLess(1, process.max_active)
+
+    def test_unordered_workers_deliver_every_item(self):
+        self.assertEqual(sorted(run_stage(RandomDelayProcess(), 4, False, range(ITEM_COUNT))), list(range(ITEM_COUNT)))
+
+    def test_workers_share_a_frequency_extractor(self):
+        sample_rate = 5000
+        time_space = np.arange(sample_rate // 2) / sample_rate
+        frequencies = [200 + 10 * index for index in range(ITEM_COUNT)]
+        sound_samples = [SoundSample(sample_rate, 0.5, np.sin(frequency * 2 * np.pi * time_space))
+                         for frequency in frequencies]
+        results = run_stage(FrequencyExtractionProcess(), 4, True, sound_samples)
+        np.testing.assert_allclose(results, frequencies, atol=2)
+
+    def test_stateful_extractor_rejects_several_workers(self):
+        consumer = ThreadedConsumer(4, Process())
+        for extractor in (FrequencyExtractionProcess(hop_size=512), FrequencyExtractionProcess(gate=SignalGate())):
+            self.assertFalse(extractor.is_concurrent())
+            with self.assertRaises(ValueError):
+                ThreadedConsumerProducer(4, consumer, extractor, workers=2)
+            ThreadedConsumerProducer(4, consumer, extractor, workers=1)
@@ -0,0 +1,115 @@
+from unittest import TestCase
+
+import numpy as np
+
+from abstracts_interfaces.process import Process
+from musical_note import MusicalNote
+from processes.frequency_extraction_process import FrequencyExtractionProcess
+from processes.signal_gate import SignalGate
+from processes.recorder_process import RecorderProcess
+from processes.stream_processes import StreamFrame, CrossStreamExtractionProcess, get_channel_sources
+from processes.synthetic_signal_process import SyntheticSignalProcess
+from sound_sample import SoundSample
+from tests.unit_tests.test_recorder_process import FakeInputStream
+from tuning_service import TuningService
+from tests.unit_tests.pipeline_processes import CollectorProcess
+
+FRAME_COUNT = 10
+
+
+class LimitedSourceProcess(Process):
+    def __init__(self, source, frame_count=FRAME_COUNT):
+        self.source = source
+        self.remaining = frame_count
+
+    def run(self, item=None):
+        if self.remaining == 0:
+            return None
+        self.remaining -= 1
+        return self.source.run()
+
+
+class BatchSizeExtractor(FrequencyExtractionProcess):
+    def __init__(self):
+        super().__init__()
+        self.batch_sizes = []
+
+    def run_batch(self, sound_samples):
+        self.batch_sizes.append(len(sound_samples))
+        return super().run_batch(sound_samples)
+
+
+class TestTuningService(TestCase):
+    def test_cross_stream_batch_is_extracted_at_once(self):
+        extractor = BatchSizeExtractor()
+        frames = [StreamFrame(stream, SyntheticSignalProcess(((frequency,),)).run())
+                  for stream, frequency in enumerate((220, 440, 330))]
+        frames.append(StreamFrame(3, SyntheticSignalProcess(((440,),), sample_rate=8000).run()))
+        results = CrossStreamExtractionProcess(extractor).run_batch(frames)
+        self.assertEqual([0, 1, 2, 3], [result.stream for result in results])
+        for expected, result in zip((220, 440, 330, 440), results):
+            self.assertAlmostEqual(expected, result.value, delta=1)
+        self.assertEqual([3, 1], extractor.batch_sizes)
+
+    def test_silent_streams_are_gated_out_of_the_batch(self):
+        extractor = BatchSizeExtractor()
+        frames = [StreamFrame(0, SoundSample(5000, 0.5, np.zeros(2500, dtype='int32'))),
+                  StreamFrame(1, SyntheticSignalProcess(((440,),)).run())]
+        results = CrossStreamExtractionProcess(extractor, [SignalGate(), None]).run_batch(frames)
+        self.assertEqual(-1, results[0].value)
+        self.assertAlmostEqual(440, results[1].value, delta=1)
+        self.assertEqual([1], extractor.batch_sizes)
+
+    def test_gate_hears_only_the_analysed_frame(self):
+        noise = np.random.default_rng(0).normal(scale=10, size=5000).astype('int32')
+        late_note = noise.copy()
+        late_note[4000:] += SyntheticSignalProcess(((440,),), sample_duration=0.2).run().get_samples()
+        extractor = CrossStreamExtractionProcess(FrequencyExtractionProcess(), [SignalGate()])
+        extractor.run(StreamFrame(0, SoundSample(5000, 1, noise)))
+        self.assertEqual(-1, extractor.run(StreamFrame(0, SoundSample(5000, 1, late_note))).value)
+
+    def test_extractor_preconditions(self):
+        with self.assertRaises(ValueError):
+            CrossStreamExtractionProcess(FrequencyExtractionProcess(hop_size=512))
+        with self.assertRaises(ValueError):
+            CrossStreamExtractionProcess(FrequencyExtractionProcess(gate=SignalGate()))
+
+    def test_channel_sources_share_each_capture(self):
+        recorder = RecorderProcess(2500, 0.5, streaming=True, stream_factory=FakeInputStream, channels=2)
+        left, right = get_channel_sources(recorder, 2)
+        left_samples = [left.run() for _ in range(2)]
+        right_samples = [right.run() for _ in range(2)]
+        recorder.close_stream()
+        for left_sample, right_sample in zip(left_samples, right_samples):
+            np.testing.assert_array_equal(2 * left_sample.get_samples(), right_sample.get_samples())
+            self.assertIs(left_sample.get_samples().base, right_sample.get_samples().base)
+            self.assertEqual(left_sample.get_sequence_number(), right_sample.get_sequence_number())
+
+    def test_channels_of_one_capture_are_tuned_as_streams(self):
+        # the fake stream feeds 10000 samples per channel: 4 captures of 2500 samples
+        recorder = RecorderProcess(2500, 0.5, streaming=True, stream_factory=FakeInputStream, channels=2)
+        sinks = [CollectorProcess(4) for _ in range(2)]
+        service = TuningService(get_channel_sources(recorder, 2), sinks)
+        service.start()
+        for sink in sinks:
+            self.assertTrue(sink.done.wait(5))
+        service.stop()
+        recorder.close_stream()
+        self.assertEqual(0, service.get_dropped_count())
+
+    def test_notes_are_routed_to_their_stream(self):
+        # A4, C5 and A4 tuned to 442Hz
+        frequencies = (440, 523.25, 442)
+        # paced, since the service drops the frames it cannot keep up with
+        sources = [LimitedSourceProcess(SyntheticSignalProcess(((frequency,),), realtime_factor=20))
+                   for frequency in frequencies]
+        sinks = [CollectorProcess(FRAME_COUNT) for _ in frequencies]
+        service = TuningService(sources, sinks, A4_frequencies=[440, 440, 442])
+        service.start()
+        for sink in sinks:
+            self.assertTrue(sink.done.wait(5))
+        service.stop()
+        expected_notes = (MusicalNote(0, 4, 0), MusicalNote(3, 5, 0), MusicalNote(0, 4, 0))
+        for expected, sink in zip(expected_notes, sinks):
+            self.assertEqual([expected.get_note()] * FRAME_COUNT, [note.get_note() for note in sink.items])
+            self.assertEqual([expected.get_octave()] * FRAME_COUNT, [note.get_octave() for note in sink.items])
@@ -0,0 +1,65 @@
+import time
+
+
+class TracedResult:
+    """
+    Models the result of a stage of the pipeline, traced back to the SoundSample it derives from.
+
+    Carries the capture time and sequence number of the SoundSample, and the time at which
+    each stage that handled it finished. All times are given by time.monotonic().
+    """
+
+    def __init__(self, value, capture_time, sequence_number, stage_times=()):
+        """
+        Construct an instance of TracedResult.
+
+        :param value: The result
+        :param capture_time: The capture time of the SoundSample the result derives from
+        :param sequence_number: The sequence number of the SoundSample the result derives from
+        :param stage_times: A sequence of tuples: (stage name, time the stage finished), in order
+        """
+        self.__value = value
+        self.__capture_time = capture_time
+        self.__sequence_number = sequence_number
+        self.__stage_times = tuple(stage_times)
+
+    def get_value(self):
+        return self.__value
+
+    def get_capture_time(self):
+        return self.__capture_time
+
+    def get_sequence_number(self):
+        return self.__sequence_number
+
+    def get_stage_times(self):
+        return self.__stage_times
+
+    def derive(self, value, stage_name, finished_at=None):
+        """
+        Get the result of a further stage, with the same trace.
+
+        :param value: The result of the stage
+        :param stage_name: The name of the stage
+        :param finished_at: The time the stage finished. Defaults to now
+        :return: A TracedResult
+        """
+        finished_at = finished_at if finished_at is not None else time.monotonic()
+        return TracedResult(value, self.__capture_time, self.__sequence_number,
+                            self.__stage_times + ((stage_name, finished_at),))
+
+    def get_stage_latencies(self):
+        """
+        Get the time spent from the end of the previous stage, or the capture, to the end of each stage.
+
+        :return: A list of tuples: (stage name, seconds), in order
+        """
+        latencies = []
+        previous_time = self.__capture_time
+        for stage_name, finished_at in self.__stage_times:
+            latencies.append((stage_name, finished_at - previous_time))
+            previous_time = finished_at
+        return latencies
+
+    def __str__(self) -> str:
+        return f"#{self.__sequence_number}: {self.__value}"
@@ -0,0 +1,88 @@
+r"""
+A service tuning many instruments at once, each captured by its own source.
+
+    source 0 -> producer 0 \                                          / note identifier 0 -> sink 0
+    source 1 -> producer 1  -> cross-stream extractor -> router -----  note identifier 1 -> sink 1
+    ...                    /                                          \ ...
+
+Every source runs in its own producer, since capturing waits on the source. The frames of all the
+streams meet in a single extraction stage, which takes the frames available at each tick as one batch,
+and extracts their frequencies with one 2-D FFT. The router then identifies the notes of each stream
+with the note identifier of the stream, and hands them to the sink of the stream.
+
+The channels of a multi-channel source, e.g. a RecorderProcess capturing several channels in one device
+stream, are tuned as a stream each once split by get_channel_sources.
+
+If gated, each stream has its own SignalGate in the extraction stage, so that idle streams cost no FFT.
+"""
+from abstracts_interfaces.abstract_consumer import OVERFLOW_DROP_OLDEST
+from concrete_threading.threaded_consumer import ThreadedConsumer
+from concrete_threading.threaded_consumer_producer import ThreadedConsumerProducer
+from concrete_threading.threaded_producer import ThreadedProducer
+from processes.frequency_extraction_process import FrequencyExtractionProcess
+from processes.note_identifier import NoteIdentifierProcess, DEFAULT_A4_FREQ
+from processes.signal_gate import SignalGate
+from processes.stream_processes import StreamSourceProcess, CrossStreamExtractionProcess, StreamRouterProcess
+
+DEFAULT_TICK_MS = 10
+BUFFERED_FRAMES_PER_STREAM = 4
+
+
+class TuningService:
+    """
+    Models a service tuning many instruments at once.
+    """
+
+    def __init__(self, sources, sinks, A4_frequencies=None, tick_ms=DEFAULT_TICK_MS, gated=False,
+                 **extractor_kwargs) -> None:
+        """
+        Construct an instance of TuningService.
+
+        :param sources: A Process per stream that produces single channel SoundSamples, e.g. RecorderProcess or
+                        FileSourceProcess. Split multi-channel sources with get_channel_sources
+        :param sinks: A Process per stream, run with each MusicalNote of the stream, or None where there is no note
+        :param A4_frequencies: Optional. The frequency of A4 of each stream. Defaults to DEFAULT_A4_FREQ
+        :param tick_ms: The time the extraction stage waits to gather frames into a batch, in milliseconds
+        :param gated: Skip the extraction of the frames each stream's SignalGate takes for silence
+        :param extractor_kwargs: Keyword arguments of the shared FrequencyExtractionProcess
+        """
+        if len(sources) != len(sinks):
+            raise ValueError("There must be a sink per source")
+        stream_count = len(sources)
+        A4_frequencies = A4_frequencies if A4_frequencies is not None else [DEFAULT_A4_FREQ] * stream_count
+        buffer_size = stream_count * BUFFERED_FRAMES_PER_STREAM
+
+        note_identifiers = [NoteIdentifierProcess(A4_frequency) for A4_frequency in A4_frequencies]
+        self.__router = ThreadedConsumer(buffer_size, StreamRouterProcess(note_identifiers, sinks))
+        self.__router.set_batching(buffer_size)
+        gates = [SignalGate() for _ in range(stream_count)] if gated else None
+        extractor = CrossStreamExtractionProcess(FrequencyExtractionProcess(**extractor_kwargs), gates)
+        self.__extractor = ThreadedConsumerProducer(buffer_size, self.__router, extractor)
+        self.__extractor.set_batching(buffer_size, tick_ms)
+        # a stale pitch is useless to a tuner: never make a source wait for the extractor
+        self.__extractor.set_overflow_policy(OVERFLOW_DROP_OLDEST)
+        self.__producers = [ThreadedProducer(self.__extractor, StreamSourceProcess(source, stream))
+                            for stream, source in enumerate(sources)]
+
+    def start(self):
+        self.__extractor.start()
+        for producer in self.__producers:
+            producer.start()
+
+    def stop(self):
+        for producer in self.__producers:
+            producer.stop()
+        self.__extractor.stop()
+        self.__router.stop()
+
+    def get_dropped_count(self):
+        """
+        :return: The number of frames discarded because the extraction stage fell behind
+        """
+        return self.__extractor.get_dropped_count()
+
+    def get_stages(self):
+        """
+        :return: The Runnables of the service, e.g. to enable their metrics
+        """
+        return [*self.__producers, self.__extractor, self.__router]